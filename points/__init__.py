@@ -1,17 +1,54 @@
-# make these symbols importable from the package level
-from points.vector import Vector
-from points.cartesian import (
-    CartesianPoint,
-    Point,
-    IntPoint,
-    create_RoundedNPoint_class,
-)
-from points.polar import PolarPoint
-from points.iterators import (
-    no_consectutive_repeats_iter,
-    iter_linear_steps_between,
-    iter_natural_steps_between,
-)
-
-from points.path import Path
+# make these symbols importable from the package level. Each one is imported from its
+# module the first time it is used, so a program that only needs CartesianPoints never
+# pays for importing Paths, iterators or buffers. The modules import what they need
+# from here too, which imports their dependencies first, whatever order they are used.
+from importlib import import_module as _import_module
+from os import environ as _environ
 
+_PUBLIC_NAMES = {
+    "Vector": "points.vector",
+    "CartesianPoint": "points.cartesian",
+    "Point": "points.cartesian",
+    "IntPoint": "points.cartesian",
+    "create_RoundedNPoint_class": "points.cartesian",
+    "PolarPoint": "points.polar",
+    "no_consectutive_repeats_iter": "points.iterators",
+    "iter_linear_steps_between": "points.iterators",
+    "iter_linear_chunks_between": "points.iterators",
+    "iter_natural_steps_between": "points.iterators",
+    "iter_natural_cartesian_steps_between": "points.iterators",
+    "iter_adaptive_steps": "points.iterators",
+    "iter_adaptive_natural_steps_between": "points.iterators",
+    "Path": "points.path",
+    "LazyPath": "points.path",
+    "PointBuffer": "points.point_buffer",
+    "PointStreamWriter": "points.point_stream",
+    "PointStreamReader": "points.point_stream",
+    # still found here, but left out of __all__ so that a star import doesn't bring
+    # in instrumentation and everything it imports
+    "enable_from_environment": "points.instrumentation",
+}
+
+__all__ = [a_name for a_name in _PUBLIC_NAMES if a_name != "enable_from_environment"]
+
+
+def __getattr__(a_name):
+    try:
+        a_module_name = _PUBLIC_NAMES[a_name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {a_name!r}")
+    a_value = getattr(_import_module(a_module_name), a_name)
+    # from now on, it's found without calling __getattr__
+    globals()[a_name] = a_value
+    return a_value
+
+
+def __dir__():
+    return sorted({*globals(), *_PUBLIC_NAMES})
+
+
+# opt in to counting calls of the hot paths with POINTS_INSTRUMENTATION=1
+if _environ.get("POINTS_INSTRUMENTATION"):
+    from points.instrumentation import enable_from_environment
+
+    enable_from_environment()
@@ -0,0 +1,23 @@
+# Benchmarks for the points package.
+#
+# Each benchmark module offers BENCHMARKS, a mapping of benchmark names to setup
+# functions. A setup function takes a data size and returns a callable that does
+# `size` operations when called, so that timings can be reported per operation.
+from time import perf_counter
+
+
+def time_per_operation(a_setup_function, size, repeat=5):
+    # the best of several runs is the least disturbed by everything else going on
+    a_callable = a_setup_function(size)
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        a_callable()
+        timings.append(perf_counter() - start)
+    return min(timings) / size
+
+
+def report(benchmarks, size, repeat=5):
+    for a_name, a_setup_function in benchmarks.items():
+        nanoseconds = time_per_operation(a_setup_function, size, repeat) * 1e9
+        print(f"{a_name:>40}: {nanoseconds:10.1f} ns/op")
@@ -0,0 +1,160 @@
+# Run the benchmark suite:
+#
+#     python -m points.bench                          # everything, report as JSON
+#     python -m points.bench --output baseline.json   # save results for later
+#     python -m points.bench --baseline baseline.json --threshold 0.1
+#
+# When a baseline is given, every benchmark that is more than threshold slower per
+# operation than its baseline is reported as a regression and the exit status is 1.
+import argparse
+import json
+import platform
+import sys
+from importlib import import_module
+
+from points.bench import time_per_operation
+
+BENCHMARK_MODULES = (
+    "construction",
+    "arithmetic",
+    "conversions",
+    "iterators",
+    "paths",
+    "blocks",
+    "startup",
+)
+
+
+def load_benchmarks(module_names=BENCHMARK_MODULES):
+    benchmarks = {}
+    for a_module_name in module_names:
+        a_module = import_module(f"points.bench.{a_module_name}")
+        for a_name, a_setup_function in a_module.BENCHMARKS.items():
+            benchmarks[f"{a_module_name}.{a_name}"] = a_setup_function
+    return benchmarks
+
+
+def run_benchmarks(benchmarks, sizes, repeat, a_filter=None, progress=None):
+    # results map a benchmark name to a mapping of data size to seconds per operation.
+    # A setup function with sizes of its own, like those of startup, uses those.
+    results = {}
+    for a_name, a_setup_function in benchmarks.items():
+        if a_filter and a_filter not in a_name:
+            continue
+        try:
+            results[a_name] = {
+                str(a_size): time_per_operation(a_setup_function, a_size, repeat)
+                for a_size in getattr(a_setup_function, "sizes", sizes)
+            }
+        except ImportError as x:
+            # benchmarks of optional features are skipped when the optional
+            # dependency is not installed
+            if progress:
+                progress(f"skipped {a_name}: {x}")
+            continue
+        if progress:
+            progress(
+                f"{a_name:>50}: "
+                + ", ".join(
+                    f"{a_size}={seconds * 1e9:.1f}ns"
+                    for a_size, seconds in results[a_name].items()
+                )
+            )
+    return results
+
+
+def compare_to_baseline(results, baseline_results, threshold):
+    # return a list of (name, size, baseline seconds, current seconds, ratio) for
+    # every benchmark that got slower by more than the threshold
+    regressions = []
+    for a_name, timings_by_size in results.items():
+        for a_size, seconds in timings_by_size.items():
+            try:
+                baseline_seconds = baseline_results[a_name][a_size]
+            except KeyError:
+                # new benchmarks have nothing to regress from
+                continue
+            ratio = seconds / baseline_seconds
+            if ratio > 1.0 + threshold:
+                regressions.append((a_name, a_size, baseline_seconds, seconds, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m points.bench", description="benchmark the points package"
+    )
+    parser.add_argument(
+        "--sizes",
+        default="100,1000,10000",
+        help="comma separated data sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="runs per benchmark, the best is kept (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--filter", default=None, help="only run benchmarks with this in their name"
+    )
+    parser.add_argument(
+        "--output", default=None, help="write the JSON results to this file"
+    )
+    parser.add_argument(
+        "--baseline", default=None, help="a JSON results file to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="allowed slowdown relative to the baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="no progress reports on stderr"
+    )
+    arguments = parser.parse_args(argv)
+
+    sizes = [int(a_size) for a_size in arguments.sizes.split(",") if a_size.strip()]
+    progress = (
+        None if arguments.quiet else lambda a_line: print(a_line, file=sys.stderr)
+    )
+    results = run_benchmarks(
+        load_benchmarks(), sizes, arguments.repeat, arguments.filter, progress
+    )
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "sizes": sizes,
+        "repeat": arguments.repeat,
+        "unit": "seconds per operation",
+        "results": results,
+    }
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline_file:
+            baseline_report = json.load(baseline_file)
+        regressions = compare_to_baseline(
+            results, baseline_report["results"], arguments.threshold
+        )
+        for a_name, a_size, baseline_seconds, seconds, ratio in regressions:
+            print(
+                f"REGRESSION {a_name} [{a_size}]: {baseline_seconds * 1e9:.1f}ns -> "
+                f"{seconds * 1e9:.1f}ns ({ratio:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
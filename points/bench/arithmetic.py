@@ -0,0 +1,55 @@
+# Each arithmetic operator for both point families, with point and scalar operands.
+from operator import add, sub, mul, truediv, floordiv, pow, neg
+
+from points import CartesianPoint, PolarPoint
+
+
+def _points(a_point_class, size):
+    return [a_point_class(i + 1.0, i * 0.001 + 0.5) for i in range(size)]
+
+
+def _make_dyadic_benchmark(a_point_class, a_dyadic_fn, the_other):
+    def a_setup_function(size):
+        points = _points(a_point_class, size)
+
+        def run():
+            for a_point in points:
+                a_dyadic_fn(a_point, the_other)
+
+        return run
+
+    return a_setup_function
+
+
+def _make_monadic_benchmark(a_point_class, a_monadic_fn):
+    def a_setup_function(size):
+        points = _points(a_point_class, size)
+
+        def run():
+            for a_point in points:
+                a_monadic_fn(a_point)
+
+        return run
+
+    return a_setup_function
+
+
+BENCHMARKS = {}
+for a_point_class, a_prefix in ((CartesianPoint, "cartesian"), (PolarPoint, "polar")):
+    for a_dyadic_fn in (add, sub, mul, truediv, floordiv, pow):
+        BENCHMARKS[f"{a_prefix}_{a_dyadic_fn.__name__}_point"] = _make_dyadic_benchmark(
+            a_point_class, a_dyadic_fn, CartesianPoint(1.5, 2.0)
+        )
+        BENCHMARKS[f"{a_prefix}_{a_dyadic_fn.__name__}_scalar"] = (
+            _make_dyadic_benchmark(a_point_class, a_dyadic_fn, 1.5)
+        )
+    BENCHMARKS[f"{a_prefix}_neg"] = _make_monadic_benchmark(a_point_class, neg)
+BENCHMARKS["polar_rotate"] = _make_monadic_benchmark(
+    PolarPoint, lambda a_polar_point: a_polar_point.rotate(0.1)
+)
+
+
+if __name__ == "__main__":
+    from points.bench import report
+
+    report(BENCHMARKS, 10000)
@@ -0,0 +1,248 @@
+# Block construction and clipping line segments to a viewport Block.
+from itertools import cycle, islice
+
+from points import CartesianPoint
+from points.path import Path
+from points.block import (
+    Block,
+    clip_path_to_viewport,
+    clip_segments_to_viewport,
+    ClipException,
+)
+from points.spatial import BlockGrid, QuadTree
+
+
+def bench_block_from_scalars(size):
+    corners = [(i, i + 1, i + 100, i + 50) for i in range(size)]
+
+    def run():
+        for a, b, c, d in corners:
+            Block(a, b, c, d)
+
+    return run
+
+
+def bench_block_from_points(size):
+    corners = [
+        (CartesianPoint(i + 100, i), CartesianPoint(i, i + 50)) for i in range(size)
+    ]
+
+    def run():
+        for a_point, another_point in corners:
+            Block(a_point, another_point)
+
+    return run
+
+
+# The clipping workloads, each a fan of segments from a center point out to a ring of
+# end points. Segments from the middle of the 100 x 100 viewport stay inside when the
+# ring is small and cross the edges when it is large. Segments from a center far off to
+# the side mostly stay outside, a few crossing back into the viewport.
+WORKLOADS = {
+    "inside": (50, 40),
+    "crossing": (50, 200),
+    "outside": (250, 200),
+}
+
+
+def _segments(size, workload):
+    center, spread = WORKLOADS[workload]
+    end_points = (
+        CartesianPoint(center + spread * dx, center + spread * dy)
+        for dx, dy in cycle(((1, 0.5), (-0.5, 1), (-1, -0.5), (0.5, -1), (1, 1)))
+    )
+    return [
+        Path(CartesianPoint(center - i % 7, center + i % 5), an_end_point)
+        for i, an_end_point in enumerate(islice(end_points, size))
+    ]
+
+
+def _make_clip_benchmark(workload, strategy):
+    def a_setup_function(size):
+        viewport = Block(0, 0, 100, 100)
+        segments = _segments(size, workload)
+
+        def run():
+            for a_segment in segments:
+                try:
+                    clip_path_to_viewport(viewport, a_segment, strategy)
+                except ClipException:
+                    pass
+
+        return run
+
+    return a_setup_function
+
+
+def _make_buffer_clip_benchmark(workload, strategy):
+    def a_setup_function(size):
+        import numpy as np
+
+        viewport = Block(0, 0, 100, 100)
+        segments = np.array(_segments(size, workload), dtype=float)
+
+        def run():
+            clip_segments_to_viewport(viewport, segments, strategy)
+
+        return run
+
+    return a_setup_function
+
+
+def _make_batch_clip_benchmark(workload):
+    def a_setup_function(size):
+        viewport = Block(0, 0, 100, 100)
+        segments = _segments(size, workload)
+
+        def run():
+            clip_segments_to_viewport(viewport, segments)
+
+        return run
+
+    return a_setup_function
+
+
+def _hit_zones_and_points(size):
+    # 2000 hit zones: a 50 x 40 map of tiles with a smaller zone inside every tenth
+    # tile, queried with points spread over the whole map. Timings are per point.
+    hit_zones = []
+    for i in range(50):
+        for j in range(40):
+            hit_zones.append(Block(i * 20, j * 20, i * 20 + 20, j * 20 + 20))
+            if not (i + j) % 10:
+                hit_zones.append(Block(i * 20 + 5, j * 20 + 5, i * 20 + 12, j * 20 + 9))
+    points = [CartesianPoint(i * 7.3 % 1000, i * 3.1 % 800) for i in range(size)]
+    return hit_zones, points
+
+
+def bench_hit_zones_scan(size):
+    hit_zones, points = _hit_zones_and_points(size)
+
+    def run():
+        for a_point in points:
+            [a_block for a_block in hit_zones if a_block.surrounds(a_point)]
+
+    return run
+
+
+def bench_hit_zones_grid(size):
+    hit_zones, points = _hit_zones_and_points(size)
+    a_grid = BlockGrid(hit_zones)
+
+    def run():
+        for a_point in points:
+            a_grid.query_point(a_point)
+
+    return run
+
+
+def bench_hit_zones_grid_batch(size):
+    hit_zones, points = _hit_zones_and_points(size)
+    a_grid = BlockGrid(hit_zones)
+
+    def run():
+        a_grid.query_points(points)
+
+    return run
+
+
+def _scatter(size):
+    # points scattered over an area a bit larger than the 100 x 100 viewport
+    return [CartesianPoint(i * 7.3 % 140 - 20, i * 3.1 % 140 - 20) for i in range(size)]
+
+
+def bench_cull_scatter_surrounds(size):
+    viewport = Block(0, 0, 100, 100)
+    points = _scatter(size)
+
+    def run():
+        [viewport.surrounds(a_point) for a_point in points]
+
+    return run
+
+
+def bench_cull_scatter_surrounds_many(size):
+    import numpy as np
+
+    viewport = Block(0, 0, 100, 100)
+    points = np.array(_scatter(size), dtype=float)
+
+    def run():
+        viewport.surrounds_many(points)
+
+    return run
+
+
+def bench_cull_scatter_outcodes(size):
+    import numpy as np
+
+    viewport = Block(0, 0, 100, 100)
+    points = np.array(_scatter(size), dtype=float)
+
+    def run():
+        viewport.outcodes(points)
+
+    return run
+
+
+def _panning_viewports():
+    # a 100 x 100 viewport panned across a 1000 x 1000 scatter
+    return [Block(i * 9, i * 9, i * 9 + 100, i * 9 + 100) for i in range(100)]
+
+
+def _wide_scatter(size):
+    return [CartesianPoint(i * 7.3 % 1000, i * 3.1 % 1000) for i in range(size)]
+
+
+def bench_pan_viewport_scan(size):
+    points = _wide_scatter(size)
+    viewports = _panning_viewports()
+
+    def run():
+        for a_viewport in viewports:
+            [a_point for a_point in points if a_viewport.surrounds(a_point)]
+
+    return run
+
+
+def bench_pan_viewport_quadtree(size):
+    a_tree = QuadTree.from_points(_wide_scatter(size))
+    viewports = _panning_viewports()
+
+    def run():
+        for a_viewport in viewports:
+            a_tree.query(a_viewport)
+
+    return run
+
+
+BENCHMARKS = {
+    "pan_viewport_scan": bench_pan_viewport_scan,
+    "pan_viewport_quadtree": bench_pan_viewport_quadtree,
+    "cull_scatter_surrounds": bench_cull_scatter_surrounds,
+    "cull_scatter_surrounds_many": bench_cull_scatter_surrounds_many,
+    "cull_scatter_outcodes": bench_cull_scatter_outcodes,
+    "hit_zones_scan": bench_hit_zones_scan,
+    "hit_zones_grid": bench_hit_zones_grid,
+    "hit_zones_grid_batch": bench_hit_zones_grid_batch,
+    "block_from_scalars": bench_block_from_scalars,
+    "block_from_points": bench_block_from_points,
+    "clip_batch_crossing": _make_batch_clip_benchmark("crossing"),
+}
+for a_workload in WORKLOADS:
+    for a_strategy, an_abbreviation in (
+        ("cohen-sutherland", "cs"),
+        ("liang-barsky", "lb"),
+    ):
+        BENCHMARKS[f"clip_{a_workload}_{an_abbreviation}"] = _make_clip_benchmark(
+            a_workload, a_strategy
+        )
+        BENCHMARKS[f"clip_buffer_{a_workload}_{an_abbreviation}"] = (
+            _make_buffer_clip_benchmark(a_workload, a_strategy)
+        )
+
+
+if __name__ == "__main__":
+    from points.bench import report
+
+    report(BENCHMARKS, 10000)
@@ -0,0 +1,97 @@
+# Construction of points and the arithmetic that constructs them. Compare
+# construct_2D (every member judged) with construct_2D_trusted (the path taken by
+# results of arithmetic and conversions) to see what judging costs per point.
+from points import CartesianPoint, PolarPoint, IntPoint
+
+
+def _coordinates(size):
+    return [(float(i), i + 0.5) for i in range(size)]
+
+
+def bench_construct_2D(size):
+    coordinates = _coordinates(size)
+
+    def run():
+        for x, y in coordinates:
+            CartesianPoint(x, y)
+
+    return run
+
+
+def bench_construct_2D_trusted(size):
+    coordinates = _coordinates(size)
+
+    def run():
+        for a_pair in coordinates:
+            CartesianPoint._from_trusted(a_pair)
+
+    return run
+
+
+def bench_construct_2D_identity(size):
+    points = [CartesianPoint(a_pair) for a_pair in _coordinates(size)]
+
+    def run():
+        for a_point in points:
+            CartesianPoint(a_point)
+
+    return run
+
+
+def bench_construct_2D_intpoint(size):
+    coordinates = _coordinates(size)
+
+    def run():
+        for x, y in coordinates:
+            IntPoint(x, y)
+
+    return run
+
+
+def bench_add_2D(size):
+    points = [CartesianPoint(a_pair) for a_pair in _coordinates(size)]
+    offset = CartesianPoint(3.0, 4.0)
+
+    def run():
+        for a_point in points:
+            a_point + offset
+
+    return run
+
+
+def bench_add_2D_scalar(size):
+    points = [CartesianPoint(a_pair) for a_pair in _coordinates(size)]
+
+    def run():
+        for a_point in points:
+            a_point + 2.0
+
+    return run
+
+
+def bench_add_2D_polar(size):
+    points = [PolarPoint(a_pair) for a_pair in _coordinates(size)]
+    offset = CartesianPoint(3.0, 4.0)
+
+    def run():
+        for a_point in points:
+            a_point + offset
+
+    return run
+
+
+BENCHMARKS = {
+    "construct_2D": bench_construct_2D,
+    "construct_2D_trusted": bench_construct_2D_trusted,
+    "construct_2D_identity": bench_construct_2D_identity,
+    "construct_2D_intpoint": bench_construct_2D_intpoint,
+    "add_2D": bench_add_2D,
+    "add_2D_scalar": bench_add_2D_scalar,
+    "add_2D_polar": bench_add_2D_polar,
+}
+
+
+if __name__ == "__main__":
+    from points.bench import report
+
+    report(BENCHMARKS, 10000)
@@ -0,0 +1,92 @@
+# Conversions between the cartesian and polar branches of the Vector family, one
+# point at a time and, where NumPy is available, a whole path at a time. The same
+# points are converted on every run, so as_cartesian shows the cost with the cached
+# cartesian counterparts of PolarPoints and as_cartesian_uncached the cost without.
+from math import pi as π
+
+from points import CartesianPoint, PolarPoint
+
+
+def _polar_points(size):
+    return [PolarPoint(i + 1.0, i * π / 180.0) for i in range(size)]
+
+
+def _cartesian_points(size):
+    return [CartesianPoint(i + 1.0, size - i) for i in range(size)]
+
+
+def bench_as_cartesian(size):
+    polar_points = _polar_points(size)
+
+    def run():
+        for a_polar_point in polar_points:
+            a_polar_point.as_cartesian()
+
+    return run
+
+
+def bench_as_cartesian_uncached(size):
+    polar_points = _polar_points(size)
+
+    def run():
+        PolarPoint.cache_conversions = False
+        try:
+            for a_polar_point in polar_points:
+                a_polar_point.as_cartesian()
+        finally:
+            PolarPoint.cache_conversions = True
+
+    return run
+
+
+def bench_as_polar(size):
+    cartesian_points = _cartesian_points(size)
+
+    def run():
+        for a_cartesian_point in cartesian_points:
+            PolarPoint.as_polar(a_cartesian_point)
+
+    return run
+
+
+def bench_as_cartesian_many(size):
+    polar_points = _polar_points(size)
+
+    def run():
+        PolarPoint.as_cartesian_many(polar_points)
+
+    return run
+
+
+def bench_as_cartesian_many_buffer(size):
+    polar_points = _polar_points(size)
+
+    def run():
+        PolarPoint.as_cartesian_many(polar_points, as_buffer=True)
+
+    return run
+
+
+def bench_as_polar_many(size):
+    cartesian_points = _cartesian_points(size)
+
+    def run():
+        PolarPoint.as_polar_many(cartesian_points)
+
+    return run
+
+
+BENCHMARKS = {
+    "as_cartesian": bench_as_cartesian,
+    "as_cartesian_uncached": bench_as_cartesian_uncached,
+    "as_polar": bench_as_polar,
+    "as_cartesian_many": bench_as_cartesian_many,
+    "as_cartesian_many_buffer": bench_as_cartesian_many_buffer,
+    "as_polar_many": bench_as_polar_many,
+}
+
+
+if __name__ == "__main__":
+    from points.bench import report
+
+    report(BENCHMARKS, 10000)
@@ -0,0 +1,174 @@
+# The step iterators, consumed completely. Timings are per step produced.
+from collections import deque
+from math import pi as π
+
+from points import (
+    no_consectutive_repeats_iter,
+    CartesianPoint,
+    IntPoint,
+    PolarPoint,
+    iter_linear_steps_between,
+    iter_linear_chunks_between,
+    iter_natural_steps_between,
+    iter_natural_cartesian_steps_between,
+    iter_adaptive_natural_steps_between,
+)
+
+
+def _consume(an_iterator):
+    deque(an_iterator, maxlen=0)
+
+
+def bench_linear_steps_cartesian(size):
+    def run():
+        _consume(
+            iter_linear_steps_between(
+                CartesianPoint(0, 0), CartesianPoint(900, 900), size
+            )
+        )
+
+    return run
+
+
+def bench_linear_steps_intpoint(size):
+    def run():
+        _consume(
+            iter_linear_steps_between(
+                CartesianPoint(0, 0), CartesianPoint(900, 900), size, IntPoint
+            )
+        )
+
+    return run
+
+
+def bench_linear_steps_polar(size):
+    def run():
+        _consume(
+            iter_linear_steps_between(
+                PolarPoint(337.5, 0), PolarPoint(0, 4.0 * π), size
+            )
+        )
+
+    return run
+
+
+def bench_linear_chunks_cartesian(size):
+    def run():
+        _consume(
+            iter_linear_chunks_between(
+                CartesianPoint(0, 0), CartesianPoint(900, 900), size, as_buffer=True
+            )
+        )
+
+    return run
+
+
+def bench_linear_chunks_polar(size):
+    def run():
+        _consume(
+            iter_linear_chunks_between(
+                PolarPoint(337.5, 0), PolarPoint(0, 4.0 * π), size, as_buffer=True
+            )
+        )
+
+    return run
+
+
+def bench_natural_steps_polar(size):
+    def run():
+        _consume(
+            iter_natural_steps_between(
+                PolarPoint(337.5, 0), PolarPoint(0, 4.0 * π), size
+            )
+        )
+
+    return run
+
+
+def bench_adaptive_natural_steps_polar(size):
+    # a spiral with as many turns as even steps of size can draw to within half a
+    # pixel: the chord of a step of Δθ on a circle of radius ρ strays ρ * Δθ**2 / 8
+    # from the arc. Timings are per even step, to compare with natural_steps_polar.
+    ρ = 337.5
+    total_θ = size * (8 * 0.5 / ρ) ** 0.5
+
+    def run():
+        _consume(
+            iter_adaptive_natural_steps_between(
+                PolarPoint(ρ, 0), PolarPoint(0, total_θ), 0.5
+            )
+        )
+
+    return run
+
+
+def bench_natural_steps_polar_as_cartesian(size):
+    def run():
+        for a_polar_point in iter_natural_steps_between(
+            PolarPoint(337.5, 0), PolarPoint(0, 4.0 * π), size
+        ):
+            a_polar_point.as_cartesian()
+
+    return run
+
+
+def bench_natural_cartesian_steps_polar(size):
+    def run():
+        _consume(
+            iter_natural_cartesian_steps_between(
+                PolarPoint(337.5, 0), PolarPoint(0, 4.0 * π), size
+            )
+        )
+
+    return run
+
+
+def _dense_spiral(size):
+    # far more points than pixels, as cartesian points about the middle of a canvas
+    return [
+        a_polar_point.as_cartesian() + 450
+        for a_polar_point in iter_natural_steps_between(
+            PolarPoint(337.5, 0), PolarPoint(0, 4.0 * π), size
+        )
+    ]
+
+
+def bench_no_repeats_grid(size):
+    points = _dense_spiral(size)
+
+    def run():
+        _consume(no_consectutive_repeats_iter(points, grid=1))
+
+    return run
+
+
+def bench_no_repeats_grid_path_array(size):
+    from points.path_array import PathArray
+
+    a_path_array = PathArray.from_path(_dense_spiral(size))
+
+    def run():
+        a_path_array.without_consecutive_repeats(grid=1)
+
+    return run
+
+
+BENCHMARKS = {
+    "linear_steps_cartesian": bench_linear_steps_cartesian,
+    "linear_steps_intpoint": bench_linear_steps_intpoint,
+    "linear_steps_polar": bench_linear_steps_polar,
+    "linear_chunks_cartesian": bench_linear_chunks_cartesian,
+    "linear_chunks_polar": bench_linear_chunks_polar,
+    "natural_steps_polar": bench_natural_steps_polar,
+    "adaptive_natural_steps_polar": bench_adaptive_natural_steps_polar,
+    "natural_steps_polar_as_cartesian": bench_natural_steps_polar_as_cartesian,
+    "natural_cartesian_steps_polar": bench_natural_cartesian_steps_polar,
+    "no_repeats_grid": bench_no_repeats_grid,
+    "no_repeats_grid_path_array": bench_no_repeats_grid_path_array,
+}
+
+
+if __name__ == "__main__":
+    from points.bench import report
+
+    report(BENCHMARKS, 10000)
@@ -0,0 +1,231 @@
+# Path broadcasting: a whole Path combined with scalars, points and other Paths.
+# Timings are per member of the Path.
+import pickle
+from math import pi as π
+from os import path
+from tempfile import TemporaryDirectory
+
+from points import (
+    CartesianPoint,
+    PolarPoint,
+    iter_linear_steps_between,
+    iter_natural_steps_between,
+    Path,
+    PointBuffer,
+    PointStreamWriter,
+    PointStreamReader,
+)
+
+
+def _cartesian_path(size):
+    return Path(
+        iter_linear_steps_between(CartesianPoint(0, 0), CartesianPoint(600, 600), size)
+    )
+
+
+def _polar_path(size):
+    return Path(
+        iter_natural_steps_between(PolarPoint(0, 0), PolarPoint(50, 10 * π), size)
+    )
+
+
+def _make_path_benchmark(a_path_function, the_other_function):
+    def a_setup_function(size):
+        a_path = a_path_function(size)
+        the_other = the_other_function(size)
+
+        def run():
+            a_path + the_other
+
+        return run
+
+    return a_setup_function
+
+
+def bench_fixed_polar_path_plus_many(size):
+    # like demo/path_demo.py, one polar path is added to many others
+    a_spiral_path = _polar_path(size)
+    many_ray_paths = [
+        Path(
+            iter_linear_steps_between(
+                PolarPoint(0, i * π / 4.5), PolarPoint(300, i * π / 4.5), size
+            )
+        )
+        for i in range(9)
+    ]
+
+    def run():
+        for a_ray_path in many_ray_paths:
+            a_ray_path + a_spiral_path
+
+    return run
+
+
+def _make_chain_benchmark(lazy):
+    # the chain in demo/path_demo.py: two polar paths and a translation, drawn as
+    # cartesian points
+    def a_setup_function(size):
+        a_ray_path = Path(
+            iter_linear_steps_between(
+                PolarPoint(0, π / 4.5), PolarPoint(300, π / 4.5), size
+            )
+        )
+        a_spiral_path = _polar_path(size)
+        a_middle_point = CartesianPoint(300, 300)
+
+        def run_eager():
+            Path(
+                a_polar_point.as_cartesian()
+                for a_polar_point in a_ray_path + a_spiral_path + a_middle_point
+            )
+
+        def run_lazy():
+            (a_ray_path.lazy() + a_spiral_path + a_middle_point).as_cartesian()
+
+        return run_lazy if lazy else run_eager
+
+    return a_setup_function
+
+
+def bench_point_buffer_from_path(size):
+    a_path = _cartesian_path(size)
+
+    def run():
+        PointBuffer.from_path(a_path)
+
+    return run
+
+
+def bench_point_buffer_as_path(size):
+    a_point_buffer = PointBuffer.from_path(_cartesian_path(size))
+
+    def run():
+        a_point_buffer.as_path()
+
+    return run
+
+
+_temporary_directory = None
+
+
+def _temporary_file_name(a_name):
+    # files for the benchmarks, all removed at exit
+    global _temporary_directory
+    if _temporary_directory is None:
+        _temporary_directory = TemporaryDirectory()
+    return path.join(_temporary_directory.name, a_name)
+
+
+def bench_point_buffer_write_file(size):
+    a_point_buffer = PointBuffer.from_path(_polar_path(size))
+    a_file_name = _temporary_file_name(f"write_{size}.points")
+
+    def run():
+        a_point_buffer.write_file(a_file_name)
+
+    return run
+
+
+def bench_point_buffer_from_file(size):
+    # open a saved path and use a few points from its middle
+    a_file_name = _temporary_file_name(f"from_{size}.points")
+    PointBuffer.from_path(_polar_path(size)).write_file(a_file_name)
+
+    def run():
+        list(PointBuffer.from_file(a_file_name)[size // 2 : size // 2 + 4])
+
+    return run
+
+
+def bench_pickled_path_load(size):
+    # the same as point_buffer_from_file, for a pickled Path
+    a_file_name = _temporary_file_name(f"pickled_{size}.pickle")
+    with open(a_file_name, "wb") as a_file:
+        pickle.dump(_polar_path(size), a_file)
+
+    def run():
+        with open(a_file_name, "rb") as a_file:
+            pickle.load(a_file)[size // 2 : size // 2 + 4]
+
+    return run
+
+
+def _make_point_stream_benchmark(a_codec, reading):
+    # generate a spiral straight into a stream, or read one back a chunk at a time
+    def a_setup_function(size):
+        a_file_name = _temporary_file_name(f"{size}_{a_codec}_{reading}.stream")
+
+        def run_writing():
+            with PointStreamWriter(
+                a_file_name, PolarPoint, chunk_size=4096, codec=a_codec
+            ) as a_writer:
+                a_writer.write_many(
+                    iter_natural_steps_between(
+                        PolarPoint(0, 0), PolarPoint(50, 10 * π), size
+                    )
+                )
+
+        def run_reading():
+            with PointStreamReader(a_file_name) as a_reader:
+                for a_chunk in a_reader.iter_chunks():
+                    a_chunk.xy_for_drawing()
+
+        if reading:
+            run_writing()
+            return run_reading
+        return run_writing
+
+    return a_setup_function
+
+
+def _make_simplify_benchmark(a_method, as_path_array=False):
+    # a dense spiral simplified to within half a pixel, or half a square pixel
+    def a_setup_function(size):
+        a_path = _polar_path(size)
+        if as_path_array:
+            from points.path_array import PathArray
+
+            a_path = PathArray.from_path(a_path)
+
+        def run():
+            a_path.simplify(0.5, a_method)
+
+        return run
+
+    return a_setup_function
+
+
+BENCHMARKS = {
+    "cartesian_path_plus_scalar": _make_path_benchmark(
+        _cartesian_path, lambda size: 2.0
+    ),
+    "cartesian_path_plus_point": _make_path_benchmark(
+        _cartesian_path, lambda size: CartesianPoint(300, 300)
+    ),
+    "cartesian_path_plus_path": _make_path_benchmark(_cartesian_path, _cartesian_path),
+    "polar_path_plus_point": _make_path_benchmark(
+        _polar_path, lambda size: CartesianPoint(300, 300)
+    ),
+    "polar_path_plus_path": _make_path_benchmark(_polar_path, _polar_path),
+    "fixed_polar_path_plus_many": bench_fixed_polar_path_plus_many,
+    "point_buffer_from_path": bench_point_buffer_from_path,
+    "point_buffer_as_path": bench_point_buffer_as_path,
+    "point_buffer_write_file": bench_point_buffer_write_file,
+    "point_buffer_from_file": bench_point_buffer_from_file,
+    "pickled_path_load": bench_pickled_path_load,
+    "point_stream_write": _make_point_stream_benchmark(None, reading=False),
+    "point_stream_read": _make_point_stream_benchmark(None, reading=True),
+    "point_stream_write_zlib": _make_point_stream_benchmark("zlib", reading=False),
+    "point_stream_read_zlib": _make_point_stream_benchmark("zlib", reading=True),
+    "polar_chain_eager": _make_chain_benchmark(lazy=False),
+    "polar_chain_lazy": _make_chain_benchmark(lazy=True),
+    "simplify_rdp": _make_simplify_benchmark("rdp"),
+    "simplify_visvalingam": _make_simplify_benchmark("visvalingam"),
+    "simplify_rdp_path_array": _make_simplify_benchmark("rdp", as_path_array=True),
+}
+
+
+if __name__ == "__main__":
+    from points.bench import report
+
+    report(BENCHMARKS, 10000)
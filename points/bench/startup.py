@@ -0,0 +1,47 @@
+# Cold start: the time for a new interpreter to run an import of the package. Every
+# operation starts a new interpreter, so these are run once whatever the sizes asked
+# for. Site packages are skipped (-S) to keep the noise down, the package is found
+# through PYTHONPATH. "interpreter" is the cost of starting up alone.
+import subprocess
+import sys
+from os import environ, path
+
+import points
+
+_PACKAGE_PARENT = path.dirname(path.dirname(path.abspath(points.__file__)))
+
+
+def _make_startup_benchmark(a_statement):
+    def a_setup_function(size):
+        an_environment = dict(environ, PYTHONPATH=_PACKAGE_PARENT)
+        # instrumentation would only be measuring itself
+        an_environment.pop("POINTS_INSTRUMENTATION", None)
+
+        def run():
+            subprocess.run(
+                [sys.executable, "-S", "-c", a_statement],
+                env=an_environment,
+                check=True,
+            )
+
+        return run
+
+    a_setup_function.sizes = (1,)
+    return a_setup_function
+
+
+BENCHMARKS = {
+    "interpreter": _make_startup_benchmark("pass"),
+    "import_points": _make_startup_benchmark("import points"),
+    "import_cartesian_point": _make_startup_benchmark(
+        "from points import CartesianPoint"
+    ),
+    "import_path": _make_startup_benchmark("from points import Path"),
+    "import_everything": _make_startup_benchmark("from points import *"),
+}
+
+
+if __name__ == "__main__":
+    from points.bench import report
+
+    report(BENCHMARKS, 1)
@@ -22,6 +22,9 @@ class Position(IntFlag):
 
 class Block(Path):
     # blocks always exist in the cartesian world
+    # the constructor normalizes the corners, so no construction can be trusted
+    _trusted_construction = False
+
     @staticmethod
     def min_max_points(a, b, c, d, target_point_class=Point):
         min_x = min(a, c)
@@ -140,6 +143,29 @@ class Block(Path):
             self.y_min <= a_cartesian_point.y < self.y_max
         )
 
+    def overlaps(self, a_block):
+        # like surrounds, blocks are half open: sharing only an edge is not overlapping
+        return (self.x_min < a_block.x_max and a_block.x_min < self.x_max) and (
+            self.y_min < a_block.y_max and a_block.y_min < self.y_max
+        )
+
+    def surrounds_many(self, points):
+        # the vectorized version of surrounds: a boolean array with an element for each
+        # of the points, which may be a Path, a PathArray or an (N, D) array
+        xs, ys = _xy_coordinates(points).T
+        return (
+            (self.x_min <= xs)
+            & (xs < self.x_max)
+            & (self.y_min <= ys)
+            & (ys < self.y_max)
+        )
+
+    def outcodes(self, points):
+        # the vectorized version of relative_point_position: an integer array of
+        # Position bits with an element for each of the points
+        xs, ys = _xy_coordinates(points).T
+        return _outcodes(self.x_min, self.y_min, self.x_max, self.y_max, xs, ys)
+
     def relative_point_position(self, a_point):
         point_position = Position.INSIDE
 
@@ -167,7 +193,7 @@ class ClipException(Exception):
     pass
 
 
-def clip_path_to_viewport(viewport_block, line_segment):
+def cohen_sutherland_clip(viewport_block, line_segment):
     """Cohen-Sutherland clipping algorithm"""
 
     x_min, y_min = viewport_block.min_point
@@ -219,3 +245,283 @@ def clip_path_to_viewport(viewport_block, line_segment):
             x2, y2 = candidate_second_point
 
     return Path(IntPoint(x1, y1), IntPoint(x2, y2))
+
+
+def liang_barsky_clip(viewport_block, line_segment):
+    """Liang-Barsky clipping algorithm"""
+    # Rather than moving end points edge by edge, the segment is treated parametrically
+    # as start + t * (end - start) for t in [0, 1]. Each of the four edges narrows the
+    # range of t, so every segment is settled in a single pass with no intermediate
+    # points. Returns the same as cohen_sutherland_clip.
+
+    x_min, y_min = viewport_block.min_point
+    x_max, y_max = viewport_block.max_point
+
+    x1, y1 = line_segment[0]
+    x2, y2 = line_segment[1]
+    dx = x2 - x1
+    dy = y2 - y1
+
+    t_enter = 0.0
+    t_exit = 1.0
+    for p, q in (
+        (-dx, x1 - x_min),
+        (dx, x_max - x1),
+        (-dy, y1 - y_min),
+        (dy, y_max - y1),
+    ):
+        if p == 0:
+            if q < 0:
+                # parallel to this edge and on the outside of it
+                raise ClipException(f"entirely outside viewport: {line_segment}")
+        elif p < 0:
+            t_enter = max(t_enter, q / p)
+        else:
+            t_exit = min(t_exit, q / p)
+        if t_enter > t_exit:
+            raise ClipException(f"entirely outside viewport: {line_segment}")
+
+    return Path(
+        IntPoint(x1 + t_enter * dx, y1 + t_enter * dy),
+        IntPoint(x1 + t_exit * dx, y1 + t_exit * dy),
+    )
+
+
+CLIPPING_STRATEGIES = {
+    "cohen-sutherland": cohen_sutherland_clip,
+    "liang-barsky": liang_barsky_clip,
+}
+
+
+def clip_path_to_viewport(viewport_block, line_segment, strategy="cohen-sutherland"):
+    # Clip a two point line segment to the viewport. Returns a Path of two IntPoints or
+    # raises ClipException if no part of the segment is inside the viewport.
+    # One segment at a time, Liang-Barsky is the cheaper of the two for every workload
+    # in points.bench.blocks. Cohen-Sutherland rounds each intermediate point, so the
+    # two may disagree by a few units on segments that cross the edges.
+    try:
+        a_clipping_function = CLIPPING_STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(f"{strategy} is not one of {tuple(CLIPPING_STRATEGIES)}")
+    return a_clipping_function(viewport_block, line_segment)
+
+
+def _cartesian_xy_coordinates(points):
+    # an (N, 2) array of the cartesian x and y coordinates of a sequence of points
+    import numpy as np
+
+    if not points:
+        return np.empty((0, 2))
+    if any(isinstance(a_point, PolarPoint) for a_point in points):
+        points = [Point(a_point) for a_point in points]
+    try:
+        return np.array(points, dtype=float).reshape(len(points), -1)[:, :2]
+    except ValueError:
+        # points of mixed dimensions
+        return np.array([tuple(a_point)[:2] for a_point in points], dtype=float)
+
+
+def _xy_coordinates(points):
+    # interpret points as an (N, 2) array of cartesian x and y coordinates. It may be
+    # an array of shape (N, D), a PathArray or any iterable of points.
+    import numpy as np
+    from points.path_array import PathArray
+
+    match points:
+        case np.ndarray() as an_ndarray:
+            coordinates = np.asarray(an_ndarray, dtype=float)
+            return coordinates.reshape(len(coordinates), -1)[:, :2]
+
+        case PathArray() as a_path_array:
+            return a_path_array.as_cartesian().coordinates[:, :2]
+
+        case Iterable() as an_iterable:
+            return _cartesian_xy_coordinates(tuple(an_iterable))
+
+        case _:
+            raise TypeError(f"{points} cannot be interpretted as points")
+
+
+def _segment_coordinates(line_segments):
+    # interpret line_segments as an (N, 2, 2) array of cartesian coordinates. It may be
+    # an array of shape (N, 2, 2) or (N, 4), a sequence of two point Paths, or a Path,
+    # PathArray or (N, 2) array of consecutive points where each point starts the next
+    # segment.
+    import numpy as np
+    from points.path_array import PathArray
+
+    match line_segments:
+        case np.ndarray() as an_ndarray:
+            coordinates = np.asarray(an_ndarray, dtype=float)
+            match coordinates.shape:
+                case (_, 2, 2):
+                    return coordinates
+                case (_, 4):
+                    return coordinates.reshape(-1, 2, 2)
+                case (_, 2):
+                    consecutive_points = coordinates
+                case _:
+                    raise ValueError(
+                        f"an array of shape {coordinates.shape} is neither segments "
+                        "of shape (N, 2, 2) or (N, 4) nor points of shape (N, 2)"
+                    )
+
+        case PathArray() as a_path_array:
+            consecutive_points = a_path_array.as_cartesian().coordinates[:, :2]
+
+        case Iterable() as an_iterable:
+            materialized = tuple(an_iterable)
+            if materialized and isinstance(materialized[0], Path):
+                return _cartesian_xy_coordinates(
+                    [
+                        a_point
+                        for a_line_segment in materialized
+                        for a_point in a_line_segment
+                    ]
+                ).reshape(-1, 2, 2)
+            consecutive_points = _cartesian_xy_coordinates(materialized)
+
+        case _:
+            raise TypeError(f"{line_segments} cannot be interpretted as line segments")
+
+    return np.stack((consecutive_points[:-1], consecutive_points[1:]), axis=1)
+
+
+def _outcodes(x_min, y_min, x_max, y_max, xs, ys):
+    # the vectorized equivalent of Block.relative_point_position
+    import numpy as np
+
+    # each comparison gives one bit of the Position, shifted into place as uint8
+    return (
+        np.asarray(xs < x_min).view(np.uint8)
+        | (np.asarray(xs > x_max).view(np.uint8) << 1)
+        | (np.asarray(ys < y_min).view(np.uint8) << 2)
+        | (np.asarray(ys > y_max).view(np.uint8) << 3)
+    )
+
+
+def _cohen_sutherland_clip_many(viewport_block, segments, maximum_passes):
+    # Every segment moves through the same steps as in cohen_sutherland_clip, but each
+    # step is taken by all the segments still in play in a single array operation.
+    import numpy as np
+
+    x_min, y_min = viewport_block.min_point
+    x_max, y_max = viewport_block.max_point
+
+    segments = segments.copy()
+    x1, y1 = segments[:, 0, 0], segments[:, 0, 1]
+    x2, y2 = segments[:, 1, 0], segments[:, 1, 1]
+
+    first_point_position = _outcodes(x_min, y_min, x_max, y_max, x1, y1)
+    second_point_position = _outcodes(x_min, y_min, x_max, y_max, x2, y2)
+    accepted = np.ones(len(segments), dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(maximum_passes):
+            in_play = accepted & ((first_point_position | second_point_position) != 0)
+            accepted &= ~(
+                in_play & ((first_point_position & second_point_position) != 0)
+            )
+            in_play &= accepted
+            if not in_play.any():
+                break
+
+            # move the first point if it is outside, otherwise the second one
+            move_first = in_play & (first_point_position != 0)
+            move_second = in_play & ~move_first
+            a_position = np.where(
+                move_first, first_point_position, second_point_position
+            )
+
+            # the order of these matches the order of the cases in cohen_sutherland_clip
+            y_edge = np.where(a_position & Position.ABOVE_YMAX, y_max, y_min)
+            x_edge = np.where(a_position & Position.ABOVE_XMAX, x_max, x_min)
+            crosses_y_edge = (
+                a_position & (Position.ABOVE_YMAX | Position.BELOW_YMIN)
+            ) != 0
+            x = np.where(
+                crosses_y_edge, x1 + (x2 - x1) * (y_edge - y1) / (y2 - y1), x_edge
+            )
+            y = np.where(
+                crosses_y_edge, y_edge, y1 + (y2 - y1) * (x_edge - x1) / (x2 - x1)
+            )
+            x, y = np.round(x), np.round(y)
+
+            x1[move_first], y1[move_first] = x[move_first], y[move_first]
+            x2[move_second], y2[move_second] = x[move_second], y[move_second]
+            first_point_position = np.where(
+                move_first,
+                _outcodes(x_min, y_min, x_max, y_max, x1, y1),
+                first_point_position,
+            )
+            second_point_position = np.where(
+                move_second,
+                _outcodes(x_min, y_min, x_max, y_max, x2, y2),
+                second_point_position,
+            )
+        else:
+            # segments that did not settle in the allotted passes are rejected
+            accepted &= (first_point_position | second_point_position) == 0
+
+    return segments, accepted
+
+
+def _liang_barsky_clip_many(viewport_block, segments, maximum_passes):
+    # liang_barsky_clip for all the segments at once, always in a single pass
+    import numpy as np
+
+    x_min, y_min = viewport_block.min_point
+    x_max, y_max = viewport_block.max_point
+
+    x1, y1 = segments[:, 0, 0], segments[:, 0, 1]
+    dx = segments[:, 1, 0] - x1
+    dy = segments[:, 1, 1] - y1
+
+    p = np.stack((-dx, dx, -dy, dy))
+    q = np.stack((x1 - x_min, x_max - x1, y1 - y_min, y_max - y1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / p
+    t_enter = np.max(np.where(p < 0, r, 0.0), axis=0, initial=0.0)
+    t_exit = np.min(np.where(p > 0, r, 1.0), axis=0, initial=1.0)
+    accepted = ~((p == 0) & (q < 0)).any(axis=0) & (t_enter <= t_exit)
+
+    clipped = np.stack(
+        (
+            np.stack((x1 + t_enter * dx, y1 + t_enter * dy), axis=-1),
+            np.stack((x1 + t_exit * dx, y1 + t_exit * dy), axis=-1),
+        ),
+        axis=1,
+    )
+    return clipped, accepted
+
+
+BATCH_CLIPPING_STRATEGIES = {
+    "cohen-sutherland": _cohen_sutherland_clip_many,
+    "liang-barsky": _liang_barsky_clip_many,
+}
+
+
+def clip_segments_to_viewport(
+    viewport_block, line_segments, strategy="cohen-sutherland", maximum_passes=16
+):
+    # Clip many line segments at once. Rather than raising ClipException, rejection is
+    # reported in a mask. Returns a tuple of the clipped segments as an (N, 2, 2) array,
+    # with rounded coordinates like the IntPoints from clip_path_to_viewport, and an
+    # (N,) boolean array that is True for the segments that are at least partly inside
+    # the viewport. The coordinates of rejected segments are NaN. maximum_passes limits
+    # the Cohen-Sutherland edge by edge steps, segments unsettled after that are rejected.
+    # In batches, Cohen-Sutherland wins when segments are mostly inside or mostly
+    # outside, Liang-Barsky when many segments cross the edges.
+    import numpy as np
+
+    try:
+        a_clipping_function = BATCH_CLIPPING_STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(f"{strategy} is not one of {tuple(BATCH_CLIPPING_STRATEGIES)}")
+
+    segments, accepted = a_clipping_function(
+        viewport_block, _segment_coordinates(line_segments), maximum_passes
+    )
+    segments = np.round(segments)
+    segments[~accepted] = np.nan
+    return segments, accepted
@@ -1,14 +1,17 @@
 from collections.abc import Iterable
-from numbers import Number
 
 from points import Vector
+from points.vector import is_number
 
 
 class CartesianPoint(Vector):
+    # judging only checks values, so computed values can be trusted
+    _trusted_construction = True
+
     @staticmethod
     def _judge_candidate_value(a_potential_scalar):
         # accept only scalars as values
-        if isinstance(a_potential_scalar, Number):
+        if is_number(a_potential_scalar):
             return a_potential_scalar
         raise TypeError(f"members must be scalar, {a_potential_scalar} is not")
 
@@ -22,7 +25,7 @@ class CartesianPoint(Vector):
             return self
         # not a very useful thing here, but the equivalent method in the PolarPoint
         # class allows conversion to any specified cartesian_point_class
-        return cartesian_point_class(*self)
+        return cartesian_point_class._from_trusted(self)
 
     @classmethod
     def as_my_type(cls, the_other):
@@ -83,10 +86,15 @@ class CartesianPoint(Vector):
 def create_RoundedNPoint_class(number_of_digits=None):
     # a class making factory for cartesian points of various precisions.
     class RoundedNPoint(CartesianPoint):
+        # every value must be rounded, even those computed by the library, so
+        # defining _judge_candidate_value leaves this class untrusted
         def _judge_candidate_value(a_potential_scalar):
             # round all values up to a certain number of digits
             return round(a_potential_scalar, number_of_digits)
 
+    # remembered so that code judging many values at once can round the same way
+    RoundedNPoint.number_of_digits = number_of_digits
+
     if number_of_digits is None:
         RoundedNPoint.__name__ = "IntPoint"
     else:
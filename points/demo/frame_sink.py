@@ -0,0 +1,254 @@
+#!/usr/bin/env python3.10
+# Frame sinks take the frames of an animation from the demos and write them out.
+# Writing a PNG is mostly encoding, which can easily take longer than drawing the
+# frame. The ThreadedFrameSink takes a snapshot of each frame and leaves the encoding
+# and writing to a pool of threads, so drawing carries on while earlier frames are
+# encoded. The queue of snapshots is bounded: when the writers fall behind, the
+# drawing waits for them rather than piling up frames in memory. The APNGFrameSink
+# streams all the frames into a single animated PNG instead of a file per frame.
+import struct
+import sys
+import zlib
+from os import cpu_count, remove
+from queue import Queue
+from threading import Lock, Thread
+from time import perf_counter
+
+from PIL import ImageChops
+
+
+class FrameSink:
+    # the base frame sink writes each frame as it arrives, in the drawing thread
+    def __init__(self):
+        self.number_of_frames = 0
+        self.encoding_seconds = 0.0
+        self.waiting_seconds = 0.0
+        self.start_time = perf_counter()
+        self.elapsed_seconds = None
+
+    def write(self, an_image, a_file_name):
+        start_time = perf_counter()
+        an_image.save(a_file_name)
+        self.encoding_seconds += perf_counter() - start_time
+        self.number_of_frames += 1
+
+    def close(self):
+        if self.elapsed_seconds is None:
+            self.elapsed_seconds = perf_counter() - self.start_time
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def summary(self):
+        # timings of everything written so far, all in seconds
+        return {
+            "frames": self.number_of_frames,
+            "elapsed": (
+                self.elapsed_seconds
+                if self.elapsed_seconds is not None
+                else perf_counter() - self.start_time
+            ),
+            "encoding": self.encoding_seconds,
+            "mean_encoding": (
+                self.encoding_seconds / self.number_of_frames
+                if self.number_of_frames
+                else 0.0
+            ),
+            "waiting": self.waiting_seconds,
+        }
+
+    def report(self, a_file=sys.stderr):
+        a_summary = self.summary()
+        print(
+            f"{self.__class__.__name__}: {a_summary['frames']} frames in "
+            f"{a_summary['elapsed']:.2f}s, "
+            f"{a_summary['encoding']:.2f}s encoding "
+            f"({a_summary['mean_encoding'] * 1000:.1f}ms per frame), "
+            f"{a_summary['waiting']:.2f}s waiting for writers",
+            file=a_file,
+        )
+
+
+class ThreadedFrameSink(FrameSink):
+    def __init__(self, number_of_writers=None, maximum_queued_frames=None):
+        super().__init__()
+        if number_of_writers is None:
+            number_of_writers = min(4, cpu_count() or 1)
+        if maximum_queued_frames is None:
+            maximum_queued_frames = 2 * number_of_writers
+        self.queue = Queue(maxsize=maximum_queued_frames)
+        # the writers share the counters of the encoding time and frames written
+        self.lock = Lock()
+        self.errors = []
+        self.writers = [
+            Thread(target=self._write_queued_frames, daemon=True)
+            for _ in range(number_of_writers)
+        ]
+        for a_writer in self.writers:
+            a_writer.start()
+
+    def _write_queued_frames(self):
+        while (a_frame := self.queue.get()) is not None:
+            an_image, a_file_name = a_frame
+            start_time = perf_counter()
+            try:
+                an_image.save(a_file_name)
+            except Exception as x:
+                # raised in the drawing thread by the next write or close
+                self.errors.append(x)
+                has_saved = False
+            else:
+                has_saved = True
+            with self.lock:
+                self.encoding_seconds += perf_counter() - start_time
+                # only the frames that were actually written are counted
+                self.number_of_frames += has_saved
+
+    def write(self, an_image, a_file_name):
+        if self.errors:
+            raise self.errors[0]
+        # the drawing goes on in the original image, so the writers get a copy
+        a_snapshot = an_image.copy()
+        start_time = perf_counter()
+        self.queue.put((a_snapshot, a_file_name))
+        self.waiting_seconds += perf_counter() - start_time
+
+    def close(self):
+        if self.elapsed_seconds is not None:
+            return
+        for _ in self.writers:
+            self.queue.put(None)
+        for a_writer in self.writers:
+            a_writer.join()
+        super().close()
+        if self.errors:
+            raise self.errors[0]
+
+
+class APNGFrameSink(FrameSink):
+    # Stream frames into one animated PNG, written chunk by chunk as frames arrive.
+    # The number of frames isn't known until the end, so the animation control chunk
+    # is written with a placeholder count and patched when the sink is closed. With
+    # delta_frames, each frame after the first only holds the bounding box of the
+    # pixels that changed since the previous frame, drawn over what's already there.
+    # The file names given to write are ignored.
+    PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    COLOR_TYPES = {"L": 0, "RGB": 2, "RGBA": 6}
+
+    def __init__(
+        self, a_file_name, delay_milliseconds=40, delta_frames=True, compression_level=6
+    ):
+        super().__init__()
+        self.file = open(a_file_name, "wb")
+        self.delay_milliseconds = delay_milliseconds
+        self.delta_frames = delta_frames
+        self.compression_level = compression_level
+        self.sequence_number = 0
+        self.previous_image = None
+        self.animation_control_offset = None
+        self.bytes_written = 0
+
+    def _write_chunk(self, a_chunk_type, data):
+        self.file.write(struct.pack(">I", len(data)))
+        self.file.write(a_chunk_type)
+        self.file.write(data)
+        self.file.write(struct.pack(">I", zlib.crc32(a_chunk_type + data)))
+
+    def _next_sequence_number(self):
+        a_sequence_number = self.sequence_number
+        self.sequence_number += 1
+        return a_sequence_number
+
+    def _compressed_pixels(self, an_image):
+        # every row is preceded by its filter type, always 0 (None) here
+        raw_pixels = an_image.tobytes()
+        row_length = len(raw_pixels) // an_image.height
+        return zlib.compress(
+            b"".join(
+                b"\x00" + raw_pixels[i : i + row_length]
+                for i in range(0, len(raw_pixels), row_length)
+            ),
+            self.compression_level,
+        )
+
+    def _write_header(self, an_image):
+        try:
+            color_type = self.COLOR_TYPES[an_image.mode]
+        except KeyError:
+            raise ValueError(f"{self.__class__} can't write {an_image.mode} images")
+        self.file.write(self.PNG_SIGNATURE)
+        self._write_chunk(
+            b"IHDR",
+            struct.pack(
+                ">IIBBBBB", an_image.width, an_image.height, 8, color_type, 0, 0, 0
+            ),
+        )
+        self.animation_control_offset = self.file.tell()
+        # the number of frames, patched by close, and 0 for looping forever
+        self._write_chunk(b"acTL", struct.pack(">II", 0, 0))
+
+    def _write_frame_control(self, width, height, x_offset, y_offset):
+        self._write_chunk(
+            b"fcTL",
+            struct.pack(
+                ">IIIIIHHBB",
+                self._next_sequence_number(),
+                width,
+                height,
+                x_offset,
+                y_offset,
+                self.delay_milliseconds,
+                1000,
+                0,  # dispose_op: leave the frame in place for the next one
+                0,  # blend_op: replace the pixels in the frame's region
+            ),
+        )
+
+    def write(self, an_image, a_file_name=None):
+        start_time = perf_counter()
+        if self.previous_image is None:
+            self._write_header(an_image)
+            self._write_frame_control(an_image.width, an_image.height, 0, 0)
+            self._write_chunk(b"IDAT", self._compressed_pixels(an_image))
+        else:
+            if an_image.size != self.previous_image.size:
+                raise ValueError(
+                    f"{self.__class__} frames must all be {self.previous_image.size}"
+                )
+            x_offset, y_offset = 0, 0
+            a_frame = an_image
+            if self.delta_frames:
+                # an unchanged frame still needs some region, so it gets one pixel.
+                # All the bands count, by default RGBA images only compare alpha.
+                bounding_box = ImageChops.difference(
+                    an_image, self.previous_image
+                ).getbbox(alpha_only=False) or (0, 0, 1, 1)
+                x_offset, y_offset = bounding_box[:2]
+                a_frame = an_image.crop(bounding_box)
+            self._write_frame_control(a_frame.width, a_frame.height, x_offset, y_offset)
+            self._write_chunk(
+                b"fdAT",
+                struct.pack(">I", self._next_sequence_number())
+                + self._compressed_pixels(a_frame),
+            )
+        # the drawing goes on in the original image, so keep a copy to compare with
+        self.previous_image = an_image.copy() if self.delta_frames else an_image
+        self.encoding_seconds += perf_counter() - start_time
+        self.number_of_frames += 1
+
+    def close(self):
+        if self.file.closed:
+            return
+        if self.animation_control_offset is not None:
+            self._write_chunk(b"IEND", b"")
+            self.bytes_written = self.file.tell()
+            self.file.seek(self.animation_control_offset)
+            self._write_chunk(b"acTL", struct.pack(">II", self.number_of_frames, 0))
+        self.file.close()
+        if self.animation_control_offset is None:
+            # no frames, so nothing to make a valid PNG of
+            remove(self.file.name)
+        super().close()
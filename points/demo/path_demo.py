@@ -1,36 +1,40 @@
 #!/usr/bin/env python3.10
+import argparse
 from math import pi as π
 from PIL import Image, ImageDraw
-from more_itertools import windowed
 
+from frame_sink import ThreadedFrameSink, APNGFrameSink
 from points import (
     CartesianPoint,
     PolarPoint,
     iter_linear_steps_between,
     iter_natural_steps_between,
     Path,
+    PointBuffer,
 )
 
 
 class Canvas:
     # wrap the drawable image with a quicky interface to make the demo code look simpler.
-    def __init__(self):
+    def __init__(self, a_frame_sink):
         self.the_image = Image.new("RGB", (600, 600), (0, 0, 0))
         self.the_drawable_image = ImageDraw.Draw(self.the_image)
+        self.frame_sink = a_frame_sink
         self.image_counter = 0
         self.previous_point = None
         self.step_counter = 0
 
-    def draw_line_segment(self, start_point, end_point):
-        cartesian_start_point = CartesianPoint(start_point)
-        cartesian_end_point = CartesianPoint(end_point)
+    def draw_line_segment(self, a_segment_buffer):
+        # a PointBuffer of two points hands PIL its coordinates without making points
         self.the_drawable_image.line(
-            (cartesian_start_point, cartesian_end_point),
+            a_segment_buffer.xy_for_drawing(),
             fill="rgb(0, 255, 0)",
             width=3,
         )
         if not (self.step_counter % 9):
-            self.the_image.save(f"./path_demo_{self.image_counter:04d}.png")
+            self.frame_sink.write(
+                self.the_image, f"./path_demo_{self.image_counter:04d}.png"
+            )
             self.image_counter += 1
         self.step_counter += 1
 
@@ -55,20 +59,40 @@ def draw_path_demo(a_canvas):
         )
 
         # combine the straight rays with the spiral path and translate them
-        # from the canvas origin to the canvas middle - save the result as
-        # a path of PolarPoints
-        collection_of_ray_paths.append(ray_path + spiral_path + canvas_middle_point)
+        # from the canvas origin to the canvas middle - the lazy chain is evaluated
+        # in one pass straight into the cartesian points needed for drawing, kept
+        # in the float32 buffer that PIL draws from
+        collection_of_ray_paths.append(
+            PointBuffer.from_path(
+                (ray_path.lazy() + spiral_path + canvas_middle_point).as_cartesian(),
+                typecode="f",
+            )
+        )
 
-    # set up windowing iterators for all the spiraling ray paths
-    windowed_iter_for_every_ray_path = (
-        windowed(a_ray_path, 2) for a_ray_path in collection_of_ray_paths
+    # step through the all the spiral ray paths in parallel, round robin style,
+    # drawing each segment from a two point view of a ray's buffer
+    number_of_segments = (
+        min(len(a_ray_path) for a_ray_path in collection_of_ray_paths) - 1
     )
-
-    # step through the all the spiral ray paths in parallel, round robin style
-    for a_segment_for_every_ray in zip(*windowed_iter_for_every_ray_path):
-        for start_point, end_point in a_segment_for_every_ray:
-            a_canvas.draw_line_segment(start_point, end_point)
+    for i in range(number_of_segments):
+        for a_ray_path in collection_of_ray_paths:
+            a_canvas.draw_line_segment(a_ray_path[i : i + 2])
 
 
-a_canvas = Canvas()
-draw_path_demo(a_canvas)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="draw 9 looping rays, frame by frame")
+    parser.add_argument(
+        "--apng",
+        default=None,
+        help="stream the frames into this one animated PNG instead of a file per frame",
+    )
+    arguments = parser.parse_args()
+
+    # frames are either streamed into one animated PNG or encoded and written to
+    # separate files by a pool of threads while the drawing goes on
+    with (
+        APNGFrameSink(arguments.apng) if arguments.apng else ThreadedFrameSink()
+    ) as a_frame_sink:
+        a_canvas = Canvas(a_frame_sink)
+        draw_path_demo(a_canvas)
+    a_frame_sink.report()
@@ -1,20 +1,33 @@
 #!/usr/bin/env python3.10
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from math import pi as π
+from multiprocessing.sharedctypes import RawArray
+from os import cpu_count
+from time import perf_counter
+
 from PIL import Image, ImageDraw
 
+from frame_sink import FrameSink, ThreadedFrameSink, APNGFrameSink
 from points import (
     CartesianPoint,
     PolarPoint,
     iter_linear_steps_between,
     no_consectutive_repeats_iter,
+    PointBuffer,
 )
 
+CANVAS_SIZE = (900, 900)
+# a frame is saved after every this many line segments
+STEPS_PER_FRAME = 5
+
 
 class Canvas:
     # wrap the drawable image with a quicky interface to make the demo code look simpler.
-    def __init__(self):
-        self.the_image = Image.new("RGB", (900, 900), (0, 0, 0))
+    def __init__(self, a_frame_sink):
+        self.the_image = Image.new("RGB", CANVAS_SIZE, (0, 0, 0))
         self.the_drawable_image = ImageDraw.Draw(self.the_image)
+        self.frame_sink = a_frame_sink
         self.image_counter = 0
         self.previous_point = None
 
@@ -23,15 +36,17 @@ class Canvas:
             self.the_drawable_image.line(
                 (self.previous_point, end_point), fill="rgb(0, 255, 0)", width=4
             )
-            if not (step_counter % 5):
-                self.the_image.save(f"./spiral_{self.image_counter:04d}.png")
+            if not (step_counter % STEPS_PER_FRAME):
+                self.frame_sink.write(
+                    self.the_image, f"./spiral_{self.image_counter:04d}.png"
+                )
                 self.image_counter += 1
         self.previous_point = end_point
 
 
-def draw_a_looping_spiral(a_canvas):
+def iter_looping_spiral_points(canvas_size):
     # the middle of the image
-    cartesian_middle_point = CartesianPoint(a_canvas.the_image.size) / 2
+    cartesian_middle_point = CartesianPoint(canvas_size) / 2
 
     # beginning and end polar points for two loops around a circle
     # while the radius of the loop shrink
@@ -51,26 +66,133 @@ def draw_a_looping_spiral(a_canvas):
 
     # create a couple iterators that will produce a sequence of polar points
     # that spin in lockstep with each other
-    for step_counter, (
+    for (
         larger_rotated_polar_point,
         smaller_rotated_polar_point,
-    ) in enumerate(
-        no_consectutive_repeats_iter(
-            zip(
-                larger_rotator_iter,
-                smaller_rotator_iter,
-            )
+    ) in no_consectutive_repeats_iter(
+        zip(
+            larger_rotator_iter,
+            smaller_rotator_iter,
         )
     ):
         # add the cartesian middle point with the spinning polar points
-        current_cartesion_point = (
+        yield (
             cartesian_middle_point
             + larger_rotated_polar_point
             + smaller_rotated_polar_point
         )
+
+
+def draw_a_looping_spiral(a_canvas):
+    for step_counter, current_cartesion_point in enumerate(
+        iter_looping_spiral_points(a_canvas.the_image.size)
+    ):
         # draw the line segment from prevous and current cartesian points
         a_canvas.draw_successive_line_segment(current_cartesion_point, step_counter)
 
 
-a_canvas = Canvas()
-draw_a_looping_spiral(a_canvas)
+# Every frame shows a prefix of the same sequence of points, so any range of frames
+# can be rendered on its own: replay the line segments before the first frame of the
+# range onto a blank image, then carry on drawing and saving frames as usual. The
+# processes of the pool share the precomputed points, read only, in shared memory.
+
+_shared_spiral_points = None
+
+
+def _attach_shared_spiral_points(a_raw_array):
+    # runs once in every process of the pool
+    global _shared_spiral_points
+    _shared_spiral_points = PointBuffer(memoryview(a_raw_array).cast("B").cast("d"))
+
+
+def _draw_segments(a_drawable_image, first_step, last_step):
+    # draw the line segments ending at the points first_step through last_step - 1,
+    # exactly as Canvas.draw_successive_line_segment does
+    flat = _shared_spiral_points.flat
+    for a_step in range(first_step, last_step):
+        a_drawable_image.line(
+            flat[(a_step - 1) * 2 : (a_step + 1) * 2].tolist(),
+            fill="rgb(0, 255, 0)",
+            width=4,
+        )
+
+
+def _render_frames(first_frame, last_frame):
+    a_frame_sink = FrameSink()
+    an_image = Image.new("RGB", CANVAS_SIZE, (0, 0, 0))
+    a_drawable_image = ImageDraw.Draw(an_image)
+    # replay from the blank image up to the frame before the first frame
+    _draw_segments(a_drawable_image, 1, first_frame * STEPS_PER_FRAME + 1)
+    for a_frame in range(first_frame, last_frame):
+        _draw_segments(
+            a_drawable_image,
+            a_frame * STEPS_PER_FRAME + 1,
+            (a_frame + 1) * STEPS_PER_FRAME + 1,
+        )
+        a_frame_sink.write(an_image, f"./spiral_{a_frame:04d}.png")
+    a_frame_sink.close()
+    return a_frame_sink.summary()
+
+
+def render_a_looping_spiral_in_parallel(number_of_processes):
+    start_time = perf_counter()
+    spiral_points = PointBuffer.from_path(
+        iter_looping_spiral_points(CANVAS_SIZE), CartesianPoint
+    )
+    a_raw_array = RawArray("d", len(spiral_points.flat))
+    memoryview(a_raw_array).cast("B").cast("d")[:] = spiral_points.flat
+
+    # contiguous ranges of frames, a few for every process to even out the load
+    number_of_frames = (len(spiral_points) - 1) // STEPS_PER_FRAME
+    number_of_ranges = min(number_of_frames, 4 * number_of_processes) or 1
+    range_boundaries = [
+        i * number_of_frames // number_of_ranges for i in range(number_of_ranges + 1)
+    ]
+    with ProcessPoolExecutor(
+        number_of_processes,
+        initializer=_attach_shared_spiral_points,
+        initargs=(a_raw_array,),
+    ) as a_pool:
+        summaries = list(
+            a_pool.map(_render_frames, range_boundaries[:-1], range_boundaries[1:])
+        )
+
+    encoding_seconds = sum(a_summary["encoding"] for a_summary in summaries)
+    print(
+        f"{number_of_processes} processes: "
+        f"{sum(a_summary['frames'] for a_summary in summaries)} frames in "
+        f"{perf_counter() - start_time:.2f}s, {encoding_seconds:.2f}s encoding"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="draw a looping spiral, frame by frame"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="render ranges of frames in this many processes, 0 for one per core "
+        "(default: %(default)s, drawing in this process)",
+    )
+    parser.add_argument(
+        "--apng",
+        default=None,
+        help="stream the frames into this one animated PNG instead of a file per frame",
+    )
+    arguments = parser.parse_args()
+    if arguments.apng and arguments.processes != 1:
+        parser.error("--apng streams frames in order from a single process")
+
+    if arguments.processes == 1:
+        # frames are either streamed into one animated PNG or encoded and written to
+        # separate files by a pool of threads while the drawing goes on
+        with (
+            APNGFrameSink(arguments.apng) if arguments.apng else ThreadedFrameSink()
+        ) as a_frame_sink:
+            a_canvas = Canvas(a_frame_sink)
+            draw_a_looping_spiral(a_canvas)
+        a_frame_sink.report()
+    else:
+        render_a_looping_spiral_in_parallel(arguments.processes or cpu_count() or 1)
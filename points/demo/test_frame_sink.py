@@ -0,0 +1,138 @@
+#!/usr/bin/env python3.10
+
+import unittest
+from os import listdir, path
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+
+from PIL import Image, ImageDraw
+
+from frame_sink import APNGFrameSink, ThreadedFrameSink
+
+
+class TestAPNGFrameSink(unittest.TestCase):
+    def setUp(self):
+        self.a_directory = TemporaryDirectory()
+        self.a_file_name = path.join(self.a_directory.name, "an_animation.png")
+
+    def tearDown(self):
+        self.a_directory.cleanup()
+
+    def test_delta_frames(self):
+        for a_mode, black, white in (
+            ("RGB", (0, 0, 0), (255, 255, 255)),
+            ("RGBA", (0, 0, 0, 255), (255, 255, 255, 255)),
+            ("L", 0, 255),
+        ):
+            an_image = Image.new(a_mode, (50, 50), black)
+            with APNGFrameSink(self.a_file_name) as a_frame_sink:
+                a_frame_sink.write(an_image)
+                ImageDraw.Draw(an_image).line((10, 10, 40, 40), fill=white, width=3)
+                a_frame_sink.write(an_image)
+                # an unchanged frame
+                a_frame_sink.write(an_image)
+
+            with Image.open(self.a_file_name) as an_animation:
+                self.assertEqual(an_animation.n_frames, 3)
+                self.assertEqual(an_animation.getpixel((25, 25)), black)
+                for a_frame in (1, 2):
+                    an_animation.seek(a_frame)
+                    self.assertEqual(
+                        an_animation.convert(a_mode).getpixel((25, 25)), white
+                    )
+                    self.assertEqual(
+                        an_animation.convert(a_mode).getpixel((5, 45)), black
+                    )
+
+    def test_no_frames(self):
+        APNGFrameSink(self.a_file_name).close()
+        self.assertFalse(path.exists(self.a_file_name))
+
+
+class SlowImage:
+    # stands in for an image whose saving waits until it's allowed to go on
+    def __init__(self, an_event):
+        self.an_event = an_event
+        self.file_names = []
+
+    def copy(self):
+        return self
+
+    def save(self, a_file_name):
+        self.an_event.wait()
+        self.file_names.append(a_file_name)
+
+
+class TestThreadedFrameSink(unittest.TestCase):
+    def setUp(self):
+        self.a_directory = TemporaryDirectory()
+
+    def tearDown(self):
+        self.a_directory.cleanup()
+
+    def a_file_name(self, i):
+        return path.join(self.a_directory.name, f"frame_{i:03d}.png")
+
+    def test_frames_are_written(self):
+        an_image = Image.new("RGB", (20, 20))
+        a_frame_sink = ThreadedFrameSink(number_of_writers=3)
+        with a_frame_sink:
+            for i in range(10):
+                an_image.putpixel((i, i), (255, 255, 255))
+                a_frame_sink.write(an_image, self.a_file_name(i))
+        # close waits for every writer to finish
+        self.assertFalse(any(a_writer.is_alive() for a_writer in a_frame_sink.writers))
+        self.assertEqual(a_frame_sink.number_of_frames, 10)
+        with Image.open(self.a_file_name(9)) as a_frame:
+            self.assertEqual(a_frame.getpixel((9, 9)), (255, 255, 255))
+            self.assertEqual(a_frame.getpixel((19, 19)), (0, 0, 0))
+
+    def test_errors_are_raised_in_the_drawing_thread(self):
+        an_image = Image.new("RGB", (20, 20))
+        a_missing_file_name = path.join(self.a_directory.name, "missing", "frame.png")
+        # with one writer and room for one frame, the third frame after the failing
+        # one can only be taken once the failing one is done, so at the latest it's
+        # the third write that raises
+        a_frame_sink = ThreadedFrameSink(number_of_writers=1, maximum_queued_frames=1)
+        a_frame_sink.write(an_image, a_missing_file_name)
+        with self.assertRaises(FileNotFoundError):
+            for i in range(3):
+                a_frame_sink.write(an_image, self.a_file_name(i))
+        self.assertRaises(FileNotFoundError, a_frame_sink.close)
+        self.assertFalse(a_frame_sink.writers[0].is_alive())
+        # the failed frame isn't counted
+        self.assertEqual(
+            a_frame_sink.number_of_frames, len(listdir(self.a_directory.name))
+        )
+
+        a_frame_sink = ThreadedFrameSink(number_of_writers=2)
+        a_frame_sink.write(an_image, a_missing_file_name)
+        self.assertRaises(FileNotFoundError, a_frame_sink.close)
+        self.assertEqual(a_frame_sink.number_of_frames, 0)
+
+    def test_queue_is_bounded(self):
+        an_event = Event()
+        a_slow_image = SlowImage(an_event)
+        a_frame_sink = ThreadedFrameSink(number_of_writers=1, maximum_queued_frames=2)
+        # one frame being saved and two waiting fill the sink
+        for i in range(3):
+            a_frame_sink.write(a_slow_image, self.a_file_name(i))
+        a_drawing_thread = Thread(
+            target=a_frame_sink.write, args=(a_slow_image, self.a_file_name(3))
+        )
+        a_drawing_thread.start()
+        a_drawing_thread.join(0.1)
+        # the fourth frame waits for room
+        self.assertTrue(a_drawing_thread.is_alive())
+        self.assertTrue(a_frame_sink.queue.full())
+        an_event.set()
+        a_drawing_thread.join()
+        a_frame_sink.close()
+        self.assertEqual(
+            a_slow_image.file_names, [self.a_file_name(i) for i in range(4)]
+        )
+        self.assertEqual(a_frame_sink.number_of_frames, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+from math import sqrt
+
+# Small geometric measures shared across the package. They take plain sequences of
+# cartesian coordinates of any number of dimensions, not points, so they can be used
+# on rows of coordinates without building points for them.
+
+
+def distance_to_segment(a_row, start_row, end_row):
+    # the distance from the point at a_row to the nearest point of the line segment
+    # from start_row to end_row
+    segment = [b - a for a, b in zip(start_row, end_row)]
+    offset = [p - a for a, p in zip(start_row, a_row)]
+    segment_length_squared = sum(c * c for c in segment)
+    if segment_length_squared:
+        t = max(
+            0.0,
+            min(
+                1.0,
+                sum(s * o for s, o in zip(segment, offset)) / segment_length_squared,
+            ),
+        )
+        offset = [o - t * s for o, s in zip(offset, segment)]
+    return sqrt(sum(c * c for c in offset))
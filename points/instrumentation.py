@@ -0,0 +1,221 @@
+import atexit
+import json
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from os import environ
+from time import perf_counter
+
+from points import Vector
+
+# Opt in counters, and optionally timers, for the hot paths of the Vector family:
+# construction, judging members, operator dispatch and conversions between the
+# cartesian and polar worlds, plus every ClipException raised. Nothing is instrumented
+# until enable is called: the methods are then wrapped in place and the originals are
+# put back by disable, so there is no cost at all while instrumentation is off.
+#
+# Counts are keyed by the method, named by the class that defines it, then by the
+# class it was actually called for. For example, snapshot()["counts"]["Vector.__new__"]
+# ["PolarPoint"] is the number of PolarPoints constructed through Vector.__new__.
+# Classes created while instrumentation is enabled are not instrumented.
+#
+# Setting the environment variable POINTS_INSTRUMENTATION to 1 (or to "timed") enables
+# instrumentation when the package is imported. A snapshot is written as JSON at exit
+# to the file named by POINTS_INSTRUMENTATION_OUTPUT, or to stderr.
+
+INSTRUMENTED_METHODS = (
+    "__new__",
+    "_from_trusted",
+    "_judge_candidate_value",
+    "_operation",
+    "as_cartesian",
+    "_as_cartesian",
+    "as_polar",
+    "_as_polar",
+    "as_cartesian_many",
+    "as_polar_many",
+)
+
+_counts = defaultdict(lambda: defaultdict(int))
+_seconds = defaultdict(lambda: defaultdict(float))
+# (a class, an attribute name, the original value or None if it had none of its own)
+_originals = []
+# whether the methods, while instrumented, are timed as well as counted
+_is_timed = False
+
+
+def _all_subclasses(a_class):
+    yield a_class
+    for a_subclass in a_class.__subclasses__():
+        yield from _all_subclasses(a_subclass)
+
+
+def _instrumented(a_function, a_key, an_owner, is_bound_to_class, timed):
+    # wrap a_function to count (and time) its calls by the class they were made for
+    counts = _counts[a_key]
+    seconds = _seconds[a_key]
+    owner_name = an_owner.__name__
+
+    def class_name_of(args):
+        if is_bound_to_class:
+            return args[0].__name__
+        if args and isinstance(args[0], an_owner):
+            return args[0].__class__.__name__
+        return owner_name
+
+    if timed:
+
+        @wraps(a_function)
+        def a_timed_wrapper(*args, **kwargs):
+            a_class_name = class_name_of(args)
+            counts[a_class_name] += 1
+            start_time = perf_counter()
+            try:
+                return a_function(*args, **kwargs)
+            finally:
+                seconds[a_class_name] += perf_counter() - start_time
+
+        return a_timed_wrapper
+
+    @wraps(a_function)
+    def a_counting_wrapper(*args, **kwargs):
+        counts[class_name_of(args)] += 1
+        return a_function(*args, **kwargs)
+
+    return a_counting_wrapper
+
+
+def _instrument(a_class, a_name, timed):
+    original = a_class.__dict__.get(a_name)
+    a_key = f"{a_class.__name__}.{a_name}"
+    match original:
+        case classmethod():
+            replacement = classmethod(
+                _instrumented(original.__func__, a_key, a_class, True, timed)
+            )
+        case staticmethod():
+            # __new__ is implicitly a staticmethod taking the class first
+            replacement = staticmethod(
+                _instrumented(
+                    original.__func__, a_key, a_class, a_name == "__new__", timed
+                )
+            )
+        case _:
+            replacement = _instrumented(original, a_key, a_class, False, timed)
+    _originals.append((a_class, a_name, original))
+    setattr(a_class, a_name, replacement)
+
+
+def _count_clip_exception():
+    from points.block import ClipException
+
+    counts = _counts["ClipException"]
+
+    def __init__(self, *args):
+        counts[self.__class__.__name__] += 1
+        Exception.__init__(self, *args)
+
+    _originals.append(
+        (ClipException, "__init__", ClipException.__dict__.get("__init__"))
+    )
+    ClipException.__init__ = __init__
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def enable(timed=False):
+    # start counting, and when timed is True, timing the instrumented methods
+    global _is_timed
+    if is_enabled():
+        disable()
+    _is_timed = timed
+    # the package only imports the modules that are used, Blocks bring in the rest of
+    # the family
+    import points.block
+
+    for a_class in _all_subclasses(Vector):
+        for a_name in INSTRUMENTED_METHODS:
+            if a_name in a_class.__dict__:
+                _instrument(a_class, a_name, timed)
+    _count_clip_exception()
+
+
+def disable():
+    # put back every original method, the counts so far are kept
+    while _originals:
+        a_class, a_name, original = _originals.pop()
+        if original is None:
+            delattr(a_class, a_name)
+        else:
+            setattr(a_class, a_name, original)
+
+
+def reset():
+    # the wrappers hold on to their own counters, so they're emptied in place
+    for a_mapping in (*_counts.values(), *_seconds.values()):
+        a_mapping.clear()
+
+
+def snapshot():
+    # a copy of the counts, and of the seconds if any were timed, as plain dicts
+    a_snapshot = {
+        "counts": {
+            a_key: dict(counts_by_class)
+            for a_key, counts_by_class in _counts.items()
+            if counts_by_class
+        }
+    }
+    if any(_seconds.values()):
+        a_snapshot["seconds"] = {
+            a_key: dict(seconds_by_class)
+            for a_key, seconds_by_class in _seconds.items()
+            if seconds_by_class
+        }
+    return a_snapshot
+
+
+def _add_to_counts(a_snapshot):
+    # add the counts and seconds of a snapshot back in to the current ones, in place
+    # since the wrappers hold on to their own counters
+    for a_table, a_mapping in ((_counts, "counts"), (_seconds, "seconds")):
+        for a_key, amounts_by_class in a_snapshot.get(a_mapping, {}).items():
+            for a_class_name, an_amount in amounts_by_class.items():
+                a_table[a_key][a_class_name] += an_amount
+
+
+@contextmanager
+def instrumented(timed=False):
+    # count from zero within the with block, which is given the snapshot function.
+    # Afterwards, instrumentation is enabled or disabled, timed or not, as it was
+    # before, and the counts from before the block are added to those from within.
+    was_enabled, was_timed = is_enabled(), _is_timed
+    earlier_snapshot = snapshot()
+    reset()
+    enable(timed)
+    try:
+        yield snapshot
+    finally:
+        disable()
+        _add_to_counts(earlier_snapshot)
+        if was_enabled:
+            enable(was_timed)
+
+
+def _write_snapshot(an_output_file_name):
+    if an_output_file_name:
+        with open(an_output_file_name, "w") as an_output_file:
+            json.dump(snapshot(), an_output_file, indent=2)
+    else:
+        json.dump(snapshot(), sys.stderr, indent=2)
+        print(file=sys.stderr)
+
+
+def enable_from_environment():
+    setting = environ.get("POINTS_INSTRUMENTATION", "").strip().lower()
+    if setting in ("", "0", "false", "no", "off"):
+        return
+    enable(timed=setting == "timed")
+    atexit.register(_write_snapshot, environ.get("POINTS_INSTRUMENTATION_OUTPUT"))
@@ -1,9 +1,64 @@
-def no_consectutive_repeats_iter(an_iterator):
-    previous_value = None
-    for a_value in an_iterator:
-        if a_value != previous_value:
-            yield a_value
-        previous_value = a_value
+from collections.abc import Iterable
+from math import sin, cos, floor, ceil, pi as π
+from numbers import Number
+
+from points import Vector, CartesianPoint, PolarPoint
+from points.geometry import distance_to_segment
+
+
+def _cartesian_components(a_value):
+    # flatten a scalar, a point or a structure of them, like a tuple of PolarPoints,
+    # into a tuple of cartesian coordinates
+    match a_value:
+        case Number():
+            return (a_value,)
+        case PolarPoint():
+            return tuple(a_value.as_cartesian())
+        case str():
+            # strings are iterables of strings, all the way down
+            raise TypeError(f"{a_value!r} has no cartesian coordinates")
+        case Iterable():
+            return tuple(
+                a_component
+                for a_member in a_value
+                for a_component in _cartesian_components(a_member)
+            )
+        case _:
+            raise TypeError(f"{a_value} has no cartesian coordinates")
+
+
+def no_consectutive_repeats_iter(an_iterator, epsilon=None, grid=None):
+    # skip values that repeat the last value yielded. By default, that means equal.
+    # With epsilon, a value is a repeat unless one of its cartesian coordinates moved
+    # by more than epsilon. With grid, a value is a repeat if it lands in the same cell
+    # of a grid of that spacing, with cells like pixels: [k * grid, (k + 1) * grid).
+    if epsilon is not None and grid is not None:
+        raise ValueError("use either epsilon or grid, not both")
+
+    if epsilon is not None:
+        previous_components = None
+        for a_value in an_iterator:
+            components = _cartesian_components(a_value)
+            if previous_components is None or any(
+                abs(a - b) > epsilon for a, b in zip(components, previous_components)
+            ):
+                yield a_value
+                previous_components = components
+
+    elif grid is not None:
+        previous_cell = None
+        for a_value in an_iterator:
+            a_cell = tuple(floor(c / grid) for c in _cartesian_components(a_value))
+            if a_cell != previous_cell:
+                yield a_value
+                previous_cell = a_cell
+
+    else:
+        previous_value = None
+        for a_value in an_iterator:
+            if a_value != previous_value:
+                yield a_value
+            previous_value = a_value
 
 
 def iter_linear_steps_between(
@@ -16,6 +71,70 @@ def iter_linear_steps_between(
         yield target_type(start + (increment * i))
 
 
+def iter_linear_chunks_between(
+    start,
+    stop,
+    number_of_iterations,
+    chunk_size=4096,
+    target_class=None,
+    as_buffer=False,
+):
+    # The same steps as iter_linear_steps_between, but yielded in chunks of up to
+    # chunk_size steps at a time, each computed with a single vectorized calculation.
+    # For points, each chunk is a PathArray of target_class (by default, the class of
+    # start) or, if as_buffer is True, its (K, D) array of coordinates. For scalars,
+    # each chunk is a (K,) array. Only one chunk is held in memory at a time.
+    # NumPy is only required by those that use chunks.
+    import numpy as np
+    from points.path_array import PathArray, cartesian_to_polar_coordinates
+
+    # the increment is found with the usual point arithmetic, so it is exactly the
+    # same as the one used by iter_linear_steps_between
+    increment = (stop - start) / number_of_iterations
+
+    match start:
+        case PolarPoint():
+            # polar arithmetic is cartesian arithmetic: scaling the increment by i
+            # scales its cartesian counterpart and the sum is converted back to polar
+            point_class = PolarPoint
+            start_coordinates = np.array(start.as_cartesian(), dtype=float)
+            increment_coordinates = np.array(increment.as_cartesian(), dtype=float)
+        case Vector():
+            point_class = start.__class__
+            start_coordinates = np.array(start, dtype=float)
+            increment_coordinates = np.array(start.as_my_type(increment), dtype=float)
+        case _:
+            point_class = None
+            start_coordinates = np.float64(start)
+            increment_coordinates = np.float64(increment)
+
+    for chunk_start in range(0, number_of_iterations, chunk_size):
+        i = np.arange(
+            chunk_start,
+            min(chunk_start + chunk_size, number_of_iterations),
+            dtype=float,
+        )
+        if point_class is None:
+            yield start_coordinates + increment_coordinates * i
+            continue
+
+        steps = PathArray(increment_coordinates * i[:, None], point_class)._judged()
+        a_chunk = PathArray(
+            start_coordinates + steps.coordinates, point_class
+        )._judged()
+        if point_class is PolarPoint:
+            a_chunk = PathArray(
+                cartesian_to_polar_coordinates(a_chunk.coordinates), PolarPoint
+            )
+
+        if target_class is not None and target_class is not point_class:
+            if issubclass(target_class, PolarPoint):
+                a_chunk = a_chunk.as_polar(target_class)
+            else:
+                a_chunk = a_chunk.as_cartesian(target_class)
+        yield a_chunk.coordinates if as_buffer else a_chunk
+
+
 def iter_natural_steps_between(
     start, stop, number_of_iterations, target_type=lambda n: n
 ):
@@ -31,3 +150,178 @@ def iter_natural_steps_between(
         )
     ):
         yield target_type(base_point_type(*p))
+
+
+def iter_natural_cartesian_steps_between(
+    start,
+    stop,
+    number_of_iterations,
+    target_type=lambda n: n,
+    resynchronize_every=64,
+):
+    # The same points as iter_natural_steps_between for 2D or 3D PolarPoints, but
+    # yielded as CartesianPoints without calling cos and sin for every step. Since θ
+    # (and φ) advance by the same amount every step, the unit vector for each step is
+    # the previous one rotated by that amount: one complex multiplication. To keep
+    # rounding errors from accumulating, the unit vectors are recomputed exactly every
+    # resynchronize_every steps.
+    #
+    # Error bound: a complex multiplication is off by at most 4 units in the last
+    # place (u = 2**-53) per step, including the rounding of the rotation itself, so
+    # after at most K = resynchronize_every steps each coordinate is within
+    #     ρ_max * (4 * K + 8 + 2 * |θ|_max) * u
+    # of the result of converting the corresponding iter_natural_steps_between point,
+    # where ρ_max and |θ|_max are the largest magnitudes reached by ρ and θ. In 3D the
+    # bound is doubled. With the default K = 64 and |θ| up to 100π that is under 1e-13
+    # times ρ_max.
+    match len(start):
+        case 2:
+            ρ_start, θ_start = start
+            ρ_stop, θ_stop = stop
+            φ_start = φ_stop = None
+        case 3:
+            ρ_start, θ_start, φ_start = start
+            ρ_stop, θ_stop, φ_stop = stop
+        case _:
+            raise TypeError(f"Points must be 2D or 3D, {start} is not")
+
+    as_cartesian_point = CartesianPoint._from_trusted
+
+    # the same increments iter_linear_steps_between would use for each component
+    ρ_increment = (ρ_stop - ρ_start) / number_of_iterations
+    θ_increment = (θ_stop - θ_start) / number_of_iterations
+    θ_rotation = complex(cos(θ_increment), sin(θ_increment))
+    if φ_start is not None:
+        φ_increment = (φ_stop - φ_start) / number_of_iterations
+        φ_rotation = complex(cos(φ_increment), sin(φ_increment))
+
+    for i in range(number_of_iterations):
+        if not i % resynchronize_every:
+            θ = θ_start + θ_increment * i
+            θ_unit = complex(cos(θ), sin(θ))
+            if φ_start is not None:
+                φ = φ_start + φ_increment * i
+                φ_unit = complex(cos(φ), sin(φ))
+        else:
+            θ_unit *= θ_rotation
+            if φ_start is not None:
+                φ_unit *= φ_rotation
+
+        ρ = ρ_start + ρ_increment * i
+        if φ_start is None:
+            yield target_type(as_cartesian_point((ρ * θ_unit.real, ρ * θ_unit.imag)))
+        else:
+            ρ_sin_φ = ρ * φ_unit.imag
+            yield target_type(
+                as_cartesian_point(
+                    (ρ_sin_φ * θ_unit.real, ρ_sin_φ * θ_unit.imag, ρ * φ_unit.real)
+                )
+            )
+
+
+def iter_adaptive_steps(
+    a_curve_function,
+    maximum_deviation,
+    minimum_steps=1,
+    target_type=lambda n: n,
+):
+    # Sample a curve, a function of t from 0 to 1 returning a point (or a structure of
+    # points), with as few points as it takes for the straight line segments between
+    # them to stay within maximum_deviation of the curve, measured in cartesian space.
+    # Both ends of the curve are included. Where the curve is straight the steps are
+    # long, where it bends they get shorter.
+    #
+    # Each step is close to the longest that stays within the bound. Along a smooth
+    # curve, the deviation of a chord grows with the square of its length, so the
+    # length of the next step is predicted from the deviation of the last one tried
+    # and corrected until the deviation is just under the bound. The deviation of a
+    # step is measured at a quarter, half and three quarters of the way along it, so a
+    # single step must be too short for the curve to loop back on itself: minimum_steps
+    # sets the most any one step can cover to 1 / minimum_steps.
+    if maximum_deviation <= 0:
+        raise ValueError(f"maximum_deviation must be positive, not {maximum_deviation}")
+    largest_step = 1.0 / max(1, minimum_steps)
+    # aim a little under the bound, any step with a deviation between close_enough and
+    # the bound is within about a tenth of the longest possible step
+    target_deviation = 0.9 * maximum_deviation
+    close_enough = 0.8 * maximum_deviation
+
+    def a_sample(t):
+        a_point = a_curve_function(t)
+        return a_point, _cartesian_components(a_point)
+
+    def the_step_to(start_t, start_row, end_t):
+        # the deviation of the chord from start_t to end_t and the sample at end_t
+        an_end_sample = a_sample(end_t)
+        return (
+            max(
+                distance_to_segment(
+                    a_sample(start_t + (end_t - start_t) * a_fraction)[1],
+                    start_row,
+                    an_end_sample[1],
+                )
+                for a_fraction in (0.25, 0.5, 0.75)
+            ),
+            an_end_sample,
+        )
+
+    t = 0.0
+    a_point, a_row = a_sample(t)
+    yield target_type(a_point)
+    step = largest_step
+    while t < 1.0:
+        limit = min(t + largest_step, 1.0)
+        good_t, good_sample, bad_t = t, None, limit
+        end_t = min(t + step, limit)
+        while True:
+            a_deviation, a_step_sample = the_step_to(t, a_row, end_t)
+            if a_deviation <= maximum_deviation:
+                good_t, good_sample = end_t, a_step_sample
+                if a_deviation >= close_enough or end_t >= limit:
+                    break
+            else:
+                bad_t = end_t
+            if good_sample is not None and bad_t - good_t <= (good_t - t) / 10:
+                break
+            if end_t - t < 1e-12:
+                # a discontinuity, no step is short enough, so step over it
+                good_t, good_sample = end_t, a_step_sample
+                break
+            # predict the step that makes the target deviation, but stay between the
+            # longest good and the shortest bad steps found so far
+            scale = (target_deviation / a_deviation) ** 0.5 if a_deviation else 2.0
+            end_t = t + (end_t - t) * min(2.0, max(0.25, scale))
+            if not good_t < end_t < bad_t:
+                end_t = (good_t + bad_t) / 2 if good_sample is not None else end_t
+            end_t = min(end_t, limit)
+        step = good_t - t
+        t = good_t
+        a_point, a_row = good_sample
+        yield target_type(a_point)
+
+
+def iter_adaptive_natural_steps_between(
+    start, stop, maximum_deviation, target_type=lambda n: n
+):
+    # The curve of iter_natural_steps_between from start to stop, inclusive, sampled
+    # by iter_adaptive_steps rather than in a fixed number of steps: close to the fewest
+    # points for which the line segments joining them stay within maximum_deviation of
+    # the curve. For PolarPoints, no step turns through more than a quarter of a circle.
+    base_point_type = start.__class__
+    differences = tuple(second - first for first, second in zip(start, stop))
+
+    def a_curve_function(t):
+        if t == 1.0:
+            return stop
+        return base_point_type(
+            *(first + difference * t for first, difference in zip(start, differences))
+        )
+
+    minimum_steps = 1
+    if isinstance(start, PolarPoint):
+        minimum_steps = max(
+            1, *(ceil(abs(an_angle) / (π / 2)) for an_angle in differences[1:])
+        )
+    yield from iter_adaptive_steps(
+        a_curve_function, maximum_deviation, minimum_steps, target_type
+    )
@@ -1,11 +1,16 @@
-from collections.abc import Iterable
-from itertools import zip_longest, starmap
+from collections.abc import Iterable, Sequence
+from itertools import zip_longest, starmap, repeat
 from numbers import Number
+from operator import add, sub, mul, floordiv, truediv
 
 from points import Vector, Point, PolarPoint
+from points.simplify import simplified_indices
 
 
 class Path(Vector):
+    # judging only checks members, so computed members can be trusted
+    _trusted_construction = True
+
     @classmethod
     def _judge_candidate_value(cls, a_potential_point):
         # accept only instances of Vector as values for a Path
@@ -36,3 +41,120 @@ class Path(Vector):
             case _:
                 # no idea how to apply this value in a dyadic manner with this Vector instance
                 raise TypeError(f"{the_other} disallowed")
+
+    def simplify(self, tolerance, method="rdp"):
+        # a Path of the members needed to keep this shape within the tolerance, using
+        # Ramer-Douglas-Peucker ("rdp") or Visvalingam-Whyatt ("visvalingam")
+        rows = [
+            (
+                tuple(a_member.as_cartesian())
+                if isinstance(a_member, PolarPoint)
+                else a_member
+            )
+            for a_member in self
+        ]
+        return self.__class__._from_trusted(
+            [self[i] for i in simplified_indices(rows, tolerance, method)]
+        )
+
+    def lazy(self):
+        # opt in to lazy arithmetic: operators on the result build up an expression
+        # that is evaluated in a single fused pass only when iterated or forced
+        return LazyPath(self)
+
+
+def _negate(a_point, _):
+    return -a_point
+
+
+class LazyPath:
+    # A LazyPath is an unevaluated chain of Path arithmetic. Each operator returns a new
+    # LazyPath with one more step instead of a new Path. When iterated, every member of
+    # the source flows through the whole chain before the next member is touched, so no
+    # intermediate Paths are built. PolarPoint members do all of their arithmetic in
+    # cartesian space anyway, so they are converted to cartesian once at the start of
+    # the chain and back to polar once at the end, rather than once per operator.
+    def __init__(self, a_path, steps=()):
+        self.path = a_path
+        self.steps = steps
+
+    def _operation(self, the_other, a_dyadic_fn):
+        # the same rules as Path._operation, deferred: scalars and points are paired
+        # with every member, other iterables are zipped with the members
+        match the_other:
+            case Number() | Point() | PolarPoint():
+                pass
+
+            case Path() | LazyPath() | Sequence():
+                pass
+
+            case Iterable():
+                # single pass iterables must survive more than one evaluation
+                the_other = tuple(the_other)
+
+            case _:
+                raise TypeError(f"{the_other} disallowed")
+        return self.__class__(self.path, self.steps + ((a_dyadic_fn, the_other),))
+
+    def __add__(self, the_other):
+        return self._operation(the_other, add)
+
+    def __sub__(self, the_other):
+        return self._operation(the_other, sub)
+
+    def __mul__(self, the_other):
+        return self._operation(the_other, mul)
+
+    def __floordiv__(self, the_other):
+        return self._operation(the_other, floordiv)
+
+    def __truediv__(self, the_other):
+        return self._operation(the_other, truediv)
+
+    def __pow__(self, the_other):
+        return self._operation(the_other, pow)
+
+    def __neg__(self):
+        return self.__class__(self.path, self.steps + ((_negate, None),))
+
+    def _iter_evaluated(self, as_cartesian):
+        # yield each member of the result; when as_cartesian is True, PolarPoint
+        # results are left as the cartesian points they were computed as
+        dyadic_fns = [a_dyadic_fn for a_dyadic_fn, _ in self.steps]
+        operand_iterators = [
+            (
+                repeat(an_operand)
+                if an_operand is None
+                or isinstance(an_operand, (Number, Point, PolarPoint))
+                else iter(an_operand)
+            )
+            for _, an_operand in self.steps
+        ]
+        for a_member, *operands in zip(self.path, *operand_iterators):
+            if isinstance(a_member, PolarPoint):
+                a_value = a_member.as_cartesian()
+                for a_dyadic_fn, an_operand in zip(dyadic_fns, operands):
+                    a_value = a_dyadic_fn(a_value, an_operand)
+                yield a_value if as_cartesian else PolarPoint.as_polar(a_value)
+            else:
+                a_value = a_member
+                for a_dyadic_fn, an_operand in zip(dyadic_fns, operands):
+                    a_value = a_dyadic_fn(a_value, an_operand)
+                yield a_value
+
+    def __iter__(self):
+        return self._iter_evaluated(as_cartesian=False)
+
+    def evaluate(self, path_class=Path):
+        # force the expression, allocating only the resulting Path
+        return path_class._from_trusted(list(self._iter_evaluated(as_cartesian=False)))
+
+    def as_cartesian(self, cartesian_point_class=Point, path_class=Path):
+        # force the expression into a Path of cartesian points. Results that would have
+        # been PolarPoints skip their conversion to polar and back.
+        return path_class._from_trusted(
+            [
+                cartesian_point_class.as_my_type(a_point)
+                for a_point in self._iter_evaluated(as_cartesian=True)
+            ]
+        )
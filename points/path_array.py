@@ -0,0 +1,368 @@
+from collections.abc import Iterable, Sequence
+from numbers import Number
+
+import numpy as np
+
+from points import Vector, CartesianPoint, PolarPoint
+from points.path import Path
+from points.simplify import simplified_indices
+
+# The PathArray is the columnar cousin of Path. Where a Path is a tuple of Vector
+# instances, a PathArray is a single (N, D) array of float coordinates plus the class
+# that gives those coordinates their meaning. Arithmetic is done on the whole array at
+# once, but follows the same rules as the members of a Path would one at a time, down
+# to raising ZeroDivisionError. Only powers differ, where numpy's rules give inf or nan
+# for what Python would raise or make complex.
+
+
+def polar_to_cartesian_coordinates(polar_coordinates):
+    # convert an (N, 2) or (N, 3) array of polar coordinates to cartesian in one pass
+    polar_coordinates = np.asarray(polar_coordinates, dtype=float)
+    match polar_coordinates.shape[-1]:
+        case 2:
+            ρ, θ = polar_coordinates[..., 0], polar_coordinates[..., 1]
+            return np.stack((ρ * np.cos(θ), ρ * np.sin(θ)), axis=-1)
+
+        case 3:
+            ρ, θ, φ = (
+                polar_coordinates[..., 0],
+                polar_coordinates[..., 1],
+                polar_coordinates[..., 2],
+            )
+            ρ_sin_φ = ρ * np.sin(φ)
+            return np.stack(
+                (ρ_sin_φ * np.cos(θ), ρ_sin_φ * np.sin(θ), ρ * np.cos(φ)), axis=-1
+            )
+
+        case _:
+            raise TypeError(
+                f"No conversion defined for coordinates with {polar_coordinates.shape[-1]} members"
+            )
+
+
+def cartesian_to_polar_coordinates(cartesian_coordinates):
+    # convert an (N, 2) or (N, 3) array of cartesian coordinates to polar in one pass
+    cartesian_coordinates = np.asarray(cartesian_coordinates, dtype=float)
+    match cartesian_coordinates.shape[-1]:
+        case 2:
+            x, y = cartesian_coordinates[..., 0], cartesian_coordinates[..., 1]
+            return np.stack((np.hypot(x, y), np.arctan2(y, x)), axis=-1)
+
+        case 3:
+            x, y, z = (
+                cartesian_coordinates[..., 0],
+                cartesian_coordinates[..., 1],
+                cartesian_coordinates[..., 2],
+            )
+            xy = np.hypot(x, y)
+            return np.stack(
+                (np.sqrt(x**2 + y**2 + z**2), np.arctan2(y, x), np.arctan2(xy, z)),
+                axis=-1,
+            )
+
+        case _:
+            raise TypeError(
+                f"Points must be 2D or 3D. Don't know how to convert {cartesian_coordinates.shape[-1]}D coordinates to Polar"
+            )
+
+
+def _ramer_douglas_peucker_indices(coordinates, tolerance):
+    # points.simplify.ramer_douglas_peucker_indices for an (N, D) array
+    number_of_rows = len(coordinates)
+    if number_of_rows < 3:
+        return np.arange(number_of_rows)
+    keep = np.zeros(number_of_rows, dtype=bool)
+    keep[0] = keep[-1] = True
+    spans = [(0, number_of_rows - 1)]
+    while spans:
+        first, last = spans.pop()
+        if last - first < 2:
+            continue
+        start = coordinates[first]
+        segment = coordinates[last] - start
+        offsets = coordinates[first + 1 : last] - start
+        segment_length_squared = segment @ segment
+        if segment_length_squared:
+            t = np.clip(offsets @ segment / segment_length_squared, 0.0, 1.0)
+            offsets = offsets - t[:, None] * segment
+        distances = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            farthest_index = first + 1 + farthest
+            keep[farthest_index] = True
+            spans.append((first, farthest_index))
+            spans.append((farthest_index, last))
+    return np.flatnonzero(keep)
+
+
+def _arithmetic_family(a_point_class):
+    # PolarPoints do all their arithmetic in cartesian space, so operands for them are
+    # interpreted as CartesianPoints. Every other class interprets its own operands.
+    if issubclass(a_point_class, PolarPoint):
+        return CartesianPoint
+    return a_point_class
+
+
+class PathArray:
+    def __init__(self, coordinates, point_class=CartesianPoint):
+        if not isinstance(coordinates, (np.ndarray, Sequence, PathArray)):
+            # materialize generators and other single pass iterables
+            coordinates = tuple(coordinates)
+        coordinates = np.asarray(coordinates, dtype=float)
+        match coordinates.ndim:
+            case 2:
+                pass
+            case 1 if coordinates.size == 0:
+                coordinates = coordinates.reshape(0, 0)
+            case 1:
+                # a flat buffer of a single point
+                coordinates = coordinates.reshape(1, -1)
+            case _:
+                raise ValueError(
+                    f"{self.__class__} coordinates must have the shape (N, D), not {coordinates.shape}"
+                )
+        if not (isinstance(point_class, type) and issubclass(point_class, Vector)):
+            raise TypeError(f"{point_class} is not a member of the Vector family")
+        self.coordinates = coordinates
+        self.point_class = point_class
+
+    @classmethod
+    def from_path(cls, a_path, point_class=None):
+        # make a PathArray from a Path or any iterable of points. Members are
+        # converted to the point_class, which defaults to the class of the first member
+        materialized = tuple(a_path)
+        if point_class is None:
+            point_class = (
+                materialized[0].__class__
+                if materialized and isinstance(materialized[0], Vector)
+                else CartesianPoint
+            )
+        as_point_class = point_class.as_my_type
+        members = [as_point_class(a_member) for a_member in materialized]
+        if len({len(a_member) for a_member in members}) > 1:
+            raise ValueError(
+                f"{cls} members must all have the same number of dimensions"
+            )
+        if not members:
+            return cls(np.empty((0, 0)), point_class)
+        return cls(np.array(members, dtype=float), point_class)
+
+    def as_path(self, path_class=Path):
+        # round trip back into the tuple of points world
+        return path_class._from_trusted(iter(self))
+
+    @property
+    def dimensions(self):
+        return self.coordinates.shape[1]
+
+    def __len__(self):
+        return self.coordinates.shape[0]
+
+    def __iter__(self):
+        point_class = self.point_class
+        for a_row in self.coordinates.tolist():
+            yield point_class._from_trusted(a_row)
+
+    def __getitem__(self, an_index):
+        match an_index:
+            case slice():
+                # slices are views on the same coordinate buffer
+                return self.__class__(self.coordinates[an_index], self.point_class)
+            case _:
+                return self.point_class._from_trusted(
+                    self.coordinates[an_index].tolist()
+                )
+
+    def __array__(self, dtype=None, copy=None):
+        # numpy asks for a copy, for no copy, or for whatever is cheapest with None
+        if dtype is None or np.dtype(dtype) == self.coordinates.dtype:
+            return self.coordinates.copy() if copy else self.coordinates
+        if copy is False:
+            raise ValueError(
+                f"{self.__class__.__name__} can't be converted to {dtype} without a copy"
+            )
+        return self.coordinates.astype(dtype)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.coordinates!r}, {self.point_class.__name__})"
+
+    def as_cartesian(self, cartesian_point_class=CartesianPoint):
+        if issubclass(self.point_class, PolarPoint):
+            return self.__class__(
+                polar_to_cartesian_coordinates(self.coordinates), cartesian_point_class
+            )._judged()
+        if self.point_class is cartesian_point_class:
+            return self
+        return self.__class__(self.coordinates, cartesian_point_class)._judged()
+
+    def as_polar(self, target_polar_class=PolarPoint):
+        if issubclass(self.point_class, PolarPoint):
+            if self.point_class is target_polar_class:
+                return self
+            return self.__class__(self.coordinates, target_polar_class)
+        return self.__class__(
+            cartesian_to_polar_coordinates(self.coordinates), target_polar_class
+        )
+
+    def without_consecutive_repeats(self, epsilon=None, grid=None):
+        # the whole path version of no_consectutive_repeats_iter, with the same
+        # meaning for epsilon and grid, which compare cartesian coordinates
+        if epsilon is not None and grid is not None:
+            raise ValueError("use either epsilon or grid, not both")
+        if len(self) == 0:
+            return self
+        if epsilon is None and grid is None:
+            cartesian_coordinates = self.coordinates
+        else:
+            cartesian_coordinates = self.as_cartesian().coordinates
+
+        if epsilon is not None:
+            # each point is compared to the last one kept, so this can't be done with
+            # whole array operations, but it is still a single pass
+            keep = np.zeros(len(self), dtype=bool)
+            keep[0] = True
+            rows = cartesian_coordinates.tolist()
+            previous_row = rows[0]
+            for i, a_row in enumerate(rows):
+                if any(abs(a - b) > epsilon for a, b in zip(a_row, previous_row)):
+                    keep[i] = True
+                    previous_row = a_row
+        else:
+            # runs of equal values (or cells) are repeats of the first of the run, so
+            # comparing neighbors is the same as comparing to the last one kept
+            if grid is not None:
+                cartesian_coordinates = np.floor(cartesian_coordinates / grid)
+            keep = np.ones(len(self), dtype=bool)
+            keep[1:] = np.any(
+                cartesian_coordinates[1:] != cartesian_coordinates[:-1], axis=1
+            )
+        return self.__class__(self.coordinates[keep], self.point_class)
+
+    def simplify(self, tolerance, method="rdp"):
+        # the whole path version of Path.simplify. Ramer-Douglas-Peucker measures the
+        # distances within each span in one vectorized pass.
+        cartesian_coordinates = self.as_cartesian().coordinates
+        if method == "rdp":
+            kept_indices = _ramer_douglas_peucker_indices(
+                cartesian_coordinates, tolerance
+            )
+        else:
+            kept_indices = simplified_indices(
+                cartesian_coordinates.tolist(), tolerance, method
+            )
+        return self.__class__(self.coordinates[kept_indices], self.point_class)
+
+    def _coordinates_for_family(self, a_family):
+        # the coordinates of this instance as seen by arithmetic in a_family
+        if issubclass(a_family, CartesianPoint) and issubclass(
+            self.point_class, PolarPoint
+        ):
+            return self.as_cartesian(a_family).coordinates
+        return self.coordinates
+
+    def _judged(self):
+        # computed coordinates are judged just as Vector._from_trusted would judge them
+        point_class = self.point_class
+        if point_class._trusted_construction or not len(self):
+            return self
+        number_of_digits = getattr(point_class, "number_of_digits", False)
+        if number_of_digits is not False:
+            # rounded cartesian classes like IntPoint judge all their members at once
+            return self.__class__(
+                np.round(self.coordinates, number_of_digits or 0), point_class
+            )
+        # any other class judges each member as it is constructed
+        return self.__class__(
+            [point_class(*a_row) for a_row in self.coordinates.tolist()], point_class
+        )
+
+    def _paired(self, my_coordinates, the_other, a_family):
+        # pair the_other with the coordinates of the members the way Path._operation
+        # pairs it with each member: a scalar or a point goes with every member, while
+        # anything else is zipped with the members, one scalar or one point for each.
+        # Like zip, pairing with a shorter partner truncates both the number of points
+        # and the number of dimensions.
+        match the_other:
+            case Number() as a_number:
+                return my_coordinates, a_number
+
+            case CartesianPoint() | PolarPoint() as a_point:
+                an_operand = np.array(a_family.as_my_type(a_point), dtype=float)
+                dimensions = min(my_coordinates.shape[1], an_operand.shape[0])
+                return my_coordinates[:, :dimensions], an_operand[:dimensions]
+
+            case PathArray() as a_path_array:
+                an_operand = a_path_array._coordinates_for_family(a_family)
+
+            case np.ndarray() as an_ndarray if an_ndarray.ndim == 1:
+                # one scalar for each member
+                length = min(my_coordinates.shape[0], an_ndarray.shape[0])
+                return my_coordinates[:length], an_ndarray[:length, None]
+
+            case np.ndarray() as an_ndarray:
+                an_operand = an_ndarray
+
+            case Iterable() as an_iterable:
+                members = tuple(an_iterable)
+                if all(isinstance(a_member, Number) for a_member in members):
+                    return self._paired(
+                        my_coordinates, np.array(members, dtype=float), a_family
+                    )
+                an_operand = PathArray(
+                    [a_family.as_my_type(a_member) for a_member in members]
+                ).coordinates
+
+            case _:
+                raise TypeError(f"{the_other} disallowed")
+
+        length = min(my_coordinates.shape[0], an_operand.shape[0])
+        dimensions = min(my_coordinates.shape[1], an_operand.shape[1])
+        return my_coordinates[:length, :dimensions], an_operand[:length, :dimensions]
+
+    def _operation(self, the_other, a_dyadic_fn):
+        # return a new instance with coordinates that result from a_dyadic_fn applied to
+        # this instance and the_other over the whole coordinate array at once
+        a_family = _arithmetic_family(self.point_class)
+        my_coordinates, an_operand = self._paired(
+            self._coordinates_for_family(a_family), the_other, a_family
+        )
+        if a_dyadic_fn in (np.true_divide, np.floor_divide) and np.any(
+            np.asarray(an_operand) == 0
+        ):
+            # as Python's floats do, rather than numpy's inf with a warning
+            raise ZeroDivisionError(f"{self.__class__.__name__} division by zero")
+
+        result = a_dyadic_fn(my_coordinates, an_operand)
+
+        if issubclass(self.point_class, PolarPoint):
+            # PolarPoint arithmetic always produces a PolarPoint
+            return self.__class__(cartesian_to_polar_coordinates(result), PolarPoint)
+        return self.__class__(result, self.point_class)._judged()
+
+    def __add__(self, the_other):
+        return self._operation(the_other, np.add)
+
+    def __sub__(self, the_other):
+        return self._operation(the_other, np.subtract)
+
+    def __mul__(self, the_other):
+        return self._operation(the_other, np.multiply)
+
+    def __floordiv__(self, the_other):
+        return self._operation(the_other, np.floor_divide)
+
+    def __truediv__(self, the_other):
+        return self._operation(the_other, np.true_divide)
+
+    def __pow__(self, the_other):
+        return self._operation(the_other, np.power)
+
+    def __neg__(self):
+        if issubclass(self.point_class, PolarPoint):
+            return self.__class__(
+                cartesian_to_polar_coordinates(
+                    -polar_to_cartesian_coordinates(self.coordinates)
+                ),
+                PolarPoint,
+            )
+        return self.__class__(-self.coordinates, self.point_class)._judged()
@@ -0,0 +1,259 @@
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain
+
+from points import Vector, CartesianPoint, PolarPoint
+from points.path import Path
+
+# The PointBuffer is a compact container of points that needs nothing beyond the
+# standard library. Like the PathArray, it keeps the coordinates of all of its points
+# together plus the class that gives them their meaning, but the coordinates live in a
+# flat array.array exposed through a memoryview. Slices are views on the same memory
+# and the flat coordinates can be handed to anything that takes a buffer or a flat
+# sequence of numbers, such as PIL's ImageDraw.line and ImageDraw.polygon.
+#
+# PointBuffers are saved to a binary file with write_file: a fixed size header naming
+# the point class, the number of dimensions, the typecode and the number of points,
+# followed by the flat coordinates exactly as they are in memory. from_file maps the
+# file into memory instead of reading it, so opening even a huge file is immediate and
+# only the pages holding the points actually used are ever read from disk.
+
+# magic, version, byte order, typecode, dimensions, number of points, point class name
+_FILE_HEADER = struct.Struct("<8sBcc1xH2xQ40s")
+_FILE_MAGIC = b"POINTBUF"
+_FILE_VERSION = 1
+# the byte order of the machine that wrote a file, as recorded in its header. This and
+# point_class_named are shared with the other point file formats, like point streams.
+BYTE_ORDERS = {"little": b"<", "big": b">"}
+
+
+def _all_subclasses(a_class):
+    yield a_class
+    for a_subclass in a_class.__subclasses__():
+        yield from _all_subclasses(a_subclass)
+
+
+def point_class_named(a_class_name):
+    # the first class of the Vector family with that name, like IntPoint
+    for a_class in _all_subclasses(Vector):
+        if a_class.__name__ == a_class_name:
+            return a_class
+    raise ValueError(f"{a_class_name} is not a member of the Vector family")
+
+
+class PointBuffer:
+    # iterating makes points from this many at a time, so even a huge mapped buffer
+    # only ever has a block of its coordinates converted to Python numbers at once
+    points_per_block = 4096
+
+    def __init__(
+        self, coordinates=(), dimensions=2, point_class=CartesianPoint, typecode="d"
+    ):
+        # coordinates is a flat sequence of numbers, dimensions of them for each point.
+        # An array.array or a memoryview of the same typecode is used without a copy.
+        match coordinates:
+            case memoryview() as a_memoryview if (
+                a_memoryview.format == typecode
+                and a_memoryview.ndim == 1
+                and a_memoryview.contiguous
+            ):
+                flat = a_memoryview
+
+            case array() as an_array if an_array.typecode == typecode:
+                flat = memoryview(an_array)
+
+            case _:
+                flat = memoryview(array(typecode, coordinates))
+
+        if dimensions < 1 or len(flat) % dimensions:
+            raise ValueError(
+                f"{self.__class__} cannot split {len(flat)} coordinates into points of {dimensions} dimensions"
+            )
+        if not (isinstance(point_class, type) and issubclass(point_class, Vector)):
+            raise TypeError(f"{point_class} is not a member of the Vector family")
+        self.flat = flat
+        self.dimensions = dimensions
+        self.point_class = point_class
+
+    @property
+    def typecode(self):
+        return self.flat.format
+
+    @classmethod
+    def from_path(cls, a_path, point_class=None, typecode="d"):
+        # make a PointBuffer from a Path or any iterable of points. Members are
+        # converted to the point_class, which defaults to the class of the first member
+        materialized = tuple(a_path)
+        if point_class is None:
+            point_class = (
+                materialized[0].__class__
+                if materialized and isinstance(materialized[0], Vector)
+                else CartesianPoint
+            )
+        as_point_class = point_class.as_my_type
+        members = [as_point_class(a_member) for a_member in materialized]
+        dimensions = {len(a_member) for a_member in members}
+        if len(dimensions) > 1:
+            raise ValueError(
+                f"{cls} members must all have the same number of dimensions"
+            )
+        return cls(
+            array(typecode, chain.from_iterable(members)),
+            dimensions.pop() if dimensions else 2,
+            point_class,
+            typecode,
+        )
+
+    @classmethod
+    def from_file(cls, a_file_name, point_class=None):
+        # map a file written by write_file into memory. The coordinates are a read only
+        # view of the mapping, which stays open for as long as they are in use. The
+        # point class is the one named in the file, unless point_class is given.
+        with open(a_file_name, "rb") as a_file:
+            header = a_file.read(_FILE_HEADER.size)
+            if len(header) < _FILE_HEADER.size or not header.startswith(_FILE_MAGIC):
+                raise ValueError(f"{a_file_name} is not a {cls.__name__} file")
+            (
+                _,
+                version,
+                byte_order,
+                typecode,
+                dimensions,
+                number_of_points,
+                a_class_name,
+            ) = _FILE_HEADER.unpack(header)
+            if version != _FILE_VERSION:
+                raise ValueError(
+                    f"{a_file_name} is version {version}, not {_FILE_VERSION}"
+                )
+            if point_class is None:
+                point_class = point_class_named(a_class_name.rstrip(b"\0").decode())
+            typecode = typecode.decode()
+            number_of_bytes = number_of_points * dimensions * array(typecode).itemsize
+            a_mapping = mmap.mmap(a_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(a_mapping) < _FILE_HEADER.size + number_of_bytes:
+            raise ValueError(f"{a_file_name} is shorter than its header says")
+        flat = memoryview(a_mapping)[
+            _FILE_HEADER.size : _FILE_HEADER.size + number_of_bytes
+        ].cast(typecode)
+        if byte_order != BYTE_ORDERS[sys.byteorder]:
+            # written on a machine of the other byte order, so it can't be a view
+            an_array = array(typecode, flat)
+            an_array.byteswap()
+            flat = memoryview(an_array)
+        return cls(flat, dimensions, point_class, typecode)
+
+    def write_file(self, a_file_name):
+        # save the buffer for from_file, the coordinates are written as they are
+        a_class_name = self.point_class.__name__.encode()
+        if len(a_class_name) > 40:
+            raise ValueError(f"{self.point_class.__name__} is too long a class name")
+        with open(a_file_name, "wb") as a_file:
+            a_file.write(
+                _FILE_HEADER.pack(
+                    _FILE_MAGIC,
+                    _FILE_VERSION,
+                    BYTE_ORDERS[sys.byteorder],
+                    self.typecode.encode(),
+                    self.dimensions,
+                    len(self),
+                    a_class_name,
+                )
+            )
+            a_file.write(self.flat)
+
+    def as_path(self, path_class=Path):
+        # round trip back into the tuple of points world
+        return path_class._from_trusted(iter(self))
+
+    def __len__(self):
+        return len(self.flat) // self.dimensions
+
+    def __iter__(self):
+        point_class = self.point_class
+        dimensions = self.dimensions
+        flat = self.flat
+        block_length = self.points_per_block * dimensions
+        for a_block_start in range(0, len(flat), block_length):
+            values = flat[a_block_start : a_block_start + block_length].tolist()
+            for i in range(0, len(values), dimensions):
+                yield point_class._from_trusted(values[i : i + dimensions])
+
+    def __getitem__(self, an_index):
+        dimensions = self.dimensions
+        match an_index:
+            case slice():
+                start, stop, step = an_index.indices(len(self))
+                if step == 1:
+                    # contiguous slices are views on the same memory
+                    return self.__class__(
+                        self.flat[start * dimensions : max(start, stop) * dimensions],
+                        dimensions,
+                        self.point_class,
+                        self.typecode,
+                    )
+                # others can't be views of a flat buffer, so they're copies
+                return self.__class__(
+                    chain.from_iterable(
+                        self.flat[i * dimensions : (i + 1) * dimensions]
+                        for i in range(start, stop, step)
+                    ),
+                    dimensions,
+                    self.point_class,
+                    self.typecode,
+                )
+
+            case int():
+                if an_index < 0:
+                    an_index += len(self)
+                if not 0 <= an_index < len(self):
+                    raise IndexError(f"{self.__class__.__name__} index out of range")
+                return self.point_class._from_trusted(
+                    self.flat[
+                        an_index * dimensions : (an_index + 1) * dimensions
+                    ].tolist()
+                )
+
+            case _:
+                raise TypeError(f"{an_index} is not a valid index")
+
+    def __buffer__(self, flags):
+        # the buffer protocol for Python 3.12 and later. Earlier versions can use the
+        # flat memoryview directly.
+        return self.flat
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.flat.tolist()!r}, {self.dimensions}, {self.point_class.__name__}, {self.typecode!r})"
+
+    def as_cartesian(self, cartesian_point_class=CartesianPoint, typecode=None):
+        if typecode is None:
+            typecode = self.typecode
+        if issubclass(self.point_class, PolarPoint):
+            return self.__class__(
+                chain.from_iterable(
+                    a_polar_point._as_cartesian(cartesian_point_class)
+                    for a_polar_point in self
+                ),
+                self.dimensions,
+                cartesian_point_class,
+                typecode,
+            )
+        if self.point_class is cartesian_point_class and self.typecode == typecode:
+            return self
+        return self.__class__.from_path(self, cartesian_point_class, typecode)
+
+    def xy_for_drawing(self):
+        # the flat x, y coordinates of every point as the float32 buffer that PIL
+        # expects. When this is already a 2D cartesian buffer of typecode "f", this is
+        # a view without a copy.
+        a_cartesian_buffer = self.as_cartesian(typecode="f")
+        if a_cartesian_buffer.dimensions == 2:
+            return a_cartesian_buffer.flat
+        return memoryview(
+            array(
+                "f",
+                chain.from_iterable(a_point[:2] for a_point in a_cartesian_buffer),
+            )
+        )
@@ -0,0 +1,313 @@
+import struct
+import sys
+from array import array
+from bisect import bisect
+from importlib import import_module
+from itertools import islice
+
+from points import CartesianPoint
+from points.point_buffer import PointBuffer, point_class_named, BYTE_ORDERS
+
+# Point streams hold more points than need fit in memory. The PointStreamWriter takes
+# points one at a time, or from any iterator, and writes them to a file in chunks of a
+# fixed number of points, each one optionally compressed. Closing the writer appends
+# an index of where every chunk starts. The PointStreamReader reads only that index
+# when opened and then the chunks as they are needed, as PointBuffers or as points, so
+# generating, storing and drawing a path can all be done with a chunk at a time. If a
+# writer was never closed, the reader finds the chunks by skipping from one to the next.
+
+# magic, version, byte order, typecode, dimensions, chunk size, point class name, codec
+_STREAM_HEADER = struct.Struct("<8sBcc1xH2xI40s8s")
+_STREAM_MAGIC = b"POINTSTM"
+_STREAM_VERSION = 1
+# the number of points in a chunk and the number of bytes that follow
+_CHUNK_HEADER = struct.Struct("<II")
+# the offset of the index, the number of chunks and the number of points
+_STREAM_TRAILER = struct.Struct("<QQQ8s")
+_TRAILER_MAGIC = b"POINTIDX"
+
+# the modules with the compress and decompress functions for each codec, imported
+# only when used since Python can be built without some of them
+STREAM_CODECS = {"zlib": "zlib", "lzma": "lzma", "bz2": "bz2"}
+
+
+def _codec_module(a_codec):
+    try:
+        return import_module(STREAM_CODECS[a_codec])
+    except KeyError:
+        raise ValueError(f"{a_codec} is not one of {tuple(STREAM_CODECS)}")
+
+
+class PointStreamWriter:
+    def __init__(
+        self,
+        a_file_name,
+        point_class=CartesianPoint,
+        typecode="d",
+        chunk_size=65536,
+        codec=None,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+        self.codec_module = None if codec is None else _codec_module(codec)
+        self.codec = codec
+        self.point_class = point_class
+        self.typecode = typecode
+        self.chunk_size = chunk_size
+        # the number of dimensions is taken from the first point, every other point is
+        # checked against it before it's taken
+        self.dimensions = None
+        self.file = open(a_file_name, "wb")
+        self.pending_points = []
+        self.number_of_points = 0
+        # the first point and the file offset of every chunk written
+        self.chunk_starts = array("Q")
+        self.chunk_offsets = array("Q")
+
+    def _write_header(self):
+        self.file.write(
+            _STREAM_HEADER.pack(
+                _STREAM_MAGIC,
+                _STREAM_VERSION,
+                BYTE_ORDERS[sys.byteorder],
+                self.typecode.encode(),
+                self.dimensions,
+                self.chunk_size,
+                self.point_class.__name__.encode(),
+                (self.codec or "").encode(),
+            )
+        )
+
+    def _write_chunk(self):
+        # the pending points are taken first, so points that can't be written are not
+        # tried again by close
+        some_points, self.pending_points = self.pending_points, []
+        a_point_buffer = PointBuffer.from_path(
+            some_points, self.point_class, self.typecode
+        )
+        if not self.chunk_starts:
+            self._write_header()
+        data = a_point_buffer.flat.tobytes()
+        if self.codec_module is not None:
+            data = self.codec_module.compress(data)
+        self.chunk_starts.append(self.number_of_points)
+        self.chunk_offsets.append(self.file.tell())
+        self.file.write(_CHUNK_HEADER.pack(len(a_point_buffer), len(data)))
+        self.file.write(data)
+        self.number_of_points += len(a_point_buffer)
+
+    def _take(self, some_points):
+        # add points to the pending chunk, up to the first one that doesn't fit in
+        # with the others, which raises ValueError and is left out with the rest
+        for a_point in some_points:
+            if self.dimensions is None:
+                self.dimensions = len(a_point)
+            elif len(a_point) != self.dimensions:
+                raise ValueError(
+                    f"{self.__class__} points must all have {self.dimensions} "
+                    f"dimensions, {a_point} does not"
+                )
+            self.pending_points.append(a_point)
+
+    def write(self, a_point):
+        self._take((a_point,))
+        if len(self.pending_points) >= self.chunk_size:
+            self._write_chunk()
+
+    def write_many(self, points):
+        # consume any iterable of points, holding no more than a chunk of them at once
+        an_iterator = iter(points)
+        while True:
+            self._take(islice(an_iterator, self.chunk_size - len(self.pending_points)))
+            if len(self.pending_points) < self.chunk_size:
+                return
+            self._write_chunk()
+
+    def close(self):
+        if self.file.closed:
+            return
+        try:
+            if self.pending_points:
+                self._write_chunk()
+            if not self.chunk_starts:
+                # no points at all, but the header is still needed
+                if self.dimensions is None:
+                    self.dimensions = 2
+                self._write_header()
+            index_offset = self.file.tell()
+            for a_start, an_offset in zip(self.chunk_starts, self.chunk_offsets):
+                self.file.write(struct.pack("<QQ", a_start, an_offset))
+            self.file.write(
+                _STREAM_TRAILER.pack(
+                    index_offset,
+                    len(self.chunk_starts),
+                    self.number_of_points,
+                    _TRAILER_MAGIC,
+                )
+            )
+        finally:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+
+class PointStreamReader:
+    def __init__(self, a_file_name, point_class=None):
+        # reads the header and the index, the chunks are read as they're used. The
+        # point class is the one named in the file, unless point_class is given.
+        self.file = open(a_file_name, "rb")
+        try:
+            self._read_header(a_file_name, point_class)
+            self._read_index()
+        except BaseException:
+            self.file.close()
+            raise
+
+    def _read_header(self, a_file_name, point_class):
+        header = self.file.read(_STREAM_HEADER.size)
+        if len(header) < _STREAM_HEADER.size or not header.startswith(_STREAM_MAGIC):
+            raise ValueError(f"{a_file_name} is not a point stream")
+        (
+            _,
+            version,
+            byte_order,
+            typecode,
+            self.dimensions,
+            self.chunk_size,
+            a_class_name,
+            a_codec,
+        ) = _STREAM_HEADER.unpack(header)
+        if version != _STREAM_VERSION:
+            raise ValueError(
+                f"{a_file_name} is version {version}, not {_STREAM_VERSION}"
+            )
+        self.typecode = typecode.decode()
+        self.is_byte_swapped = byte_order != BYTE_ORDERS[sys.byteorder]
+        self.point_class = (
+            point_class_named(a_class_name.rstrip(b"\0").decode())
+            if point_class is None
+            else point_class
+        )
+        self.codec = a_codec.rstrip(b"\0").decode() or None
+        self.codec_module = None if self.codec is None else _codec_module(self.codec)
+
+    def _read_index(self):
+        self.chunk_starts = array("Q")
+        self.chunk_offsets = array("Q")
+        file_size = self.file.seek(0, 2)
+        if file_size >= _STREAM_HEADER.size + _STREAM_TRAILER.size:
+            self.file.seek(file_size - _STREAM_TRAILER.size)
+            (
+                index_offset,
+                number_of_chunks,
+                self.number_of_points,
+                a_magic,
+            ) = _STREAM_TRAILER.unpack(self.file.read(_STREAM_TRAILER.size))
+            if a_magic == _TRAILER_MAGIC:
+                self.file.seek(index_offset)
+                index = array("Q", self.file.read(number_of_chunks * 16))
+                if sys.byteorder != "little":
+                    index.byteswap()
+                self.chunk_starts = index[0::2]
+                self.chunk_offsets = index[1::2]
+                return
+        # the writer wasn't closed, so step through the chunks that were written
+        self.number_of_points = 0
+        an_offset = _STREAM_HEADER.size
+        while an_offset + _CHUNK_HEADER.size <= file_size:
+            self.file.seek(an_offset)
+            number_of_points, number_of_bytes = _CHUNK_HEADER.unpack(
+                self.file.read(_CHUNK_HEADER.size)
+            )
+            if an_offset + _CHUNK_HEADER.size + number_of_bytes > file_size:
+                break
+            self.chunk_starts.append(self.number_of_points)
+            self.chunk_offsets.append(an_offset)
+            self.number_of_points += number_of_points
+            an_offset += _CHUNK_HEADER.size + number_of_bytes
+
+    def __len__(self):
+        return self.number_of_points
+
+    @property
+    def number_of_chunks(self):
+        return len(self.chunk_starts)
+
+    def chunk(self, a_chunk_index):
+        # one chunk of points, read from the file, as a PointBuffer
+        self.file.seek(self.chunk_offsets[a_chunk_index])
+        _, number_of_bytes = _CHUNK_HEADER.unpack(self.file.read(_CHUNK_HEADER.size))
+        data = self.file.read(number_of_bytes)
+        if self.codec_module is not None:
+            data = self.codec_module.decompress(data)
+        coordinates = array(self.typecode, data)
+        if self.is_byte_swapped:
+            coordinates.byteswap()
+        return PointBuffer(
+            coordinates, self.dimensions, self.point_class, self.typecode
+        )
+
+    def iter_chunks(self, first_chunk=0):
+        for a_chunk_index in range(first_chunk, self.number_of_chunks):
+            yield self.chunk(a_chunk_index)
+
+    def _iter_chunk_slices(self, start, stop):
+        # the parts of the chunks holding the points from start up to stop
+        stop = min(stop, self.number_of_points)
+        if start >= stop:
+            return
+        a_chunk_index = bisect(self.chunk_starts, start) - 1
+        offset = start - self.chunk_starts[a_chunk_index]
+        for a_chunk in self.iter_chunks(a_chunk_index):
+            a_chunk = a_chunk[offset : offset + stop - start]
+            yield a_chunk
+            start += len(a_chunk)
+            if start >= stop:
+                return
+            offset = 0
+
+    def iter_points(self, start=0, stop=None):
+        # the points from start up to stop, reading from the chunk that holds start
+        if stop is None:
+            stop = self.number_of_points
+        for a_chunk in self._iter_chunk_slices(start, stop):
+            yield from a_chunk
+
+    def __iter__(self):
+        return self.iter_points()
+
+    def __getitem__(self, an_index):
+        match an_index:
+            case slice():
+                start, stop, step = an_index.indices(self.number_of_points)
+                if step != 1:
+                    raise ValueError(f"{self.__class__.__name__} slices have no step")
+                coordinates = array(self.typecode)
+                for a_chunk in self._iter_chunk_slices(start, stop):
+                    coordinates.frombytes(a_chunk.flat.cast("B"))
+                return PointBuffer(
+                    coordinates, self.dimensions, self.point_class, self.typecode
+                )
+
+            case int():
+                if an_index < 0:
+                    an_index += self.number_of_points
+                if not 0 <= an_index < self.number_of_points:
+                    raise IndexError(f"{self.__class__.__name__} index out of range")
+                return next(self.iter_points(an_index, an_index + 1))
+
+            case _:
+                raise TypeError(f"{an_index} is not a valid index")
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
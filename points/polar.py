@@ -1,15 +1,26 @@
 from collections.abc import Iterable
 from numbers import Number
-from math import sin, cos, sqrt, atan2
+from math import sin, cos, sqrt, atan2, remainder, pi as π, tau as τ
 
 from points import Vector, CartesianPoint
+from points.vector import is_number, is_real
 
 
 class PolarPoint(Vector):
+    # Each PolarPoint lazily caches its cartesian counterpart, so a PolarPoint used over
+    # and over in arithmetic pays for the trigonometry only once. A PolarPoint made by
+    # as_polar from a CartesianPoint starts out knowing it. The cache holds at most one
+    # CartesianPoint per PolarPoint and is released along with the PolarPoint. Set
+    # cache_conversions to False to turn the caching off.
+    cache_conversions = True
+    _cached_cartesian = None
+    # judging only checks values, so computed values can be trusted
+    _trusted_construction = True
+
     @classmethod
     def _judge_candidate_value(cls, a_potential_scalar):
         # accept only scalars as values
-        if isinstance(a_potential_scalar, Number):
+        if is_number(a_potential_scalar):
             return a_potential_scalar
         raise TypeError(f'{cls} members must be scalar, "{a_potential_scalar}" is not')
 
@@ -47,20 +58,35 @@ class PolarPoint(Vector):
         # iterpret coordinates differently must provide conversion both to and from cartesian.
         if target_polar_class is None:
             target_polar_class = cls
+        a_polar_point = cls._as_polar(a_cartesian_point, target_polar_class)
+        if (
+            PolarPoint.cache_conversions
+            and a_cartesian_point.__class__ is CartesianPoint
+        ):
+            # the new polar point already knows its cartesian counterpart
+            a_polar_point._cached_cartesian = a_cartesian_point
+        return a_polar_point
+
+    @staticmethod
+    def _as_polar(a_cartesian_point, target_polar_class):
         match a_cartesian_point:
             case (x, y, z):
                 # 3D case
-                return target_polar_class(
-                    sqrt((x**2) + (y**2) + (z**2)),
-                    atan2(y, x),
-                    atan2(sqrt((x**2) + (y**2)), z),
+                return target_polar_class._from_trusted(
+                    (
+                        sqrt((x**2) + (y**2) + (z**2)),
+                        atan2(y, x),
+                        atan2(sqrt((x**2) + (y**2)), z),
+                    )
                 )
 
             case (x, y):
                 # 2D case
-                return target_polar_class(
-                    sqrt((x**2) + (y**2)),
-                    atan2(y, x),
+                return target_polar_class._from_trusted(
+                    (
+                        sqrt((x**2) + (y**2)),
+                        atan2(y, x),
+                    )
                 )
 
             case _:
@@ -69,18 +95,36 @@ class PolarPoint(Vector):
                 )
 
     def as_cartesian(self, cartesian_point_class=CartesianPoint):
+        if not PolarPoint.cache_conversions:
+            return self._as_cartesian(cartesian_point_class)
+        a_cartesian_point = self._cached_cartesian
+        if a_cartesian_point is None:
+            a_cartesian_point = self._cached_cartesian = self._as_cartesian(
+                CartesianPoint
+            )
+        if cartesian_point_class is CartesianPoint:
+            return a_cartesian_point
+        return cartesian_point_class._from_trusted(a_cartesian_point)
+
+    def _as_cartesian(self, cartesian_point_class):
         match len(self):
             case 2:
-                return cartesian_point_class(
-                    self.ρ * cos(self.θ),
-                    self.ρ * sin(self.θ),
+                ρ, θ = self
+                return cartesian_point_class._from_trusted(
+                    (
+                        ρ * cos(θ),
+                        ρ * sin(θ),
+                    )
                 )
 
             case 3:
-                return cartesian_point_class(
-                    self.ρ * sin(self.φ) * cos(self.θ),
-                    self.ρ * sin(self.φ) * sin(self.θ),
-                    self.ρ * cos(self.φ),
+                ρ, θ, φ = self
+                return cartesian_point_class._from_trusted(
+                    (
+                        ρ * sin(φ) * cos(θ),
+                        ρ * sin(φ) * sin(θ),
+                        ρ * cos(φ),
+                    )
                 )
 
             case _:
@@ -88,6 +132,46 @@ class PolarPoint(Vector):
                     f"No conversion defined for coordinates with {len(self)} members"
                 )
 
+    @classmethod
+    def as_polar_many(cls, cartesian_points, target_polar_class=None, as_buffer=False):
+        # The batch version of as_polar: convert a whole sequence of 2D or 3D cartesian
+        # points (a Path, a PathArray, an (N, D) array or any iterable of points) in a
+        # single vectorized pass. The result is a Path of target_polar_class instances or,
+        # when as_buffer is True, the (N, D) array of polar coordinates.
+        # NumPy is only required by those that use the batch conversions.
+        from points.path_array import PathArray, cartesian_to_polar_coordinates
+
+        if target_polar_class is None:
+            target_polar_class = cls
+        match cartesian_points:
+            case PathArray() as a_path_array:
+                cartesian_coordinates = a_path_array.as_cartesian().coordinates
+            case _:
+                cartesian_coordinates = PathArray(cartesian_points).coordinates
+        polar_coordinates = cartesian_to_polar_coordinates(cartesian_coordinates)
+        if as_buffer:
+            return polar_coordinates
+        return PathArray(polar_coordinates, target_polar_class).as_path()
+
+    @classmethod
+    def as_cartesian_many(
+        cls, polar_points, cartesian_point_class=CartesianPoint, as_buffer=False
+    ):
+        # The batch version of as_cartesian: convert a whole sequence of 2D or 3D polar
+        # points in a single vectorized pass, returning a Path of cartesian_point_class
+        # instances or, when as_buffer is True, the (N, D) array of cartesian coordinates.
+        from points.path_array import PathArray
+
+        match polar_points:
+            case PathArray() as a_path_array:
+                a_polar_path_array = a_path_array.as_polar()
+            case _:
+                a_polar_path_array = PathArray(polar_points, cls)
+        a_cartesian_path_array = a_polar_path_array.as_cartesian(cartesian_point_class)
+        if as_buffer:
+            return a_cartesian_path_array.coordinates
+        return a_cartesian_path_array.as_path()
+
     @classmethod
     def as_my_type(cls, the_other):
         # This function is in charge of converting things into polar coordinates.
@@ -117,10 +201,35 @@ class PolarPoint(Vector):
             case _:
                 raise TypeError(f"Don't know how to convert {the_other} to Polar")
 
+    @staticmethod
+    def _normalized_2D(ρ, θ):
+        # Return a 2D PolarPoint in the same form that as_polar would give for the
+        # same point: a non-negative ρ and θ in the interval [-π, π]. At the origin
+        # and on the negative x axis, the sign of θ depends on the signs of zeros in
+        # the cartesian coordinates, so there θ comes from atan2 just as it would
+        # from the round trip through a CartesianPoint.
+        normalized_θ = remainder(θ + π, τ) if ρ < 0 else remainder(θ, τ)
+        if ρ == 0 or abs(normalized_θ) == π:
+            normalized_θ = atan2(ρ * sin(θ), ρ * cos(θ))
+        return PolarPoint._from_trusted((abs(ρ), normalized_θ))
+
+    def rotate(self, Δθ):
+        # rotate about the origin (the z axis in 3D) by adding to the angle θ
+        match len(self):
+            case 2:
+                return self._normalized_2D(self[0], self[1] + Δθ)
+            case 3:
+                ρ, θ, φ = self
+                return PolarPoint._from_trusted((ρ, remainder(θ + Δθ, τ), φ))
+            case _:
+                raise TypeError(f"Cannot rotate coordinates with {len(self)} members")
+
     # Arithmetic with polar coordinates directly is possible, but it's rather nightmarishly complex.
     # Since cartesian points are the base type, all arithmetic with PolarPoints is done by
     # converting to cartesian first and then converting back to polar afterwards.
     # In each case, the parameter, 'the_other', gets converted to cartesian only if necessary.
+    # The exceptions are the operations with trivial polar forms on 2D points: scaling
+    # by a real number scales ρ and negation adds π to θ. These skip the round trip.
     def __add__(self, the_other):
         return PolarPoint(self.as_cartesian() + the_other)
 
@@ -128,18 +237,24 @@ class PolarPoint(Vector):
         return PolarPoint(self.as_cartesian() - the_other)
 
     def __mul__(self, the_other):
+        if len(self) == 2 and is_real(the_other):
+            return self._normalized_2D(self[0] * the_other, self[1])
         return PolarPoint(self.as_cartesian() * the_other)
 
     def __floordiv__(self, the_other):
         return PolarPoint(self.as_cartesian() // the_other)
 
     def __truediv__(self, the_other):
+        if len(self) == 2 and is_real(the_other) and the_other != 0:
+            return self._normalized_2D(self[0] / the_other, self[1])
         return PolarPoint(self.as_cartesian() / the_other)
 
     def __pow__(self, the_other):
         return PolarPoint(self.as_cartesian() ** the_other)
 
     def __neg__(self):
+        if len(self) == 2:
+            return self._normalized_2D(-self[0], self[1])
         return PolarPoint(-self.as_cartesian())
 
     def trunc(self):
@@ -0,0 +1,104 @@
+from heapq import heapify, heappush, heappop
+from math import sqrt
+
+from points.geometry import distance_to_segment
+
+# Path simplification: find which vertices of a polyline can be dropped while keeping
+# its shape within a tolerance. Both algorithms work on a list of cartesian coordinate
+# rows of any number of dimensions and return the sorted indices of the rows to keep,
+# always including the first and the last. Neither is recursive, so paths of any
+# length are fine.
+
+
+def ramer_douglas_peucker_indices(rows, tolerance):
+    # keep the vertex farthest from the segment between two kept vertices for as long
+    # as it is farther than the tolerance, splitting the span there
+    number_of_rows = len(rows)
+    if number_of_rows < 3:
+        return list(range(number_of_rows))
+    keep = [False] * number_of_rows
+    keep[0] = keep[-1] = True
+    spans = [(0, number_of_rows - 1)]
+    while spans:
+        first, last = spans.pop()
+        farthest_index, farthest_distance = None, tolerance
+        for i in range(first + 1, last):
+            a_distance = distance_to_segment(rows[i], rows[first], rows[last])
+            if a_distance > farthest_distance:
+                farthest_index, farthest_distance = i, a_distance
+        if farthest_index is not None:
+            keep[farthest_index] = True
+            spans.append((first, farthest_index))
+            spans.append((farthest_index, last))
+    return [i for i, is_kept in enumerate(keep) if is_kept]
+
+
+def _triangle_area(a_row, b_row, c_row):
+    # the area of a triangle in any number of dimensions, from the lengths and dot
+    # product of two of its sides
+    u = [b - a for a, b in zip(a_row, b_row)]
+    v = [c - a for a, c in zip(a_row, c_row)]
+    uu = sum(c * c for c in u)
+    vv = sum(c * c for c in v)
+    uv = sum(a * b for a, b in zip(u, v))
+    return sqrt(max(0.0, uu * vv - uv * uv)) / 2
+
+
+def visvalingam_whyatt_indices(rows, tolerance):
+    # repeatedly drop the vertex that makes the triangle of least area with its
+    # neighbors, until every remaining triangle is at least tolerance in area
+    number_of_rows = len(rows)
+    if number_of_rows < 3:
+        return list(range(number_of_rows))
+    previous_index = list(range(-1, number_of_rows - 1))
+    next_index = list(range(1, number_of_rows + 1))
+    removed = [False] * number_of_rows
+    # the heap may hold out of date areas for a vertex, only the latest one counts
+    areas = [None] * number_of_rows
+    for i in range(1, number_of_rows - 1):
+        areas[i] = _triangle_area(rows[i - 1], rows[i], rows[i + 1])
+    heap = [(areas[i], i) for i in range(1, number_of_rows - 1)]
+    heapify(heap)
+
+    largest_removed_area = 0.0
+    while heap:
+        an_area, i = heappop(heap)
+        if removed[i] or an_area != areas[i]:
+            continue
+        if an_area >= tolerance:
+            break
+        removed[i] = True
+        # an area is never less than that of a vertex removed before it, so that
+        # removing a vertex can't make its neighbors seem less important
+        largest_removed_area = max(largest_removed_area, an_area)
+        before, after = previous_index[i], next_index[i]
+        next_index[before] = after
+        previous_index[after] = before
+        for a_neighbor in (before, after):
+            if 0 < a_neighbor < number_of_rows - 1:
+                areas[a_neighbor] = max(
+                    largest_removed_area,
+                    _triangle_area(
+                        rows[previous_index[a_neighbor]],
+                        rows[a_neighbor],
+                        rows[next_index[a_neighbor]],
+                    ),
+                )
+                heappush(heap, (areas[a_neighbor], a_neighbor))
+    return [i for i in range(number_of_rows) if not removed[i]]
+
+
+SIMPLIFICATION_METHODS = {
+    "rdp": ramer_douglas_peucker_indices,
+    "visvalingam": visvalingam_whyatt_indices,
+}
+
+
+def simplified_indices(rows, tolerance, method="rdp"):
+    # for "rdp", tolerance is the largest distance a dropped vertex may be from the
+    # simplified path. For "visvalingam", it is the smallest triangle area to keep.
+    try:
+        a_simplification_function = SIMPLIFICATION_METHODS[method]
+    except KeyError:
+        raise ValueError(f"{method} is not one of {tuple(SIMPLIFICATION_METHODS)}")
+    return a_simplification_function(rows, tolerance)
@@ -0,0 +1,439 @@
+from collections import defaultdict
+from heapq import heappush, heappop
+from itertools import count
+from math import floor, sqrt, nextafter, inf, isfinite
+
+from points import Point
+from points.path import Path
+from points.block import Block
+
+# A BlockGrid is a spatial index over many Blocks. The plane is cut into square cells
+# and every Block is listed in each cell that it touches, so a query only has to look
+# at the few Blocks listed in the cells that the query touches instead of all of them.
+# Answers are always confirmed with Block.surrounds and Block.overlaps, so the half
+# open semantics of Blocks are exactly the same as when scanning every Block.
+
+
+class BlockGrid:
+    def __init__(self, blocks, cell_size=None, maximum_cells_per_block=256):
+        self.blocks = tuple(Block(a_block) for a_block in blocks)
+        if cell_size is None:
+            cell_size = self._default_cell_size(self.blocks)
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, not {cell_size}")
+        self.cell_size = cell_size
+
+        # a mapping of (column, row) to the indices of the Blocks touching that cell,
+        # always in ascending order
+        self.cells = defaultdict(list)
+        # Blocks too large to list in every cell they touch are checked on every query
+        self.oversized = []
+        for an_index, a_block in enumerate(self.blocks):
+            columns, rows = self._cell_ranges(a_block)
+            if len(columns) * len(rows) > maximum_cells_per_block:
+                self.oversized.append(an_index)
+                continue
+            for a_column in columns:
+                for a_row in rows:
+                    self.cells[a_column, a_row].append(an_index)
+
+    @staticmethod
+    def _default_cell_size(blocks):
+        # cells about the size of a typical Block keep both the number of cells per
+        # Block and the number of Blocks per cell small
+        if not blocks:
+            return 1.0
+        mean_area = sum(
+            (a_block.x_max - a_block.x_min) * (a_block.y_max - a_block.y_min)
+            for a_block in blocks
+        ) / len(blocks)
+        return sqrt(mean_area) or 1.0
+
+    def _cell_of(self, x, y):
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def _cell_of_point(self, x, y):
+        # None for a point with an infinite or nan coordinate, which has no cell and
+        # which no Block surrounds
+        if isfinite(x) and isfinite(y):
+            return self._cell_of(x, y)
+        return None
+
+    def _cell_ranges(self, a_block):
+        # the columns and rows of the cells touched by a_block. A Block doesn't include
+        # its maximum edges, but listing it in their cells too is harmless.
+        min_column, min_row = self._cell_of(a_block.x_min, a_block.y_min)
+        max_column, max_row = self._cell_of(a_block.x_max, a_block.y_max)
+        return range(min_column, max_column + 1), range(min_row, max_row + 1)
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def _candidate_indices_for_point(self, x, y):
+        a_cell = self._cell_of_point(x, y)
+        if a_cell is None:
+            return ()
+        candidates = self.cells.get(a_cell, ())
+        if self.oversized:
+            return sorted(set(candidates).union(self.oversized))
+        return candidates
+
+    def query_point(self, a_point):
+        # all the Blocks that surround a_point, in the order they were given
+        a_cartesian_point = a_point.as_cartesian()
+        x, y = a_cartesian_point.x, a_cartesian_point.y
+        return [
+            self.blocks[an_index]
+            for an_index in self._candidate_indices_for_point(x, y)
+            if self.blocks[an_index].surrounds(a_cartesian_point)
+        ]
+
+    def query_block(self, a_block):
+        # all the Blocks that overlap a_block, in the order they were given
+        a_block = Block(a_block)
+        columns, rows = self._cell_ranges(a_block)
+        if len(columns) * len(rows) > len(self.cells):
+            # the query is larger than the occupied part of the grid
+            candidates = {
+                an_index
+                for a_cell, indices in self.cells.items()
+                if a_cell[0] in columns and a_cell[1] in rows
+                for an_index in indices
+            }
+        else:
+            candidates = {
+                an_index
+                for a_column in columns
+                for a_row in rows
+                for an_index in self.cells.get((a_column, a_row), ())
+            }
+        candidates.update(self.oversized)
+        return [
+            self.blocks[an_index]
+            for an_index in sorted(candidates)
+            if self.blocks[an_index].overlaps(a_block)
+        ]
+
+    def query_points(self, points):
+        # the batch version of query_point: a list with the list of surrounding Blocks
+        # for each of the points. Points are grouped by cell, so the candidates of each
+        # cell are gathered only once.
+        cartesian_points = [a_point.as_cartesian() for a_point in points]
+        candidates_by_cell = {None: []}
+        results = []
+        for a_cartesian_point in cartesian_points:
+            a_cell = self._cell_of_point(a_cartesian_point.x, a_cartesian_point.y)
+            try:
+                candidates = candidates_by_cell[a_cell]
+            except KeyError:
+                candidates = candidates_by_cell[a_cell] = [
+                    self.blocks[an_index]
+                    for an_index in self._candidate_indices_for_point(
+                        a_cartesian_point.x, a_cartesian_point.y
+                    )
+                ]
+            results.append(
+                [
+                    a_block
+                    for a_block in candidates
+                    if a_block.surrounds(a_cartesian_point)
+                ]
+            )
+        return results
+
+    def query_blocks(self, blocks):
+        # the batch version of query_block
+        return [self.query_block(a_block) for a_block in blocks]
+
+
+# QuadTree and OcTree bucket points into nodes that are split into 4 (or 8) children
+# around their center whenever they hold more than bucket_size points. Like Blocks, the
+# bounds of every node are half open: they include their minimum edges, but not their
+# maximum edges. Points are located by their cartesian coordinates, but the points
+# themselves are what are stored and returned.
+
+
+class _Node:
+    __slots__ = ("bounds", "lower", "upper", "center", "entries", "children")
+
+    def __init__(self, bounds, lower, upper, center):
+        self.bounds = bounds
+        self.lower = lower
+        self.upper = upper
+        self.center = center
+        # a leaf has a list of (coordinates, point) entries, other nodes have children
+        self.entries = []
+        self.children = None
+
+    def child_index(self, coordinates):
+        # one bit for each dimension: set when the coordinate is at or past the center
+        an_index = 0
+        for a_dimension, (c, a_center) in enumerate(zip(coordinates, self.center)):
+            if c >= a_center:
+                an_index |= 1 << a_dimension
+        return an_index
+
+    def distance_squared(self, coordinates):
+        # the squared distance from coordinates to the nearest part of this node
+        total = 0.0
+        for c, a_lower, an_upper in zip(coordinates, self.lower, self.upper):
+            if c < a_lower:
+                total += (a_lower - c) ** 2
+            elif c > an_upper:
+                total += (c - an_upper) ** 2
+        return total
+
+
+class _PointTree:
+    dimensions = None
+
+    def __init__(self, bounds, points=(), bucket_size=8, maximum_depth=24):
+        if bucket_size < 1:
+            raise ValueError(f"bucket_size must be at least 1, not {bucket_size}")
+        self.bucket_size = bucket_size
+        self.maximum_depth = maximum_depth
+        self.root = self._make_node(*self._region_coordinates(bounds))
+        self.number_of_points = 0
+        entries = [self._entry(a_point) for a_point in points]
+        for a_coordinates, a_point in entries:
+            self._check_bounds(a_coordinates, a_point)
+        self._bulk_load(self.root, entries, 0)
+        self.number_of_points = len(entries)
+
+    @classmethod
+    def from_points(cls, points, bucket_size=8, maximum_depth=24):
+        # bulk load points into a tree with bounds just large enough to hold them all
+        points = tuple(points)
+        if not points:
+            raise ValueError(f"{cls} cannot find the bounds of no points")
+        all_coordinates = [cls._entry(a_point)[0] for a_point in points]
+        lower = tuple(map(min, zip(*all_coordinates)))
+        # the maximum edges are excluded, so they must be just past the largest values
+        upper = tuple(
+            nextafter(a_max, inf) for a_max in map(max, zip(*all_coordinates))
+        )
+        return cls(cls._make_bounds(lower, upper), points, bucket_size, maximum_depth)
+
+    @classmethod
+    def _entry(cls, a_point):
+        # the (coordinates, point) pair stored for a point
+        a_cartesian_point = Point(a_point)
+        coordinates = tuple(a_cartesian_point)[: cls.dimensions]
+        if len(coordinates) != cls.dimensions:
+            raise ValueError(f"{cls} points must have {cls.dimensions} dimensions")
+        return coordinates, a_point
+
+    def _check_bounds(self, coordinates, a_point):
+        if not all(
+            a_lower <= c < an_upper
+            for c, a_lower, an_upper in zip(
+                coordinates, self.root.lower, self.root.upper
+            )
+        ):
+            raise ValueError(f"{a_point} is outside of {self.root.bounds}")
+
+    def _make_node(self, lower, upper):
+        bounds = self._make_bounds(lower, upper)
+        return _Node(bounds, lower, upper, self._center(bounds))
+
+    def _split(self, a_node):
+        # give a_node a child for each combination of halves of its dimensions
+        a_node.children = []
+        for an_index in range(1 << self.dimensions):
+            lower, upper = [], []
+            for a_dimension in range(self.dimensions):
+                if an_index & (1 << a_dimension):
+                    lower.append(a_node.center[a_dimension])
+                    upper.append(a_node.upper[a_dimension])
+                else:
+                    lower.append(a_node.lower[a_dimension])
+                    upper.append(a_node.center[a_dimension])
+            a_node.children.append(self._make_node(tuple(lower), tuple(upper)))
+
+    def _bulk_load(self, a_node, entries, depth):
+        # partition all the entries at once rather than inserting them one at a time
+        if len(entries) <= self.bucket_size or depth >= self.maximum_depth:
+            a_node.entries.extend(entries)
+            return
+        self._split(a_node)
+        entries_by_child = [[] for _ in a_node.children]
+        for an_entry in entries:
+            entries_by_child[a_node.child_index(an_entry[0])].append(an_entry)
+        for a_child, child_entries in zip(a_node.children, entries_by_child):
+            self._bulk_load(a_child, child_entries, depth + 1)
+
+    def __len__(self):
+        return self.number_of_points
+
+    def __iter__(self):
+        nodes = [self.root]
+        while nodes:
+            a_node = nodes.pop()
+            if a_node.children is None:
+                yield from (a_point for _, a_point in a_node.entries)
+            else:
+                nodes.extend(a_node.children)
+
+    def __contains__(self, a_point):
+        try:
+            coordinates, a_point = self._entry(a_point)
+        except (ValueError, TypeError):
+            return False
+        a_leaf = self._leaf_for(coordinates)
+        return any(an_entry[1] == a_point for an_entry in a_leaf.entries)
+
+    @property
+    def bounds(self):
+        return self.root.bounds
+
+    def _leaf_for(self, coordinates, path=None):
+        a_node = self.root
+        while a_node.children is not None:
+            if path is not None:
+                path.append(a_node)
+            a_node = a_node.children[a_node.child_index(coordinates)]
+        return a_node
+
+    def insert(self, a_point):
+        coordinates, a_point = self._entry(a_point)
+        self._check_bounds(coordinates, a_point)
+        depth_path = []
+        a_leaf = self._leaf_for(coordinates, depth_path)
+        a_leaf.entries.append((coordinates, a_point))
+        self.number_of_points += 1
+        if len(a_leaf.entries) > self.bucket_size:
+            entries, a_leaf.entries = a_leaf.entries, []
+            self._bulk_load(a_leaf, entries, len(depth_path))
+
+    def remove(self, a_point):
+        # like list.remove, the point must be present
+        coordinates, a_point = self._entry(a_point)
+        depth_path = []
+        a_leaf = self._leaf_for(coordinates, depth_path)
+        for i, an_entry in enumerate(a_leaf.entries):
+            if an_entry[1] == a_point:
+                del a_leaf.entries[i]
+                break
+        else:
+            raise ValueError(f"{a_point} is not in {self.__class__.__name__}")
+        self.number_of_points -= 1
+        # merge children back into their parent when they would fit in a single leaf
+        for a_node in reversed(depth_path):
+            if any(a_child.children is not None for a_child in a_node.children) or (
+                sum(len(a_child.entries) for a_child in a_node.children)
+                > self.bucket_size
+            ):
+                break
+            a_node.entries = [
+                an_entry for a_child in a_node.children for an_entry in a_child.entries
+            ]
+            a_node.children = None
+
+    def query(self, a_region):
+        # all the points within a_region, which has half open bounds like a Block
+        lower, upper = self._region_coordinates(a_region)
+        found = []
+        nodes = [self.root]
+        while nodes:
+            a_node = nodes.pop()
+            if not all(
+                a_node_lower < an_upper and a_lower < a_node_upper
+                for a_node_lower, a_node_upper, a_lower, an_upper in zip(
+                    a_node.lower, a_node.upper, lower, upper
+                )
+            ):
+                continue
+            if a_node.children is not None:
+                nodes.extend(a_node.children)
+                continue
+            found.extend(
+                a_point
+                for coordinates, a_point in a_node.entries
+                if all(
+                    a_lower <= c < an_upper
+                    for c, a_lower, an_upper in zip(coordinates, lower, upper)
+                )
+            )
+        return found
+
+    def nearest(self, a_point, k=1):
+        # the k points nearest to a_point, nearest first, found by visiting nodes and
+        # points in order of their distance from a_point
+        coordinates, _ = self._entry(a_point)
+        tie_breaker = count()
+        candidates = [(0.0, next(tie_breaker), self.root, None)]
+        found = []
+        while candidates and len(found) < k:
+            _, _, a_node, a_found_point = heappop(candidates)
+            if a_node is None:
+                found.append(a_found_point)
+            elif a_node.children is not None:
+                for a_child in a_node.children:
+                    heappush(
+                        candidates,
+                        (
+                            a_child.distance_squared(coordinates),
+                            next(tie_breaker),
+                            a_child,
+                            None,
+                        ),
+                    )
+            else:
+                for entry_coordinates, an_entry_point in a_node.entries:
+                    heappush(
+                        candidates,
+                        (
+                            sum(
+                                (a - b) ** 2
+                                for a, b in zip(coordinates, entry_coordinates)
+                            ),
+                            next(tie_breaker),
+                            None,
+                            an_entry_point,
+                        ),
+                    )
+        return found
+
+
+class QuadTree(_PointTree):
+    # a tree of 2D points whose nodes are bounded by Blocks
+    dimensions = 2
+
+    @staticmethod
+    def _make_bounds(lower, upper):
+        return Block(*lower, *upper)
+
+    @staticmethod
+    def _center(a_block):
+        return tuple(a_block.center)
+
+    @staticmethod
+    def _region_coordinates(a_region):
+        a_block = Block(a_region)
+        return (a_block.x_min, a_block.y_min), (a_block.x_max, a_block.y_max)
+
+
+class OcTree(_PointTree):
+    # a tree of 3D points whose nodes are bounded by a Path of their minimum and
+    # maximum corner points
+    dimensions = 3
+
+    @staticmethod
+    def _make_bounds(lower, upper):
+        return Path(Point(*lower), Point(*upper))
+
+    @staticmethod
+    def _center(a_path):
+        return tuple((a_path[0] + a_path[1]) / 2)
+
+    @staticmethod
+    def _region_coordinates(a_region):
+        # any two opposite corners of a box
+        a_corner, another_corner = (tuple(Point(a_point)) for a_point in a_region)
+        return (
+            tuple(map(min, a_corner, another_corner)),
+            tuple(map(max, a_corner, another_corner)),
+        )
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3.10
+
+import unittest
+
+from points.bench.__main__ import (
+    load_benchmarks,
+    run_benchmarks,
+    compare_to_baseline,
+    BENCHMARK_MODULES,
+)
+
+
+class TestBench(unittest.TestCase):
+    def test_every_benchmark_runs(self):
+        benchmarks = load_benchmarks()
+        self.assertTrue(
+            all(a_name.split(".")[0] in BENCHMARK_MODULES for a_name in benchmarks)
+        )
+        results = run_benchmarks(benchmarks, [3], 1)
+        self.assertEqual(set(results), set(benchmarks))
+        for a_name, timings_by_size in results.items():
+            # startup benchmarks have sizes of their own
+            sizes = getattr(benchmarks[a_name], "sizes", [3])
+            self.assertEqual(set(timings_by_size), {str(a_size) for a_size in sizes})
+            self.assertTrue(all(seconds > 0 for seconds in timings_by_size.values()))
+
+    def test_filter(self):
+        results = run_benchmarks(load_benchmarks(), [2], 1, "clip")
+        self.assertTrue(results)
+        self.assertTrue(all("clip" in a_name for a_name in results))
+
+    def test_compare_to_baseline(self):
+        baseline = {"a": {"10": 1.0, "100": 1.0}, "b": {"10": 2.0}}
+        results = {"a": {"10": 1.05, "100": 1.5}, "b": {"10": 1.0}, "c": {"10": 9.0}}
+        regressions = compare_to_baseline(results, baseline, 0.10)
+        self.assertEqual(regressions, [("a", "100", 1.0, 1.5, 1.5)])
+        self.assertEqual(compare_to_baseline(results, baseline, 0.6), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
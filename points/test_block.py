@@ -1,11 +1,24 @@
 #!/usr/bin/env python3.10
 
 import unittest
-from math import pi as π
 from collections.abc import Iterable
+from itertools import chain
+from math import pi as π
+from random import Random
+
+from numpy import array, isnan, zeros
+
 from points import CartesianPoint, PolarPoint
 from points.path import Path
-from points.block import Block, Position, clip_path_to_viewport, ClipException
+from points.path_array import PathArray
+from points.block import (
+    Block,
+    Position,
+    clip_path_to_viewport,
+    clip_segments_to_viewport,
+    liang_barsky_clip,
+    ClipException,
+)
 
 
 class TestBlock(unittest.TestCase):
@@ -288,6 +301,34 @@ class TestBlock(unittest.TestCase):
             & (Position.BELOW_XMIN | Position.ABOVE_XMAX | Position.BELOW_YMIN)
         )
 
+    def test_surrounds_many_and_outcodes(self):
+        b1 = Block(0, 0, 100, 100)
+        points = Path(
+            CartesianPoint(100, 100),
+            CartesianPoint(99, 99),
+            CartesianPoint(0, 0),
+            CartesianPoint(-50, -50),
+            CartesianPoint(0, -50),
+            CartesianPoint(101, 101),
+            CartesianPoint(150, 0),
+            CartesianPoint(0, 150),
+            PolarPoint(50, π / 4),
+            PolarPoint(50, π),
+        )
+        expected_mask = [b1.surrounds(a_point) for a_point in points]
+        expected_codes = [
+            b1.relative_point_position(CartesianPoint(a_point)) for a_point in points
+        ]
+        for some_points in (
+            points,
+            PathArray.from_path(points, CartesianPoint),
+            array([tuple(CartesianPoint(a_point)) for a_point in points]),
+        ):
+            self.assertEqual(b1.surrounds_many(some_points).tolist(), expected_mask)
+            self.assertEqual(b1.outcodes(some_points).tolist(), expected_codes)
+        self.assertEqual(b1.surrounds_many([]).tolist(), [])
+        self.assertRaises(TypeError, b1.outcodes, None)
+
 
 class TestClipping(unittest.TestCase):
     def assertAlmostEqual(self, first, second, places=None, msg=None, delta=None):
@@ -367,6 +408,153 @@ class TestClipping(unittest.TestCase):
         expected_clipped_line_segment = Path(CartesianPoint(0, 5), CartesianPoint(5, 0))
         self.assertAlmostEqual(clipped_line_segment, expected_clipped_line_segment)
 
+    def testLiangBarsky(self):
+        viewport = Block(0, 0, 100, 100)
+        for a_line_segment, expected_clipped_line_segment in (
+            (((10, 10), (90, 90)), ((10, 10), (90, 90))),
+            (((-10, -10), (110, 110)), ((0, 0), (100, 100))),
+            (((-10, 110), (110, -10)), ((0, 100), (100, 0))),
+            (((-10, 50), (110, 50)), ((0, 50), (100, 50))),
+            (((50, -10), (50, 110)), ((50, 0), (50, 100))),
+            (((-10, 15), (15, -10)), ((0, 5), (5, 0))),
+            (((-10, 60), (60, 130)), ((0, 70), (30, 100))),
+            (((50, 50), (50, 50)), ((50, 50), (50, 50))),
+        ):
+            a_line_segment = Path(*(CartesianPoint(p) for p in a_line_segment))
+            clipped_line_segment = clip_path_to_viewport(
+                viewport, a_line_segment, "liang-barsky"
+            )
+            self.assertEqual(clipped_line_segment, expected_clipped_line_segment)
+            self.assertEqual(
+                clipped_line_segment, liang_barsky_clip(viewport, a_line_segment)
+            )
+
+        for a_line_segment in (
+            ((200, 200), (300, 300)),
+            ((-300, 300), (300, 300)),
+            ((-10, 5), (5, -10)),
+            ((150, 150), (150, 150)),
+        ):
+            self.assertRaises(
+                ClipException,
+                clip_path_to_viewport,
+                viewport,
+                Path(*(CartesianPoint(p) for p in a_line_segment)),
+                "liang-barsky",
+            )
+
+    def testUnknownStrategy(self):
+        viewport = Block(0, 0, 100, 100)
+        a_line_segment = Path(CartesianPoint(10, 10), CartesianPoint(90, 90))
+        self.assertRaises(
+            ValueError, clip_path_to_viewport, viewport, a_line_segment, "nope"
+        )
+
+
+class TestBatchClipping(unittest.TestCase):
+    def random_segments(self, number_of_segments, seed=1):
+        a_random = Random(seed)
+        return [
+            Path(
+                CartesianPoint(
+                    a_random.uniform(-150, 250), a_random.uniform(-150, 250)
+                ),
+                CartesianPoint(
+                    a_random.uniform(-150, 250), a_random.uniform(-150, 250)
+                ),
+            )
+            for _ in range(number_of_segments)
+        ]
+
+    def assert_same_as_one_at_a_time(self, viewport, line_segments, clipped, accepted):
+        self.assertEqual(len(clipped), len(line_segments))
+        for a_line_segment, a_clipped_segment, is_accepted in zip(
+            line_segments, clipped, accepted
+        ):
+            try:
+                expected = clip_path_to_viewport(viewport, a_line_segment)
+            except ClipException:
+                self.assertFalse(is_accepted, f"{a_line_segment} should be rejected")
+                self.assertTrue(isnan(a_clipped_segment).all())
+                continue
+            self.assertTrue(is_accepted, f"{a_line_segment} should be accepted")
+            self.assertEqual(tuple(map(tuple, a_clipped_segment.tolist())), expected)
+
+    def test_matches_clip_path_to_viewport(self):
+        viewport = Block(0, 0, 100, 100)
+        line_segments = self.random_segments(2000)
+        clipped, accepted = clip_segments_to_viewport(viewport, line_segments)
+        self.assertTrue(accepted.any())
+        self.assertFalse(accepted.all())
+        self.assert_same_as_one_at_a_time(viewport, line_segments, clipped, accepted)
+
+    def test_liang_barsky_matches_one_at_a_time(self):
+        viewport = Block(0, 0, 100, 100)
+        line_segments = self.random_segments(2000, seed=3)
+        clipped, accepted = clip_segments_to_viewport(
+            viewport, line_segments, "liang-barsky"
+        )
+        for a_line_segment, a_clipped_segment, is_accepted in zip(
+            line_segments, clipped, accepted
+        ):
+            try:
+                expected = liang_barsky_clip(viewport, a_line_segment)
+            except ClipException:
+                self.assertFalse(is_accepted, f"{a_line_segment} should be rejected")
+                continue
+            self.assertTrue(is_accepted, f"{a_line_segment} should be accepted")
+            self.assertEqual(tuple(map(tuple, a_clipped_segment.tolist())), expected)
+            for x, y in expected:
+                self.assertTrue(0 <= x <= 100 and 0 <= y <= 100)
+
+    def test_buffer_input(self):
+        viewport = Block(10, 20, 300, 200)
+        line_segments = self.random_segments(500, seed=2)
+        a_buffer = array([tuple(chain(*s)) for s in line_segments])
+        self.assertEqual(a_buffer.shape, (500, 4))
+        clipped, accepted = clip_segments_to_viewport(viewport, a_buffer)
+        self.assert_same_as_one_at_a_time(viewport, line_segments, clipped, accepted)
+
+    def test_consecutive_points(self):
+        viewport = Block(0, 0, 100, 100)
+        a_path = Path(
+            CartesianPoint(-10, 50),
+            CartesianPoint(50, 50),
+            PolarPoint(200, π / 4),
+            CartesianPoint(300, 300),
+        )
+        clipped, accepted = clip_segments_to_viewport(viewport, a_path)
+        self.assertEqual(accepted.tolist(), [True, True, False])
+        self.assertEqual(clipped[0].tolist(), [[0, 50], [50, 50]])
+        self.assertEqual(clipped[1].tolist(), [[50, 50], [100, 100]])
+
+        # an (N, 2) array is consecutive points too, not N / 2 segments
+        clipped, accepted = clip_segments_to_viewport(
+            viewport, array([(-10, 50), (50, 50), (50, 150), (300, 300)])
+        )
+        self.assertEqual(accepted.tolist(), [True, True, False])
+        self.assertEqual(clipped[1].tolist(), [[50, 50], [50, 100]])
+        clipped, accepted = clip_segments_to_viewport(
+            viewport, array([(0, 0), (10, 10), (20, 20)])
+        )
+        self.assertEqual(accepted.tolist(), [True, True])
+
+    def test_unrecognized_array_shapes(self):
+        for a_shape in ((3, 3), (3,), (2, 3, 2)):
+            self.assertRaises(
+                ValueError,
+                clip_segments_to_viewport,
+                Block(0, 0, 100, 100),
+                zeros(a_shape),
+            )
+
+    def test_empty(self):
+        clipped, accepted = clip_segments_to_viewport(
+            Block(0, 0, 100, 100), zeros((0, 2, 2))
+        )
+        self.assertEqual(clipped.shape, (0, 2, 2))
+        self.assertEqual(accepted.shape, (0,))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,7 @@ import unittest
 from collections.abc import Iterable
 from math import pi as π
 
-from points import Vector, CartesianPoint, IntPoint, PolarPoint
+from points import Vector, CartesianPoint, IntPoint, PolarPoint, Path
 
 
 class TestConversions(unittest.TestCase):
@@ -243,6 +243,72 @@ class TestConversions(unittest.TestCase):
         pp1 = PolarPoint(10, π / 3.0)
         self.assertRaises(TypeError, pp1.as_my_type, cp1)
 
+    def test_cached_cartesian_counterpart(self):
+        pp = PolarPoint(10, π / 3)
+        cp = pp.as_cartesian()
+        self.assertTrue(pp.as_cartesian() is cp)
+        self.assertTrue(CartesianPoint(pp) is cp)
+        self.assertTrue(CartesianPoint.as_my_type(pp) is cp)
+        self.assertEqual(pp.as_cartesian(IntPoint), (5, 9))
+        self.assertTrue(pp.as_cartesian(IntPoint).__class__ is IntPoint)
+
+        # a polar point made from a cartesian point starts out knowing it
+        cp = CartesianPoint(3, 4)
+        pp = PolarPoint(cp)
+        self.assertTrue(pp.as_cartesian() is cp)
+
+        # arithmetic results are the same with or without the cache
+        pp1 = PolarPoint(7, 0.25)
+        pp2 = PolarPoint(3, -2.0)
+        cached_sum = pp1 + pp2 + cp
+        PolarPoint.cache_conversions = False
+        try:
+            pp = PolarPoint(10, π / 3)
+            self.assertTrue(pp.as_cartesian() is not pp.as_cartesian())
+            self.assertTrue(PolarPoint(cp).as_cartesian() is not cp)
+            uncached_sum = PolarPoint(7, 0.25) + PolarPoint(3, -2.0) + cp
+        finally:
+            PolarPoint.cache_conversions = True
+        self.assertAlmostEqual(cached_sum, uncached_sum)
+
+    def test_as_cartesian_many(self):
+        polar_points = [PolarPoint(i, i * π / 7) for i in range(20)]
+        polar_points_3D = [PolarPoint(i, i * π / 7, i * π / 11) for i in range(20)]
+        for some_polar_points in (polar_points, polar_points_3D):
+            a_path = PolarPoint.as_cartesian_many(some_polar_points)
+            self.assertTrue(isinstance(a_path, Path))
+            self.assertEqual(len(a_path), len(some_polar_points))
+            for a_point, a_polar_point in zip(a_path, some_polar_points):
+                self.assertTrue(a_point.__class__ is CartesianPoint)
+                self.assertAlmostEqual(a_point, a_polar_point.as_cartesian())
+
+        a_buffer = PolarPoint.as_cartesian_many(iter(polar_points), as_buffer=True)
+        self.assertEqual(a_buffer.shape, (20, 2))
+        self.assertAlmostEqual(a_buffer[3], polar_points[3].as_cartesian())
+
+        a_path = PolarPoint.as_cartesian_many(polar_points, IntPoint)
+        self.assertEqual(a_path, Path(p.as_cartesian(IntPoint) for p in polar_points))
+
+    def test_as_polar_many(self):
+        cartesian_points = [CartesianPoint(i - 10, 3 * i - 5) for i in range(20)]
+        cartesian_points_3D = [CartesianPoint(i - 10, 3 * i, -i) for i in range(20)]
+        for some_cartesian_points in (cartesian_points, cartesian_points_3D):
+            a_path = PolarPoint.as_polar_many(some_cartesian_points)
+            self.assertTrue(isinstance(a_path, Path))
+            for a_point, a_cartesian_point in zip(a_path, some_cartesian_points):
+                self.assertTrue(a_point.__class__ is PolarPoint)
+                self.assertAlmostEqual(a_point, PolarPoint.as_polar(a_cartesian_point))
+
+        a_buffer = PolarPoint.as_polar_many(cartesian_points, as_buffer=True)
+        self.assertEqual(a_buffer.shape, (20, 2))
+        round_trip = PolarPoint.as_cartesian_many(a_buffer)
+        for a_point, a_cartesian_point in zip(round_trip, cartesian_points):
+            self.assertAlmostEqual(a_point, a_cartesian_point)
+
+    def test_batch_conversion_failures(self):
+        self.assertRaises(TypeError, PolarPoint.as_polar_many, [(1, 2, 3, 4)])
+        self.assertRaises(TypeError, PolarPoint.as_cartesian_many, [(1,)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3.10
+
+import unittest
+
+from points.geometry import distance_to_segment
+
+
+class TestGeometry(unittest.TestCase):
+    def test_distance_to_segment(self):
+        # beside the segment, and beyond either of its ends
+        self.assertEqual(distance_to_segment((5, 3), (0, 0), (10, 0)), 3)
+        self.assertEqual(distance_to_segment((-3, 4), (0, 0), (10, 0)), 5)
+        self.assertEqual(distance_to_segment((13, -4), (0, 0), (10, 0)), 5)
+        # any number of dimensions
+        self.assertEqual(distance_to_segment((1, 1, 2), (0, 0, 0), (2, 2, 0)), 2)
+        # a segment of no length is a point
+        self.assertEqual(distance_to_segment((3, 4), (0, 0), (0, 0)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3.10
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from math import pi as π
+
+from points import Vector, CartesianPoint, IntPoint, PolarPoint, Path
+from points.block import Block, clip_path_to_viewport, ClipException
+from points.instrumentation import (
+    instrumented,
+    is_enabled,
+    enable,
+    disable,
+    reset,
+    snapshot,
+)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_counts_by_class(self):
+        with instrumented() as a_snapshot:
+            Path(PolarPoint(1, 0), PolarPoint(2, π / 2)) + CartesianPoint(1, 1)
+            IntPoint(1.2, 3.4)
+            self.assertTrue(is_enabled())
+            counts = a_snapshot()["counts"]
+        self.assertFalse(is_enabled())
+
+        self.assertEqual(counts["Vector.__new__"]["IntPoint"], 1)
+        self.assertEqual(counts["IntPoint._judge_candidate_value"]["IntPoint"], 2)
+        self.assertEqual(counts["Path._operation"]["Path"], 1)
+        # each PolarPoint member goes to cartesian and back
+        self.assertEqual(counts["PolarPoint.as_cartesian"]["PolarPoint"], 2)
+        self.assertEqual(counts["PolarPoint._as_polar"]["PolarPoint"], 2)
+        self.assertTrue("seconds" not in a_snapshot())
+
+    def test_clip_exceptions_and_timing(self):
+        reset()
+        with instrumented(timed=True) as a_snapshot:
+            for _ in range(3):
+                try:
+                    clip_path_to_viewport(
+                        Block(0, 0, 10, 10),
+                        Path(CartesianPoint(-5, -5), CartesianPoint(-1, -1)),
+                    )
+                except ClipException:
+                    pass
+        self.assertEqual(a_snapshot()["counts"]["ClipException"]["ClipException"], 3)
+        self.assertTrue(a_snapshot()["seconds"]["Block.__new__"]["Block"] >= 0)
+        # the snapshot is kept after disabling, until reset
+        reset()
+        self.assertEqual(snapshot(), {"counts": {}})
+
+    def test_nesting_keeps_earlier_state(self):
+        reset()
+        enable(timed=True)
+        try:
+            IntPoint(1, 2)
+            with instrumented() as a_snapshot:
+                IntPoint(1, 2)
+                self.assertEqual(
+                    a_snapshot()["counts"]["Vector.__new__"]["IntPoint"], 1
+                )
+                self.assertTrue("seconds" not in a_snapshot())
+            # still enabled and timed, counting on from before the with block
+            self.assertTrue(is_enabled())
+            earlier_seconds = snapshot()["seconds"]["Vector.__new__"]["IntPoint"]
+            IntPoint(1, 2)
+            self.assertEqual(snapshot()["counts"]["Vector.__new__"]["IntPoint"], 3)
+            self.assertTrue(
+                snapshot()["seconds"]["Vector.__new__"]["IntPoint"] > earlier_seconds
+            )
+        finally:
+            disable()
+            reset()
+
+        with instrumented():
+            pass
+        self.assertFalse(is_enabled())
+
+    def test_disable_restores_originals(self):
+        originals = {
+            a_name: a_class.__dict__.get(a_name)
+            for a_class, a_name in (
+                (Vector, "__new__"),
+                (Vector, "_from_trusted"),
+                (IntPoint, "_judge_candidate_value"),
+                (PolarPoint, "as_polar"),
+                (ClipException, "__init__"),
+            )
+        }
+        enable()
+        enable(timed=True)
+        self.assertFalse(Vector.__dict__["__new__"] is originals["__new__"])
+        disable()
+        self.assertTrue(Vector.__dict__["__new__"] is originals["__new__"])
+        self.assertTrue(Vector.__dict__["_from_trusted"] is originals["_from_trusted"])
+        self.assertTrue(
+            IntPoint.__dict__["_judge_candidate_value"]
+            is originals["_judge_candidate_value"]
+        )
+        self.assertTrue(PolarPoint.__dict__["as_polar"] is originals["as_polar"])
+        self.assertTrue("__init__" not in ClipException.__dict__)
+        self.assertEqual(IntPoint(1.2, 3.4) + 1, (2, 4))
+
+    def test_environment_variable(self):
+        a_script = (
+            "from points import CartesianPoint, PolarPoint\n"
+            "PolarPoint(CartesianPoint(1, 1))\n"
+        )
+        a_result = subprocess.run(
+            [sys.executable, "-c", a_script],
+            env=dict(os.environ, POINTS_INSTRUMENTATION="1"),
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.assertEqual(a_result.returncode, 0, a_result.stderr)
+        counts = json.loads(a_result.stderr)["counts"]
+        self.assertEqual(counts["PolarPoint._as_polar"]["PolarPoint"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
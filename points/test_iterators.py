@@ -2,14 +2,26 @@
 
 import unittest
 from collections.abc import Iterable
+from bisect import bisect
 from itertools import zip_longest
 from math import pi as π
 
+from numpy import ndarray
+
+from points.geometry import distance_to_segment
+
 from points import (
+    Vector,
+    no_consectutive_repeats_iter,
     CartesianPoint,
     IntPoint,
     PolarPoint,
     iter_linear_steps_between,
+    iter_linear_chunks_between,
+    iter_natural_steps_between,
+    iter_natural_cartesian_steps_between,
+    iter_adaptive_steps,
+    iter_adaptive_natural_steps_between,
     Path,
 )
 
@@ -135,6 +147,214 @@ class TestIters(unittest.TestCase):
         for p1, e1 in zip(ppath1, expected_result_PolarPoint_sequence):
             self.assertAlmostEqual(p1, e1)
 
+    def test_iter_natural_cartesian_steps(self):
+        u = 2**-53
+        for start_point, end_point, resynchronize_every in (
+            (PolarPoint(337.5, 0), PolarPoint(0, 100 * π), 64),
+            (PolarPoint(10, -3), PolarPoint(1000, 20 * π), 7),
+            (PolarPoint(10, 0.5, 0.1), PolarPoint(500, 40 * π, 7), 64),
+        ):
+            expected_points = [
+                p.as_cartesian()
+                for p in iter_natural_steps_between(start_point, end_point, 3000)
+            ]
+            points = list(
+                iter_natural_cartesian_steps_between(
+                    start_point,
+                    end_point,
+                    3000,
+                    resynchronize_every=resynchronize_every,
+                )
+            )
+            self.assertEqual(len(points), len(expected_points))
+            # the documented error bound
+            ρ_max = max(abs(start_point.ρ), abs(end_point.ρ))
+            θ_max = max(abs(start_point.θ), abs(end_point.θ))
+            error_bound = (
+                ρ_max
+                * (4 * resynchronize_every + 8 + 2 * θ_max)
+                * u
+                * (len(start_point) - 1)
+            )
+            for a_point, expected_point in zip(points, expected_points):
+                self.assertTrue(a_point.__class__ is CartesianPoint)
+                for a, b in zip(a_point, expected_point):
+                    self.assertTrue(
+                        abs(a - b) <= error_bound, f"{a_point} {expected_point}"
+                    )
+
+    def test_iter_natural_cartesian_steps_target_type(self):
+        points = list(
+            iter_natural_cartesian_steps_between(
+                PolarPoint(10, 0), PolarPoint(10, π), 4, IntPoint
+            )
+        )
+        self.assertEqual(points, [(10, 0), (7, 7), (0, 10), (-7, 7)])
+        self.assertTrue(all(p.__class__ is IntPoint for p in points))
+        self.assertRaises(
+            TypeError,
+            list,
+            iter_natural_cartesian_steps_between(PolarPoint(1), PolarPoint(2), 4),
+        )
+
+    def test_iter_adaptive_natural_steps(self):
+        start_point, end_point = PolarPoint(300, 0), PolarPoint(0, 20 * π)
+        points = list(iter_adaptive_natural_steps_between(start_point, end_point, 0.5))
+        self.assertEqual(points[0], start_point)
+        self.assertEqual(points[-1], end_point)
+        self.assertTrue(all(p.__class__ is PolarPoint for p in points))
+
+        # ρ shrinks steadily along the curve, so it tells where each point is on it
+        adaptive_ts = [(300 - ρ) / 300 for ρ, θ in points]
+        self.assertEqual(adaptive_ts, sorted(adaptive_ts))
+        # every point of a dense sampling of the curve is within the bound of the
+        # line segment that stands in for its part of the curve
+        number_of_iterations = 4000
+        for i, p in enumerate(
+            iter_natural_steps_between(start_point, end_point, number_of_iterations)
+        ):
+            a_segment = bisect(adaptive_ts, i / number_of_iterations) - 1
+            self.assertTrue(
+                distance_to_segment(
+                    p.as_cartesian(),
+                    points[a_segment].as_cartesian(),
+                    points[a_segment + 1].as_cartesian(),
+                )
+                <= 0.5
+            )
+        # even steps would need a step short enough for the outermost loop everywhere
+        self.assertTrue(len(points) < 450)
+
+        # straight lines take a single step
+        self.assertEqual(
+            list(
+                iter_adaptive_natural_steps_between(
+                    CartesianPoint(0, 0), CartesianPoint(10, 5), 0.1, IntPoint
+                )
+            ),
+            [IntPoint(0, 0), IntPoint(10, 5)],
+        )
+        self.assertRaises(
+            ValueError,
+            list,
+            iter_adaptive_natural_steps_between(PolarPoint(1, 0), PolarPoint(2, 1), 0),
+        )
+
+    def test_iter_adaptive_steps(self):
+        # a parabola is sampled more finely where it bends the most
+        points = list(
+            iter_adaptive_steps(
+                lambda t: CartesianPoint(200 * t - 100, (200 * t - 100) ** 2 / 100),
+                0.25,
+            )
+        )
+        self.assertEqual((points[0], points[-1]), ((-100, 100), (100, 100)))
+        steps = [second[0] - first[0] for first, second in zip(points, points[1:])]
+        self.assertTrue(steps[len(steps) // 2] < min(steps[0], steps[-1]))
+        # four times around a circle looks like a single point when only sampled at
+        # every quarter of the way, minimum_steps keeps the steps short enough
+        a_circle = lambda t: PolarPoint(10, 8 * π * t)
+        self.assertEqual(len(list(iter_adaptive_steps(a_circle, 1))), 2)
+        self.assertTrue(len(list(iter_adaptive_steps(a_circle, 1, 16))) > 16)
+
+    def test_iter_linear_chunks(self):
+        for start_point, end_point, iterations in (
+            (CartesianPoint(0, 0), CartesianPoint(100, 150), 10),
+            (IntPoint(0, 0), IntPoint(10, 10), 7),
+            (CartesianPoint(1, 2), PolarPoint(5, 1), 9),
+            (PolarPoint(337.5, 0), PolarPoint(0, 4.0 * π), 11),
+            (Vector(1, 2, 3), Vector(5, 2, 0), 5),
+        ):
+            expected_points = list(
+                iter_linear_steps_between(start_point, end_point, iterations)
+            )
+            chunks = list(
+                iter_linear_chunks_between(
+                    start_point, end_point, iterations, chunk_size=4
+                )
+            )
+            self.assertEqual([len(a_chunk) for a_chunk in chunks][0], 4)
+            self.assertTrue(
+                all(a_chunk.point_class is start_point.__class__ for a_chunk in chunks)
+            )
+            points = [a_point for a_chunk in chunks for a_point in a_chunk]
+            self.assertEqual(len(points), len(expected_points))
+            for a_point, expected_point in zip(points, expected_points):
+                self.assertTrue(a_point.__class__ is expected_point.__class__)
+                self.assertAlmostEqual(a_point, expected_point)
+
+    def test_iter_linear_chunks_of_scalars_and_buffers(self):
+        chunks = list(iter_linear_chunks_between(1, 10, 4, chunk_size=3))
+        self.assertTrue(all(isinstance(a_chunk, ndarray) for a_chunk in chunks))
+        self.assertAlmostEqual(
+            [n for a_chunk in chunks for n in a_chunk],
+            iter_linear_steps_between(1, 10, 4),
+        )
+
+        buffers = list(
+            iter_linear_chunks_between(
+                PolarPoint(10, 0),
+                PolarPoint(10, π),
+                5,
+                target_class=IntPoint,
+                as_buffer=True,
+            )
+        )
+        self.assertEqual(len(buffers), 1)
+        self.assertTrue(isinstance(buffers[0], ndarray))
+        self.assertEqual(buffers[0].shape, (5, 2))
+        self.assertEqual(
+            buffers[0].tolist(),
+            [
+                list(IntPoint(p))
+                for p in iter_linear_steps_between(
+                    PolarPoint(10, 0), PolarPoint(10, π), 5
+                )
+            ],
+        )
+
+    def test_no_consecutive_repeats(self):
+        values = [1, 1, 2, 2, 2, 1, 3, 3]
+        self.assertEqual(list(no_consectutive_repeats_iter(values)), [1, 2, 1, 3])
+
+        points = [
+            CartesianPoint(0, 0),
+            CartesianPoint(0.3, 0.1),
+            CartesianPoint(0.6, 0.2),
+            CartesianPoint(1.2, 0.2),
+            CartesianPoint(1.2, 0.2),
+            CartesianPoint(1.3, 2.0),
+        ]
+        # compared to the last point yielded, so slow drift is still caught
+        self.assertEqual(
+            list(no_consectutive_repeats_iter(points, epsilon=0.5)),
+            [points[0], points[2], points[3], points[5]],
+        )
+        # the cells of a grid work like pixels
+        self.assertEqual(
+            list(no_consectutive_repeats_iter(points, grid=1)),
+            [points[0], points[3], points[5]],
+        )
+        # structures of points, like pairs of PolarPoints, compare their cartesian
+        # coordinates
+        pairs = [
+            (PolarPoint(1, 0), PolarPoint(1, π)),
+            (PolarPoint(1, 0.001), PolarPoint(1, π)),
+            (PolarPoint(1, π / 2), PolarPoint(1, π)),
+        ]
+        self.assertEqual(
+            list(no_consectutive_repeats_iter(pairs, epsilon=0.01)),
+            [pairs[0], pairs[2]],
+        )
+        self.assertRaises(
+            ValueError, list, no_consectutive_repeats_iter(points, epsilon=1, grid=1)
+        )
+        # strings have no coordinates, however they are nested
+        for some_values in (["ab", "cd"], [("a", 1), ("b", 2)]):
+            self.assertRaises(
+                TypeError, list, no_consectutive_repeats_iter(some_values, epsilon=1)
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3.10
+
+import subprocess
+import sys
+import unittest
+from importlib import import_module
+from os import environ, path
+
+import points
+
+
+class TestPackage(unittest.TestCase):
+    def test_public_names(self):
+        for a_name, a_module_name in points._PUBLIC_NAMES.items():
+            self.assertTrue(
+                getattr(points, a_name) is getattr(import_module(a_module_name), a_name)
+            )
+        self.assertTrue(set(points.__all__) <= set(dir(points)))
+        self.assertRaises(AttributeError, getattr, points, "NotAPoint")
+        with self.assertRaises(ImportError):
+            from points import NotAPoint
+
+    def test_only_the_modules_used_are_imported(self):
+        a_program = (
+            "import sys\n"
+            "from points import CartesianPoint\n"
+            "print(sorted(m for m in sys.modules if m.startswith('points')))\n"
+            "from points.polar import PolarPoint\n"
+            "print(PolarPoint(CartesianPoint(0, 2)))\n"
+            "from points import *\n"
+            "print('points.instrumentation' in sys.modules)\n"
+        )
+        an_output = subprocess.run(
+            [sys.executable, "-c", a_program],
+            env=dict(
+                environ,
+                PYTHONPATH=path.dirname(path.dirname(path.abspath(points.__file__))),
+                POINTS_INSTRUMENTATION="",
+            ),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+        self.assertEqual(
+            an_output,
+            [
+                "['points', 'points.cartesian', 'points.vector']",
+                "(2.0, 1.5707963267948966)",
+                "False",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@ from collections.abc import Iterable
 from math import pi as π
 from points import Vector, CartesianPoint, PolarPoint, iter_linear_steps_between
 
-from points.path import Path
+from points.path import Path, LazyPath
 
 
 class TestPath(unittest.TestCase):
@@ -160,6 +160,63 @@ class TestPath(unittest.TestCase):
         )
         self.assertEqual((x.__class__ for x in path2), cycle((CartesianPoint,)))
 
+    def test_lazy_matches_eager(self):
+        cartesian_path = Path(
+            iter_linear_steps_between(CartesianPoint(0, 0), CartesianPoint(100, 150), 5)
+        )
+        polar_path = Path(
+            iter_linear_steps_between(PolarPoint(1, 0), PolarPoint(50, 2 * π), 7)
+        )
+        for a_path in (cartesian_path, polar_path):
+            for an_expression in (
+                lambda p: p + polar_path + CartesianPoint(10, 10),
+                lambda p: -(p * 2 - cartesian_path) / 3,
+                lambda p: p // 7 + (n for n in range(1, 4)),
+                lambda p: p + cartesian_path.lazy() * PolarPoint(1, π / 3),
+            ):
+                expected = an_expression(a_path)
+                lazy_result = an_expression(a_path.lazy())
+                self.assertTrue(isinstance(lazy_result, LazyPath))
+                result = lazy_result.evaluate()
+                self.assertTrue(isinstance(result, Path))
+                super().assertEqual(len(result), len(expected))
+                for a_point, expected_point in zip(result, expected):
+                    self.assertTrue(a_point.__class__ is expected_point.__class__)
+                    self.assertAlmostEqual(a_point, expected_point)
+                # evaluating again gives the same result
+                self.assertAlmostEqual(lazy_result.evaluate(), result)
+                self.assertAlmostEqual(
+                    lazy_result.as_cartesian(), map(CartesianPoint, expected)
+                )
+
+    def test_lazy_is_deferred(self):
+        a_path = Path(CartesianPoint(1, 2), CartesianPoint(3, 4))
+        divided_by_zero = a_path.lazy() / 0
+        self.assertRaises(ZeroDivisionError, divided_by_zero.evaluate)
+        self.assertRaises(TypeError, lambda: a_path.lazy() + None)
+        self.assertAlmostEqual(list(a_path.lazy() + 1), ((2, 3), (4, 5)))
+
+    def test_simplify(self):
+        a_path = Path(
+            *iter_linear_steps_between(
+                CartesianPoint(0, 0), CartesianPoint(100, 0), 50
+            ),
+            *iter_linear_steps_between(
+                CartesianPoint(100, 0), CartesianPoint(100, 100), 50
+            ),
+            CartesianPoint(100, 100),
+        )
+        for a_method in ("rdp", "visvalingam"):
+            simplified = a_path.simplify(0.1, a_method)
+            self.assertTrue(isinstance(simplified, Path))
+            super().assertEqual(tuple(simplified), ((0, 0), (100, 0), (100, 100)))
+        # PolarPoints are simplified by their cartesian coordinates, but kept as they are
+        a_polar_path = Path(PolarPoint(1, 0), PolarPoint(2, 0), PolarPoint(3, 0))
+        simplified = a_polar_path.simplify(0.1)
+        super().assertEqual(tuple(simplified), (PolarPoint(1, 0), PolarPoint(3, 0)))
+        self.assertTrue(all(isinstance(p, PolarPoint) for p in simplified))
+        self.assertRaises(ValueError, a_path.simplify, 1, "bogus")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3.10
+
+import unittest
+from collections.abc import Iterable
+from math import pi as π
+
+from numpy import array, asarray, ndarray
+
+from points import (
+    Vector,
+    CartesianPoint,
+    IntPoint,
+    PolarPoint,
+    iter_linear_steps_between,
+    iter_natural_steps_between,
+    no_consectutive_repeats_iter,
+)
+from points.path import Path
+from points.path_array import PathArray
+
+
+class TestPathArray(unittest.TestCase):
+    def assertAlmostEqual(self, first, second, places=None, msg=None, delta=None):
+        # extend assertAlmostEqual to work with types based on Iterable
+        match first, second:
+            case [Iterable(), Iterable()]:
+                first, second = tuple(first), tuple(second)
+                super().assertEqual(len(first), len(second))
+                for i, (first_element, second_element) in enumerate(zip(first, second)):
+                    try:
+                        self.assertAlmostEqual(
+                            first_element, second_element, places, msg, delta
+                        )
+                    except Exception as x:
+                        raise AssertionError(
+                            f"item #{i}, {first_element}, {second_element}: {str(x)}"
+                        )
+            case _:
+                super().assertAlmostEqual(first, second, places, msg, delta)
+
+    def cartesian_path(self):
+        return Path(
+            iter_linear_steps_between(CartesianPoint(0, 0), CartesianPoint(100, 150), 5)
+        )
+
+    def polar_path(self):
+        return Path(
+            iter_natural_steps_between(PolarPoint(1, 0), PolarPoint(50, 4 * π), 7)
+        )
+
+    def test_round_trip(self):
+        for a_path in (
+            self.cartesian_path(),
+            self.polar_path(),
+            Path(IntPoint(1, 2), IntPoint(3, 4)),
+        ):
+            a_path_array = PathArray.from_path(a_path)
+            self.assertEqual(len(a_path_array), len(a_path))
+            self.assertTrue(a_path_array.point_class is a_path[0].__class__)
+            round_tripped = a_path_array.as_path()
+            self.assertTrue(isinstance(round_tripped, Path))
+            self.assertEqual(round_tripped, a_path)
+            for a_point, an_original in zip(round_tripped, a_path):
+                self.assertTrue(a_point.__class__ is an_original.__class__)
+
+    def test_shape_and_indexing(self):
+        a_path_array = PathArray.from_path(self.cartesian_path())
+        self.assertEqual(a_path_array.coordinates.shape, (5, 2))
+        self.assertEqual(a_path_array.dimensions, 2)
+        self.assertEqual(a_path_array[1], CartesianPoint(20, 30))
+        self.assertTrue(isinstance(a_path_array[1], CartesianPoint))
+        a_slice = a_path_array[1:3]
+        self.assertTrue(isinstance(a_slice, PathArray))
+        self.assertEqual(len(a_slice), 2)
+        self.assertTrue(a_slice.coordinates.base is a_path_array.coordinates)
+        self.assertTrue(isinstance(array(a_path_array), ndarray))
+
+    def test_mixed_members_are_converted(self):
+        a_path_array = PathArray.from_path(
+            (CartesianPoint(1, 0), PolarPoint(2, π / 2)), CartesianPoint
+        )
+        self.assertAlmostEqual(a_path_array, ((1, 0), (0, 2)))
+        self.assertRaises(
+            ValueError,
+            PathArray.from_path,
+            (CartesianPoint(1, 0), CartesianPoint(1, 2, 3)),
+        )
+
+    def test_operators_match_path(self):
+        operands = (
+            2,
+            0.5,
+            CartesianPoint(3, -4),
+            PolarPoint(10, π / 3),
+            self.cartesian_path() + 1,
+            self.polar_path(),
+            # plain iterables and arrays of scalars pair one scalar with each member
+            (10, 20),
+            array([5, 6, 7, 8, 9, 10]),
+        )
+        for a_path in (self.cartesian_path(), self.polar_path()):
+            a_path_array = PathArray.from_path(a_path)
+            for an_operand in operands:
+                for an_operation in (
+                    lambda a, b: a + b,
+                    lambda a, b: a - b,
+                    lambda a, b: a * b,
+                    lambda a, b: a / b,
+                ):
+                    if isinstance(an_operand, Path) and an_operation(4, 2) == 2:
+                        # paths include components of zero
+                        continue
+                    expected = an_operation(a_path, an_operand)
+                    result = an_operation(a_path_array, an_operand)
+                    self.assertTrue(isinstance(result, PathArray))
+                    self.assertTrue(result.point_class is expected[0].__class__)
+                    self.assertAlmostEqual(
+                        result.as_cartesian(), map(CartesianPoint, expected)
+                    )
+
+    def test_division_by_zero(self):
+        a_path_array = PathArray.from_path(self.cartesian_path())
+        for a_zero in (0, CartesianPoint(1, 0), (1, 0), array([2, 0])):
+            self.assertRaises(ZeroDivisionError, a_path_array.__truediv__, a_zero)
+            self.assertRaises(ZeroDivisionError, a_path_array.__floordiv__, a_zero)
+
+    def test_array_copies(self):
+        a_path_array = PathArray.from_path(self.cartesian_path())
+        an_array = array(a_path_array)
+        an_array[0, 0] = 99
+        self.assertNotEqual(a_path_array.coordinates[0, 0], 99)
+        self.assertTrue(asarray(a_path_array) is a_path_array.coordinates)
+        self.assertEqual(array(a_path_array, dtype=int).dtype, int)
+        self.assertRaises(ValueError, array, a_path_array, dtype=int, copy=False)
+
+    def test_operators_with_path_arrays(self):
+        a_path = self.cartesian_path()
+        another_path = self.polar_path()
+        result = PathArray.from_path(a_path) + PathArray.from_path(another_path)
+        self.assertAlmostEqual(result, a_path + another_path)
+
+    def test_floordiv_pow_and_negation(self):
+        a_path = self.cartesian_path()
+        a_path_array = PathArray.from_path(a_path)
+        self.assertAlmostEqual(a_path_array // 7, a_path // 7)
+        self.assertAlmostEqual(a_path_array**2, a_path**2)
+        self.assertAlmostEqual(-a_path_array, -a_path)
+
+        a_polar_path = self.polar_path()
+        self.assertAlmostEqual(
+            (-PathArray.from_path(a_polar_path)).as_cartesian(),
+            map(CartesianPoint, -a_polar_path),
+        )
+
+    def test_intpoint_arithmetic_rounds(self):
+        a_path = Path(IntPoint(1, 2), IntPoint(3, 5))
+        result = PathArray.from_path(a_path) / 2
+        self.assertEqual(result.as_path(), a_path / 2)
+        self.assertTrue(all(isinstance(p, IntPoint) for p in result))
+
+    def test_judging_classes_judge_results(self):
+        class ClampedPoint(CartesianPoint):
+            @staticmethod
+            def _judge_candidate_value(a_potential_scalar):
+                return min(max(a_potential_scalar, 0), 100)
+
+        a_path = Path(ClampedPoint(50, 50), ClampedPoint(10, 90))
+        a_path_array = PathArray.from_path(a_path)
+        self.assertEqual((a_path_array + 200).as_path(), a_path + 200)
+        self.assertEqual((a_path_array + 200)[0], (100, 100))
+        self.assertEqual((-a_path_array).as_path(), -a_path)
+        self.assertEqual((-a_path_array)[1], (0, 0))
+
+    def test_vector_arithmetic_is_componentwise(self):
+        a_path = Path(Vector(1, 2), Vector(3, 4))
+        result = PathArray.from_path(a_path) + PolarPoint(1, π)
+        self.assertEqual(result.as_path(), a_path + PolarPoint(1, π))
+
+    def test_disallowed(self):
+        a_path_array = PathArray.from_path(self.cartesian_path())
+        self.assertRaises(TypeError, lambda: a_path_array + None)
+        self.assertRaises(TypeError, PathArray, ((1, 2),), int)
+
+    def test_without_consecutive_repeats(self):
+        a_path = Path(
+            iter_natural_steps_between(PolarPoint(1, 0), PolarPoint(50, 8 * π), 3000)
+        )
+        a_path_array = PathArray.from_path(a_path)
+        for settings in ({}, {"epsilon": 0.75}, {"grid": 1}, {"grid": 2.5}):
+            result = a_path_array.without_consecutive_repeats(**settings)
+            self.assertTrue(result.point_class is PolarPoint)
+            expected = list(no_consectutive_repeats_iter(a_path, **settings))
+            self.assertEqual(len(result), len(expected))
+            self.assertAlmostEqual(result.coordinates, expected)
+        self.assertTrue(
+            len(a_path_array.without_consecutive_repeats(grid=1)) < len(a_path)
+        )
+
+        with_repeats = PathArray(((1, 2), (1, 2), (3, 4), (3, 4), (1, 2)))
+        self.assertEqual(
+            with_repeats.without_consecutive_repeats().coordinates.tolist(),
+            [[1, 2], [3, 4], [1, 2]],
+        )
+        self.assertEqual(len(PathArray(()).without_consecutive_repeats(grid=1)), 0)
+        self.assertRaises(
+            ValueError, with_repeats.without_consecutive_repeats, epsilon=1, grid=1
+        )
+
+    def test_simplify(self):
+        a_path = Path(
+            iter_natural_steps_between(PolarPoint(1, 0), PolarPoint(300, 6 * π), 5000)
+        )
+        a_path_array = PathArray.from_path(a_path)
+        for a_method, a_tolerance in (("rdp", 0.5), ("visvalingam", 0.5)):
+            expected = a_path.simplify(a_tolerance, a_method)
+            result = a_path_array.simplify(a_tolerance, a_method)
+            self.assertTrue(result.point_class is PolarPoint)
+            self.assertTrue(len(result) < len(a_path) / 5)
+            self.assertEqual(len(result), len(expected))
+            self.assertAlmostEqual(result.coordinates, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3.10
+
+import unittest
+from array import array
+from os import path
+import tracemalloc
+from tempfile import TemporaryDirectory
+from math import pi as π
+
+from points import (
+    Vector,
+    CartesianPoint,
+    IntPoint,
+    PolarPoint,
+    iter_linear_steps_between,
+    Path,
+    PointBuffer,
+)
+
+
+class TestPointBuffer(unittest.TestCase):
+    def cartesian_path(self):
+        return Path(
+            iter_linear_steps_between(CartesianPoint(0, 0), CartesianPoint(100, 150), 5)
+        )
+
+    def test_round_trip(self):
+        for a_path in (
+            self.cartesian_path(),
+            Path(PolarPoint(1, 0), PolarPoint(2, π / 2)),
+            Path(IntPoint(1, 2), IntPoint(3, 4)),
+            Path(Vector(1, 2, 3), Vector(4, 5, 6)),
+        ):
+            a_point_buffer = PointBuffer.from_path(a_path)
+            self.assertEqual(len(a_point_buffer), len(a_path))
+            self.assertEqual(a_point_buffer.dimensions, len(a_path[0]))
+            round_tripped = a_point_buffer.as_path()
+            self.assertTrue(isinstance(round_tripped, Path))
+            self.assertEqual(round_tripped, a_path)
+            for a_point, an_original in zip(round_tripped, a_path):
+                self.assertTrue(a_point.__class__ is an_original.__class__)
+
+    def test_construction(self):
+        an_array = array("d", (1, 2, 3, 4))
+        a_point_buffer = PointBuffer(an_array)
+        # no copy was made
+        an_array[0] = 10
+        self.assertEqual(a_point_buffer[0], CartesianPoint(10, 2))
+        self.assertEqual(a_point_buffer.typecode, "d")
+        self.assertEqual(
+            list(PointBuffer((1, 2, 3, 4, 5, 6), 3)), [(1, 2, 3), (4, 5, 6)]
+        )
+        self.assertEqual(len(PointBuffer()), 0)
+        self.assertEqual(PointBuffer.from_path(()).as_path(), Path())
+        self.assertRaises(ValueError, PointBuffer, (1, 2, 3))
+        self.assertRaises(TypeError, PointBuffer, (1, 2), 2, int)
+        self.assertRaises(
+            ValueError,
+            PointBuffer.from_path,
+            (CartesianPoint(1, 0), CartesianPoint(1, 2, 3)),
+        )
+
+    def test_indexing_and_slicing(self):
+        a_point_buffer = PointBuffer.from_path(self.cartesian_path())
+        self.assertEqual(a_point_buffer[1], CartesianPoint(20, 30))
+        self.assertEqual(a_point_buffer[-1], CartesianPoint(80, 120))
+        self.assertRaises(IndexError, lambda: a_point_buffer[5])
+        a_slice = a_point_buffer[1:3]
+        self.assertEqual(list(a_slice), [(20, 30), (40, 60)])
+        self.assertTrue(a_slice.flat.obj is a_point_buffer.flat.obj)
+        self.assertEqual(list(a_point_buffer[::2]), [(0, 0), (40, 60), (80, 120)])
+        self.assertEqual(list(a_point_buffer[::-2]), [(80, 120), (40, 60), (0, 0)])
+        self.assertEqual(len(a_point_buffer[4:1]), 0)
+
+    def test_conversion_and_drawing(self):
+        a_polar_buffer = PointBuffer.from_path(
+            Path(PolarPoint(1, 0), PolarPoint(2, π / 2))
+        )
+        a_cartesian_buffer = a_polar_buffer.as_cartesian()
+        self.assertTrue(a_cartesian_buffer.point_class is CartesianPoint)
+        for a, b in zip(a_cartesian_buffer.flat.tolist(), (1, 0, 0, 2)):
+            self.assertAlmostEqual(a, b)
+
+        xy = a_polar_buffer.xy_for_drawing()
+        self.assertEqual(xy.format, "f")
+        self.assertEqual(len(xy), 4)
+        # 2D float32 cartesian buffers are handed over without a copy
+        a_float_buffer = PointBuffer((1, 2, 3, 4), typecode="f")
+        self.assertTrue(a_float_buffer.xy_for_drawing() is a_float_buffer.flat)
+        self.assertEqual(
+            PointBuffer((1, 2, 3, 4, 5, 6), 3).xy_for_drawing().tolist(), [1, 2, 4, 5]
+        )
+
+    def test_files(self):
+        with TemporaryDirectory() as a_directory:
+            a_file_name = path.join(a_directory, "a_path.points")
+            for a_point_buffer in (
+                PointBuffer.from_path(self.cartesian_path()),
+                PointBuffer.from_path(self.cartesian_path(), IntPoint, "q"),
+                PointBuffer.from_path(
+                    Path(PolarPoint(1, 0, π), PolarPoint(2, π, 0)), typecode="f"
+                ),
+                PointBuffer(),
+            ):
+                a_point_buffer.write_file(a_file_name)
+                mapped = PointBuffer.from_file(a_file_name)
+                self.assertTrue(mapped.point_class is a_point_buffer.point_class)
+                self.assertEqual(
+                    (mapped.dimensions, mapped.typecode),
+                    (a_point_buffer.dimensions, a_point_buffer.typecode),
+                )
+                self.assertEqual(mapped.flat.tolist(), a_point_buffer.flat.tolist())
+                self.assertEqual(list(mapped), list(a_point_buffer))
+                # the coordinates are a read only view of the file
+                self.assertTrue(mapped.flat.readonly)
+                if len(mapped) > 1:
+                    self.assertEqual(list(mapped[1:2]), [a_point_buffer[1]])
+                del mapped
+
+            PointBuffer.from_path(self.cartesian_path()).write_file(a_file_name)
+            self.assertTrue(
+                PointBuffer.from_file(a_file_name, PolarPoint).point_class is PolarPoint
+            )
+            with open(a_file_name, "r+b") as a_file:
+                a_file.truncate(100)
+            self.assertRaises(ValueError, PointBuffer.from_file, a_file_name)
+            with open(a_file_name, "wb") as a_file:
+                a_file.write(b"(1, 2), (3, 4)")
+            self.assertRaises(ValueError, PointBuffer.from_file, a_file_name)
+
+    def test_iterating_in_blocks(self):
+        a_point_buffer = PointBuffer(array("d", range(2 * 10000)))
+        a_point_buffer.points_per_block = 7
+        self.assertEqual(
+            list(a_point_buffer), [(2 * i, 2 * i + 1) for i in range(10000)]
+        )
+        self.assertEqual(list(a_point_buffer[3:5]), [(6, 7), (8, 9)])
+
+        with TemporaryDirectory() as a_directory:
+            a_file_name = path.join(a_directory, "a_large_path.points")
+            PointBuffer(array("d", [1.0]) * 2_000_000).write_file(a_file_name)
+            mapped = PointBuffer.from_file(a_file_name)
+            # a million points, but taking the first only converts a block of them
+            tracemalloc.start()
+            try:
+                an_iterator = iter(mapped)
+                self.assertEqual(next(an_iterator), (1, 1))
+                _, peak_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertTrue(peak_bytes < 1_000_000, peak_bytes)
+            del an_iterator, mapped
+
+    def test_drawing_with_pil(self):
+        try:
+            from PIL import Image, ImageDraw
+        except ImportError:
+            self.skipTest("PIL is not installed")
+        an_image = Image.new("L", (20, 20))
+        ImageDraw.Draw(an_image).line(
+            PointBuffer.from_path(
+                Path(CartesianPoint(1, 1), CartesianPoint(18, 18))
+            ).xy_for_drawing(),
+            fill=255,
+        )
+        self.assertEqual(an_image.getbbox(), (1, 1, 19, 19))
+
+
+if __name__ == "__main__":
+    unittest.main()
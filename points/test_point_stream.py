@@ -0,0 +1,121 @@
+#!/usr/bin/env python3.10
+
+import unittest
+from math import pi as π
+from os import path
+from tempfile import TemporaryDirectory
+
+from points import (
+    CartesianPoint,
+    IntPoint,
+    PolarPoint,
+    iter_linear_steps_between,
+    iter_natural_steps_between,
+    PointBuffer,
+    PointStreamWriter,
+    PointStreamReader,
+)
+from points.point_stream import STREAM_CODECS
+
+
+class TestPointStream(unittest.TestCase):
+    def setUp(self):
+        self.a_directory = TemporaryDirectory()
+        self.a_file_name = path.join(self.a_directory.name, "a_stream.points")
+
+    def tearDown(self):
+        self.a_directory.cleanup()
+
+    def spiral_points(self):
+        return iter_natural_steps_between(
+            PolarPoint(0, 0), PolarPoint(300, 10 * π), 1050
+        )
+
+    def test_round_trip(self):
+        expected = list(self.spiral_points())
+        for a_codec in (None, *STREAM_CODECS):
+            with PointStreamWriter(
+                self.a_file_name, PolarPoint, chunk_size=100, codec=a_codec
+            ) as a_writer:
+                # the points come one at a time or from an iterator
+                a_writer.write(expected[0])
+                a_writer.write_many(expected[1:])
+            with PointStreamReader(self.a_file_name) as a_reader:
+                self.assertEqual(a_reader.codec, a_codec)
+                self.assertTrue(a_reader.point_class is PolarPoint)
+                self.assertEqual(len(a_reader), 1050)
+                self.assertEqual(a_reader.number_of_chunks, 11)
+                self.assertEqual(list(a_reader), expected)
+                chunks = list(a_reader.iter_chunks())
+                self.assertTrue(all(isinstance(c, PointBuffer) for c in chunks))
+                self.assertEqual([len(c) for c in chunks], [100] * 10 + [50])
+
+    def test_seeking(self):
+        with PointStreamWriter(self.a_file_name, chunk_size=64) as a_writer:
+            a_writer.write_many(
+                iter_linear_steps_between(
+                    CartesianPoint(0, 0), CartesianPoint(1000, 2000), 1000
+                )
+            )
+        with PointStreamReader(self.a_file_name, IntPoint) as a_reader:
+            self.assertEqual(a_reader[0], IntPoint(0, 0))
+            self.assertEqual(a_reader[777], IntPoint(777, 1554))
+            self.assertEqual(a_reader[-1], IntPoint(999, 1998))
+            self.assertRaises(IndexError, a_reader.__getitem__, 1000)
+            # slices across chunks
+            a_slice = a_reader[60:200]
+            self.assertEqual(len(a_slice), 140)
+            self.assertEqual(list(a_slice)[:2], [(60, 120), (61, 122)])
+            self.assertEqual(
+                list(a_reader.iter_points(990)),
+                [IntPoint(i, 2 * i) for i in range(990, 1000)],
+            )
+            self.assertEqual(list(a_reader.iter_points(5, 5)), [])
+
+    def test_unfinished_and_empty_streams(self):
+        a_writer = PointStreamWriter(self.a_file_name, chunk_size=10)
+        a_writer.write_many(CartesianPoint(i, i) for i in range(35))
+        # as if the writing process stopped before closing: the last chunk was never
+        # written and there is no index
+        a_writer.file.close()
+        with PointStreamReader(self.a_file_name) as a_reader:
+            self.assertEqual(len(a_reader), 30)
+            self.assertEqual(a_reader[29], (29, 29))
+
+        PointStreamWriter(self.a_file_name).close()
+        with PointStreamReader(self.a_file_name) as a_reader:
+            self.assertEqual((len(a_reader), list(a_reader)), (0, []))
+            self.assertEqual(len(a_reader[:]), 0)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, PointStreamWriter, self.a_file_name, codec="zip")
+        # a point that doesn't fit is refused, the stream goes on without it
+        with PointStreamWriter(self.a_file_name, chunk_size=2) as a_writer:
+            a_writer.write(CartesianPoint(1, 2))
+            self.assertRaises(ValueError, a_writer.write, CartesianPoint(1, 2, 3))
+            a_writer.write(CartesianPoint(3, 4))
+            self.assertRaises(
+                ValueError,
+                a_writer.write_many,
+                [CartesianPoint(5, 6), CartesianPoint(1, 2, 3), CartesianPoint(7, 8)],
+            )
+        with PointStreamReader(self.a_file_name) as a_reader:
+            self.assertEqual(list(a_reader), [(1, 2), (3, 4), (5, 6)])
+
+        # an error in the with block still leaves a readable stream of what was
+        # written, and a closed file
+        with self.assertRaises(ValueError):
+            with PointStreamWriter(self.a_file_name, chunk_size=2) as a_writer:
+                a_writer.write_many(CartesianPoint(i, i) for i in range(3))
+                a_writer.write(CartesianPoint(1, 2, 3))
+        self.assertTrue(a_writer.file.closed)
+        with PointStreamReader(self.a_file_name) as a_reader:
+            self.assertEqual(len(a_reader), 3)
+
+        with open(self.a_file_name, "wb") as a_file:
+            a_file.write(b"(1, 2), (3, 4)")
+        self.assertRaises(ValueError, PointStreamReader, self.a_file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
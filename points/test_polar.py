@@ -2,6 +2,7 @@
 
 import unittest
 from math import pi as π
+from random import Random
 from collections.abc import Iterable
 
 from points import CartesianPoint, PolarPoint
@@ -72,6 +73,57 @@ class TestPolar(unittest.TestCase):
         cp = CartesianPoint(pp_sum)
         self.assertAlmostEqual(cp, (4.0, 4.0), 8)
 
+    def assert_same_as_cartesian_round_trip(self, a_result, expected):
+        # the native polar result must describe the same point in the same form
+        self.assertTrue(a_result.__class__ is PolarPoint)
+        self.assertAlmostEqual(a_result.ρ, expected.ρ)
+        self.assertTrue(-π <= a_result.θ <= π)
+        self.assertAlmostEqual(a_result.as_cartesian(), expected.as_cartesian())
+
+    def test_native_scaling_and_negation(self):
+        a_random = Random(7)
+        for _ in range(500):
+            pp = PolarPoint(a_random.uniform(-100, 100), a_random.uniform(-50, 50))
+            k = a_random.choice((a_random.uniform(-10, 10), a_random.randint(-5, 5)))
+            self.assert_same_as_cartesian_round_trip(
+                pp * k, PolarPoint(pp.as_cartesian() * k)
+            )
+            self.assert_same_as_cartesian_round_trip(
+                -pp, PolarPoint(-pp.as_cartesian())
+            )
+            if k:
+                self.assert_same_as_cartesian_round_trip(
+                    pp / k, PolarPoint(pp.as_cartesian() / k)
+                )
+
+    def test_native_edge_cases(self):
+        self.assertEqual(PolarPoint(3, π / 2) * 0, (0, 0))
+        self.assertEqual(-PolarPoint(2, 0), (2, -π))
+        self.assertEqual(-PolarPoint(2, -0.0), (2, π))
+        self.assertEqual(PolarPoint(3, π) * 0, (0, π))
+        self.assertEqual(-PolarPoint(2, π), (2, 0))
+        self.assertRaises(ZeroDivisionError, lambda: PolarPoint(1, 1) / 0)
+        # non-scalar operands and 3D points still take the cartesian route
+        self.assertAlmostEqual(PolarPoint(2, π / 2) * (1, 3), (6, π / 2))
+        self.assertAlmostEqual(
+            (PolarPoint(2, 0, π / 2) * -1).as_cartesian(), (-2, 0, 0)
+        )
+
+    def test_rotate(self):
+        self.assertAlmostEqual(PolarPoint(2, π / 4).rotate(π / 4), (2, π / 2))
+        self.assertAlmostEqual(PolarPoint(2, 3 * π / 4).rotate(π / 2), (2, -3 * π / 4))
+        # landing on the negative x axis from below, as the cartesian route would
+        self.assertAlmostEqual(PolarPoint(2, 0).rotate(-π), (2, -π))
+        self.assertAlmostEqual(PolarPoint(2, 0).rotate(π), (2, π))
+        self.assertAlmostEqual(
+            PolarPoint(2, 0.5, 1.0).rotate(10 * π + 0.25), (2, 0.75, 1.0)
+        )
+        self.assertAlmostEqual(
+            PolarPoint(5, 0.3).rotate(1.2).as_cartesian(),
+            PolarPoint(5, 1.5).as_cartesian(),
+        )
+        self.assertRaises(TypeError, PolarPoint(1, 2, 3, 4).rotate, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
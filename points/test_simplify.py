@@ -0,0 +1,55 @@
+#!/usr/bin/env python3.10
+
+import unittest
+from math import sin
+
+from points.geometry import distance_to_segment
+from points.simplify import (
+    ramer_douglas_peucker_indices,
+    visvalingam_whyatt_indices,
+    simplified_indices,
+)
+
+
+class TestSimplify(unittest.TestCase):
+    def test_straight_runs_collapse(self):
+        rows = [(x, 2 * x) for x in range(100)] + [
+            (99 + x, 198 - x) for x in range(1, 50)
+        ]
+        self.assertEqual(ramer_douglas_peucker_indices(rows, 0.01), [0, 99, 148])
+        self.assertEqual(visvalingam_whyatt_indices(rows, 0.01), [0, 99, 148])
+        # 3D rows work the same way
+        rows = [(x, x, x) for x in range(10)]
+        self.assertEqual(ramer_douglas_peucker_indices(rows, 0.01), [0, 9])
+        self.assertEqual(visvalingam_whyatt_indices(rows, 0.01), [0, 9])
+
+    def test_tolerance_is_respected(self):
+        rows = [(x / 10, sin(x / 10)) for x in range(400)]
+        kept = ramer_douglas_peucker_indices(rows, 0.05)
+        self.assertTrue(len(kept) < len(rows) / 3)
+        # every dropped row is within the tolerance of the simplified path
+        for first, last in zip(kept, kept[1:]):
+            for a_row in rows[first + 1 : last]:
+                self.assertTrue(
+                    distance_to_segment(a_row, rows[first], rows[last]) <= 0.05
+                )
+
+        kept = visvalingam_whyatt_indices(rows, 0.01)
+        self.assertTrue(len(kept) < len(rows) / 3)
+        self.assertEqual((kept[0], kept[-1]), (0, len(rows) - 1))
+
+    def test_deep_paths_do_not_recurse(self):
+        # every split of this path keeps only its last vertex, the worst case for a
+        # recursive implementation
+        rows = [(i, (i % 2) * (i + 1)) for i in range(1500)]
+        self.assertEqual(len(ramer_douglas_peucker_indices(rows, 0.5)), 1500)
+        self.assertEqual(len(visvalingam_whyatt_indices(rows, 0.5)), 1500)
+
+    def test_short_and_unknown(self):
+        self.assertEqual(simplified_indices([], 1), [])
+        self.assertEqual(simplified_indices([(0, 0), (1, 1)], 1, "visvalingam"), [0, 1])
+        self.assertRaises(ValueError, simplified_indices, [(0, 0)], 1, "bogus")
+
+
+if __name__ == "__main__":
+    unittest.main()
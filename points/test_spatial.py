@@ -0,0 +1,195 @@
+#!/usr/bin/env python3.10
+
+import unittest
+from math import pi as π, inf, nan
+from random import Random
+
+from points import CartesianPoint, PolarPoint
+from points.block import Block
+from points.path import Path
+from points.spatial import BlockGrid, QuadTree, OcTree
+
+
+class TestBlockGrid(unittest.TestCase):
+    def random_blocks(self, a_random, number_of_blocks):
+        # mostly large blocks of every shape with some small ones mixed in
+        blocks = []
+        for i in range(number_of_blocks):
+            x, y = a_random.randint(-500, 500), a_random.randint(-500, 500)
+            if i % 10:
+                blocks.append(
+                    Block(
+                        x, y, a_random.randint(-500, 500), a_random.randint(-500, 500)
+                    )
+                )
+            else:
+                blocks.append(Block(x, y, x + 5, y + 3))
+        return blocks
+
+    def test_query_point_matches_scan(self):
+        a_random = Random(1)
+        blocks = self.random_blocks(a_random, 300)
+        for a_grid in (
+            BlockGrid(blocks),
+            BlockGrid(blocks, cell_size=7.5),
+            BlockGrid(blocks, cell_size=50, maximum_cells_per_block=4),
+        ):
+            self.assertEqual(len(a_grid), len(blocks))
+            points = [
+                CartesianPoint(a_random.uniform(-600, 600), a_random.uniform(-600, 600))
+                for _ in range(200)
+            ]
+            # the edges of blocks, where the half open semantics matter
+            points.extend(a_block.min_point for a_block in blocks[:50])
+            points.extend(a_block.max_point for a_block in blocks[:50])
+            points.extend(a_block.upper_right for a_block in blocks[:50])
+            for a_point in points:
+                self.assertEqual(
+                    a_grid.query_point(a_point),
+                    [a_block for a_block in blocks if a_block.surrounds(a_point)],
+                )
+            self.assertEqual(
+                a_grid.query_points(points),
+                [a_grid.query_point(a_point) for a_point in points],
+            )
+
+    def test_query_block_matches_scan(self):
+        a_random = Random(2)
+        blocks = self.random_blocks(a_random, 300)
+        queries = self.random_blocks(a_random, 50) + [
+            Block(-10000, -10000, 10000, 10000),
+            blocks[3],
+            Block(blocks[5].max_point, blocks[5].max_point + 10),
+        ]
+        for a_grid in (BlockGrid(blocks), BlockGrid(blocks, cell_size=300)):
+            for a_query in queries:
+                self.assertEqual(
+                    a_grid.query_block(a_query),
+                    [a_block for a_block in blocks if a_block.overlaps(a_query)],
+                )
+            self.assertEqual(
+                a_grid.query_blocks(queries),
+                [a_grid.query_block(a_query) for a_query in queries],
+            )
+
+    def test_half_open_and_polar(self):
+        a_grid = BlockGrid([Block(0, 0, 10, 10), Block(10, 0, 20, 10)])
+        self.assertEqual(
+            a_grid.query_point(CartesianPoint(10, 5)), [Block(10, 0, 20, 10)]
+        )
+        self.assertEqual(a_grid.query_point(CartesianPoint(20, 5)), [])
+        self.assertEqual(
+            a_grid.query_point(PolarPoint(5, π / 2)), [Block(0, 0, 10, 10)]
+        )
+        # sharing an edge is not overlapping
+        self.assertEqual(a_grid.query_block(Block(20, 0, 30, 10)), [])
+        self.assertFalse(Block(0, 0, 10, 10).overlaps(Block(10, 0, 20, 10)))
+        self.assertTrue(Block(0, 0, 10, 10).overlaps(Block(9, 9, 20, 10)))
+
+    def test_points_that_are_not_finite(self):
+        # no Block surrounds them, even a Block too large to list in cells
+        a_grid = BlockGrid(
+            [Block(0, 0, 10, 10), Block(-1e6, -1e6, 1e6, 1e6)], cell_size=10
+        )
+        for a_point in (
+            CartesianPoint(inf, 5),
+            CartesianPoint(5, -inf),
+            CartesianPoint(nan, 5),
+            CartesianPoint(5, nan),
+        ):
+            self.assertEqual(a_grid.query_point(a_point), [])
+        self.assertEqual(
+            a_grid.query_points([CartesianPoint(inf, 5), CartesianPoint(5, 5)]),
+            [[], list(a_grid.blocks)],
+        )
+
+    def test_disallowed(self):
+        self.assertRaises(ValueError, BlockGrid, [Block(0, 0, 1, 1)], 0)
+        self.assertEqual(BlockGrid([]).query_point(CartesianPoint(0, 0)), [])
+
+
+class TestTrees(unittest.TestCase):
+    def random_points(self, a_random, number_of_points, dimensions=2):
+        return [
+            CartesianPoint(*(a_random.uniform(-100, 100) for _ in range(dimensions)))
+            for _ in range(number_of_points)
+        ]
+
+    def nearest_by_scan(self, points, a_point, k):
+        return sorted(
+            points,
+            key=lambda p: sum((a - b) ** 2 for a, b in zip(p, a_point)),
+        )[:k]
+
+    def test_quadtree_queries_match_scan(self):
+        a_random = Random(3)
+        points = self.random_points(a_random, 2000)
+        for a_tree in (
+            QuadTree.from_points(points),
+            QuadTree(Block(-100, -100, 100, 100), points, bucket_size=1),
+        ):
+            self.assertEqual(len(a_tree), len(points))
+            self.assertEqual(sorted(a_tree), sorted(points))
+            for a_viewport in (
+                Block(-10, -10, 30, 20),
+                Block(0, 0, 100, 100),
+                Block(-500, -500, 500, 500),
+                Block(points[0], points[0] + 1),
+            ):
+                self.assertEqual(
+                    sorted(a_tree.query(a_viewport)),
+                    sorted(p for p in points if a_viewport.surrounds(p)),
+                )
+            for a_point in self.random_points(a_random, 20) + points[:5]:
+                self.assertEqual(
+                    a_tree.nearest(a_point, 5),
+                    self.nearest_by_scan(points, a_point, 5),
+                )
+        self.assertTrue(isinstance(a_tree.bounds, Block))
+
+    def test_insert_and_remove(self):
+        a_random = Random(4)
+        points = self.random_points(a_random, 500)
+        a_tree = QuadTree(Block(-100, -100, 100, 100), bucket_size=4)
+        for a_point in points:
+            a_tree.insert(a_point)
+        self.assertEqual(len(a_tree), len(points))
+        self.assertTrue(points[10] in a_tree)
+        for a_point in points[:450]:
+            a_tree.remove(a_point)
+        self.assertFalse(points[10] in a_tree)
+        self.assertEqual(sorted(a_tree), sorted(points[450:]))
+        self.assertEqual(
+            sorted(a_tree.query(Block(-100, -100, 100, 100))), sorted(points[450:])
+        )
+        self.assertRaises(ValueError, a_tree.remove, points[0])
+        self.assertRaises(ValueError, a_tree.insert, CartesianPoint(100, 0))
+        # polar points are located by their cartesian coordinates
+        a_tree.insert(PolarPoint(10, π / 2))
+        self.assertEqual(a_tree.query(Block(-1, 9, 1, 11)), [PolarPoint(10, π / 2)])
+
+    def test_octree(self):
+        a_random = Random(5)
+        points = self.random_points(a_random, 1000, 3)
+        a_tree = OcTree.from_points(points, bucket_size=4)
+        self.assertEqual(len(a_tree), len(points))
+        a_box = Path(CartesianPoint(-20, -50, 0), CartesianPoint(40, 10, 90))
+        self.assertEqual(
+            sorted(a_tree.query(a_box)),
+            sorted(
+                p
+                for p in points
+                if -20 <= p.x < 40 and -50 <= p.y < 10 and 0 <= p.z < 90
+            ),
+        )
+        a_point = CartesianPoint(1, 2, 3)
+        self.assertEqual(
+            a_tree.nearest(a_point, 3), self.nearest_by_scan(points, a_point, 3)
+        )
+        a_tree.remove(points[0])
+        self.assertEqual(len(a_tree), len(points) - 1)
+        self.assertRaises(ValueError, a_tree.insert, CartesianPoint(1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
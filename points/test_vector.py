@@ -2,7 +2,10 @@
 import unittest
 from numpy import array, ndarray
 
-from points import Vector
+from fractions import Fraction
+
+from points import Vector, CartesianPoint, IntPoint
+from points.vector import is_number
 
 
 class TestVector(unittest.TestCase):
@@ -85,6 +88,56 @@ class TestVector(unittest.TestCase):
         self.assertTrue(isinstance(nd2, ndarray))
         self.assertEqual(v11, Vector(nd2))
 
+    def test_trusted_construction(self):
+        v1 = Vector._from_trusted((1, 2, 3))
+        self.assertTrue(v1.__class__ is Vector)
+        self.assertEqual(v1, (1, 2, 3))
+
+        # classes that transform their members while judging are never trusted
+        ip = IntPoint._from_trusted((1.2, 3.7))
+        self.assertTrue(ip.__class__ is IntPoint)
+        self.assertEqual(ip, (1, 4))
+        ip_sum = IntPoint(1, 2) + 0.6
+        self.assertEqual(ip_sum, (2, 3))
+
+        # results of arithmetic have the same class and values as before
+        cp_sum = CartesianPoint(1, 2) + CartesianPoint(0.5, 0.5)
+        self.assertTrue(cp_sum.__class__ is CartesianPoint)
+        self.assertEqual(cp_sum, (1.5, 2.5))
+        self.assertRaises(TypeError, lambda: CartesianPoint(1, 2) + ("a", "b"))
+
+    def test_judging_subclasses_are_not_trusted(self):
+        class ClampedPoint(CartesianPoint):
+            @staticmethod
+            def _judge_candidate_value(a_potential_scalar):
+                return min(max(a_potential_scalar, 0), 100)
+
+        self.assertFalse(ClampedPoint._trusted_construction)
+        self.assertTrue(CartesianPoint._trusted_construction)
+        self.assertFalse(IntPoint._trusted_construction)
+        p = ClampedPoint(50, 50)
+        self.assertEqual(p + 200, (100, 100))
+        self.assertEqual(-p, (0, 0))
+        self.assertTrue((-p).__class__ is ClampedPoint)
+
+        # unless they say otherwise
+        class CheckedPoint(CartesianPoint):
+            _trusted_construction = True
+
+            @staticmethod
+            def _judge_candidate_value(a_potential_scalar):
+                return a_potential_scalar
+
+        self.assertTrue(CheckedPoint._trusted_construction)
+
+    def test_is_number(self):
+        self.assertTrue(is_number(1))
+        self.assertTrue(is_number(2.5))
+        self.assertTrue(is_number(Fraction(1, 3)))
+        self.assertTrue(is_number(array(range(2))[0]))
+        self.assertFalse(is_number("1"))
+        self.assertFalse(is_number((1,)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,79 @@
 from collections.abc import Iterable
-from itertools import zip_longest, starmap
-from numbers import Number
+from itertools import starmap
+from numbers import Number, Real
 from operator import sub, add, mul, truediv, floordiv, pow
 
+# Structural pattern matching against ABCs like Number and Iterable is comparatively
+# expensive. Since the answer only depends on the type of the value, the kind of each
+# operand type is worked out once and then found again by exact type.
+_operand_kind_by_type = {}
+
+
+def _operand_kind(the_other):
+    try:
+        return _operand_kind_by_type[the_other.__class__]
+    except KeyError:
+        pass
+    match the_other:
+        case Number():
+            a_kind = "number"
+        case Vector():
+            a_kind = "vector"
+        case Iterable():
+            a_kind = "iterable"
+        case _:
+            a_kind = None
+    _operand_kind_by_type[the_other.__class__] = a_kind
+    return a_kind
+
+
+_number_types = {int, float}
+
+
+def is_number(a_candidate):
+    # the exact type check catches nearly everything, the ABC check catches the rest
+    # (numpy scalars, Fractions, Decimals...) and remembers their type for next time.
+    if a_candidate.__class__ in _number_types:
+        return True
+    if isinstance(a_candidate, Number):
+        _number_types.add(a_candidate.__class__)
+        return True
+    return False
+
+
+_real_types = {int, float}
+
+
+def is_real(a_candidate):
+    # like is_number, but for real numbers only
+    if a_candidate.__class__ in _real_types:
+        return True
+    if isinstance(a_candidate, Real):
+        _real_types.add(a_candidate.__class__)
+        return True
+    return False
+
 
 class Vector(tuple):
+    # When True, values computed by the library itself from already judged members
+    # (the results of arithmetic and conversions) need not be judged again. Trust is
+    # opt in: a subclass with its own _judge_candidate_value is not trusted unless it
+    # says so, since its judging may transform values (like rounding or clamping).
+    # Classes whose constructor does more than judging must set this to False.
+    _trusted_construction = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if (
+            "_judge_candidate_value" in cls.__dict__
+            and "_trusted_construction" not in cls.__dict__
+        ):
+            cls._trusted_construction = False
+
     def __new__(cls, *args):
+        if len(args) == 1 and args[0].__class__ is cls:
+            # exact type identity case, skipping the structural match below
+            return args[0]
         match args:
             case [cls() as an_instance_of_cls]:
                 # match instances of the calling cls or its derivatives
@@ -29,9 +97,17 @@ class Vector(tuple):
                 # discrete values were passed, assume they are to be the coordinate
                 # values of a new instance of this cls
                 return super().__new__(
-                    cls, tuple(cls._judge_candidate_value(n) for n in args)
+                    cls, tuple(map(cls._judge_candidate_value, args))
                 )
 
+    @classmethod
+    def _from_trusted(cls, values):
+        # construct an instance from an iterable of values that the library itself
+        # produced, bypassing the structural match and the judging of members
+        if cls._trusted_construction:
+            return tuple.__new__(cls, values)
+        return cls(*values)
+
     @staticmethod
     def _judge_candidate_value(a_candidate):
         # Subclasses can override this method to restrict potential component members
@@ -55,25 +131,23 @@ class Vector(tuple):
     def _operation(self, the_other, a_dyadic_fn):
         # return a new instance with members that result from a_dyadic_fn applied to
         # this instance zipped with the_other
-        match the_other:
-            case Number() as a_number:
+        match _operand_kind(the_other):
+            case "number":
                 # match scalars
-                return self.__class__(
-                    *starmap(
-                        a_dyadic_fn, zip_longest(self, (a_number,), fillvalue=a_number)
-                    )
+                return self._from_trusted(
+                    [a_dyadic_fn(a_component, the_other) for a_component in self]
                 )
 
-            case Vector() as a_vector:
+            case "vector":
                 # match any instance of the Vector family
-                the_other_as_my_type = self.as_my_type(a_vector)
-                return self.__class__(
-                    *starmap(a_dyadic_fn, zip(self, the_other_as_my_type))
+                the_other_as_my_type = self.as_my_type(the_other)
+                return self._from_trusted(
+                    list(map(a_dyadic_fn, self, the_other_as_my_type))
                 )
 
-            case Iterable() as an_iterable:
-                # match any other type of iterable
-                return self.__class__(*starmap(a_dyadic_fn, zip(self, an_iterable)))
+            case "iterable":
+                # match any other type of iterable, its members have yet to be judged
+                return self.__class__(*starmap(a_dyadic_fn, zip(self, the_other)))
 
             case _:
                 # no idea how to apply this value in a dyadic manner with this Vector instance
@@ -98,7 +172,7 @@ class Vector(tuple):
         return self._operation(the_other, pow)
 
     def __neg__(self):
-        return self.__class__(*(-c for c in self))
+        return self._from_trusted([-c for c in self])
 
     def trunc(self):
         return self.__class__(*(int(c) for c in self))